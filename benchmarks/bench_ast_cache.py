@@ -0,0 +1,40 @@
+"""AST cache: time to parse vs. time to load the same AST from a warm cache entry.
+
+Usage: python benchmarks/bench_ast_cache.py [blocks]   (default: 2000)
+"""
+import sys
+import tempfile
+import time
+
+from synthetic import straight_line_program
+
+from ASTCache import ASTCache
+from pasSyn import parser
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    source = straight_line_program(blocks)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ASTCache(cache_dir)
+        ast, parse_time = timed(lambda: parser.parse(source))
+        _, store_time = timed(lambda: cache.put(source, 'parsed', ast))
+        loaded, load_time = timed(lambda: cache.get(source, 'parsed'))
+        assert loaded is not None, "cache miss after put"
+        size = sum(size for _, size, _ in cache.entries())
+
+    print(f"source:     {len(source) / 1024:9.1f} KiB")
+    print(f"parse:      {parse_time * 1000:9.1f} ms")
+    print(f"cache put:  {store_time * 1000:9.1f} ms  ({size / 1024:.1f} KiB on disk)")
+    print(f"cache hit:  {load_time * 1000:9.1f} ms  (x{parse_time / load_time:.1f} faster than parsing)")
+
+
+if __name__ == '__main__':
+    main()
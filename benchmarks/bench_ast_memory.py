@@ -0,0 +1,72 @@
+"""AST memory: bytes per node (tracemalloc) for slotted nodes vs. nodes with a __dict__.
+
+Usage: python benchmarks/bench_ast_memory.py [blocks]
+"""
+import contextlib
+import io
+import resource
+import sys
+import tracemalloc
+
+from synthetic import straight_line_program
+
+import ASTNode
+from pasSyn import parser
+
+# Mesmas classes e construtores, mas sem __slots__ (representação anterior)
+DICT_CLASSES = {
+    cls: type(cls.__name__, (), {'__init__': cls.__dict__.get('__init__', object.__init__)})
+    for cls in vars(ASTNode).values()
+    if isinstance(cls, type) and issubclass(cls, ASTNode.ASTNode) and cls is not ASTNode.ASTNode
+}
+
+
+def to_dict_nodes(node):
+    if isinstance(node, list):
+        return [to_dict_nodes(item) for item in node]
+    if not isinstance(node, ASTNode.ASTNode):
+        return node
+    copy = DICT_CLASSES[type(node)].__new__(DICT_CLASSES[type(node)])
+    for name in node._fields:
+        setattr(copy, name, to_dict_nodes(getattr(node, name)))
+    return copy
+
+
+def count_nodes(root):
+    count, stack = 0, [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, ASTNode.ASTNode):
+            count += 1
+            stack.extend(getattr(node, name) for name in node._fields)
+    return count
+
+
+def traced_size(build):
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    source = straight_line_program(blocks)
+
+    ast, slotted, parse_peak = traced_size(lambda: parser.parse(source))
+    nodes = count_nodes(ast)
+    _, with_dict, _ = traced_size(lambda: to_dict_nodes(ast))
+
+    print(f"AST nodes:               {nodes}")
+    print(f"slotted nodes:           {slotted / nodes:.1f} bytes/node ({slotted / 2**20:.1f} MiB)")
+    print(f"nodes with __dict__:     {with_dict / nodes:.1f} bytes/node ({with_dict / 2**20:.1f} MiB)")
+    print(f"tracemalloc peak, parse: {parse_peak / 2**20:.1f} MiB")
+    print(f"peak RSS:                {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
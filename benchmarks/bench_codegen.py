@@ -0,0 +1,64 @@
+"""Code generation throughput: buffered emitter vs. one open/append per instruction.
+
+Usage: python benchmarks/bench_codegen.py [blocks]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import straight_line_program
+
+from pasSyn import parser
+from ASTOptimizer import ASTOptimizer
+from code_generator import Generator
+from Instructions import Instructions
+
+
+class PerInstructionGenerator(Generator):
+    # Comportamento antigo: abre o ficheiro em modo append a cada instrução
+    def generate(self, ast):
+        with open(self.filename, 'w') as f:
+            f.write('')
+        self.visit(ast)
+
+    def emit(self, op, arg=None):
+        with open(self.filename, 'a') as f:
+            f.write(Instructions([(op, arg)]).serialize())
+
+
+def run(generator_class, ast, out_path):
+    generator = generator_class(out_path)
+    generator.filename = out_path
+    start = time.perf_counter()
+    generator.generate(ast)
+    return time.perf_counter() - start
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    source = straight_line_program(blocks)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = ASTOptimizer().optimize(parser.parse(source))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = os.path.join(tmp, 'bench.vm')
+        with contextlib.redirect_stdout(io.StringIO()):
+            unbuffered = run(PerInstructionGenerator, ast, out_path)
+            with open(out_path) as f:
+                expected = f.read()
+            buffered = run(Generator, ast, out_path)
+            with open(out_path) as f:
+                assert f.read() == expected, "buffered output differs"
+
+    print(f"source lines:        {source.count(chr(10))}")
+    print(f"instructions:        {expected.count(chr(10))}")
+    print(f"per-instruction I/O: {unbuffered * 1000:.1f} ms")
+    print(f"buffered:            {buffered * 1000:.1f} ms")
+    print(f"speedup:             {unbuffered / buffered:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Executed VM instructions per program at each -O level, run on the bundled EWVM interpreter.
+
+Each optimized program must print the same output as its -O0 build, or
+the expected output below for programs with recursive functions, which
+the generator only compiles once the recursion has been removed.
+
+Usage: python benchmarks/bench_dynamic.py [program...]   (default: every tests/*.pas with an input below)
+"""
+import contextlib
+import io
+import os
+import sys
+
+from synthetic import SRC_DIR
+
+from ewvm import run
+from PassManager import OPT_LEVELS, PassManager, optimize_code
+from code_generator import Generator
+from pasSyn import parser
+
+TESTS_DIR = os.path.join(SRC_DIR, '..', 'tests')
+
+# Entrada dada a cada programa de tests/ (uma linha por readln)
+INPUTS = {
+    'array': ['4', '8', '15', '16', '23'],
+    'binInt': ['1011001'],
+    'binInt_func': ['1011001'],
+    'classifica': [],
+    'cse_real': ['6', '4'],
+    'factorial': ['12'],
+    'folding': [],
+    'hello': [],
+    'licm_morto': ['10', '5', '3'],
+    'maiorde3': ['7', '42', '13'],
+    'primo': ['7919'],
+    'quadrados': [],
+    'reais': ['5'],
+    'repeat_break': [],
+    'soma_limite': ['100'],
+    'subexpressoes': ['5', '3'],
+    'test': [],
+}
+
+# Saída dos programas sem build a -O0 (coluna -O0 vazia)
+EXPECTED = {
+    'soma_limite': 'Soma: 1045\n',
+}
+
+
+def compile_level(path, level, vm_passes=True):
+    with open(path) as f:
+        source = f.read()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = PassManager.for_level(level).run(parser.parse(source))
+        generator = Generator(path)
+        generator.visit(ast)
+    # A partir de -O1 o main.py otimiza também o código gerado
+    if level > 0 and vm_passes:
+        return optimize_code(generator.code).serialize()
+    return generator.text()
+
+
+def main():
+    names = sys.argv[1:] or sorted(INPUTS)
+    levels = sorted(OPT_LEVELS)
+    print(f"{'program':<16}" + ''.join(f"{'-O' + str(level):>10}" for level in levels) + "   -O1 vs -O0")
+    for name in names:
+        path = os.path.join(TESTS_DIR, f"{name}.pas")
+        counts = []
+        outputs = {}
+        for level in levels:
+            if level == 0 and name in EXPECTED:
+                outputs[level], steps = EXPECTED[name], '-'
+            else:
+                outputs[level], steps = run(compile_level(path, level), INPUTS.get(name, []))
+            counts.append(steps)
+        for level in levels[1:]:
+            if outputs[level] != outputs[0]:
+                raise SystemExit(f"{name}: -O{level} output differs from -O0:\n"
+                                 f"{outputs[level]!r}\n{outputs[0]!r}")
+        saved = f"{1 - counts[1] / counts[0]:>8.1%}" if isinstance(counts[0], int) and counts[0] else f"{'-':>8}"
+        print(f"{name:<16}" + ''.join(f"{count:>10}" for count in counts) + f"   {saved}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Lexer throughput (tokens/second): keyword table in t_ID vs. one regex rule per keyword.
+
+Usage: python benchmarks/bench_lexer.py [blocks]
+
+The legacy lexer is rebuilt here from the original rule list: one case-insensitive
+character-class rule per keyword, tried in declaration order before t_ID.
+"""
+import sys
+import time
+import types
+
+from synthetic import straight_line_program
+
+from ply import lex
+import pasAnalex
+
+LEGACY_KEYWORDS = [
+    'PROGRAM', 'VAR', 'BEGIN', 'END', 'IF', 'THEN', 'ELSE', 'FOR', 'WHILE', 'REPEAT',
+    'TO', 'DOWNTO', 'DO', 'UNTIL', 'AND', 'OR', 'NOT', 'OF', 'CASE', 'DIV', 'MOD',
+    'FUNCTION', 'PROCEDURE', 'WRITELN', 'WRITE', 'READLN', 'READ', 'BREAK', 'CONTINUE',
+    'REAL', 'INTEGER', 'BOOLEAN', 'STRING', 'ARRAY', 'LENGTH',
+]
+
+
+def _rule(pattern, action, lineno):
+    def rule(t):
+        return action(t)
+    rule.__doc__ = pattern
+    # O PLY ordena as regras-função pela linha de definição
+    rule.__code__ = rule.__code__.replace(co_firstlineno=lineno)
+    return rule
+
+
+def _keep(t):
+    return t
+
+
+def _bool(t):
+    t.value = (t.value.lower() == 'true')
+    return t
+
+
+def legacy_lexer():
+    module = types.ModuleType('legacy_pasAnalex')
+    module.__file__ = __file__
+    module.tokens = pasAnalex.tokens
+    for name in dir(pasAnalex):
+        value = getattr(pasAnalex, name)
+        if name.startswith('t_') and isinstance(value, str):
+            setattr(module, name, value)
+    module.t_error = pasAnalex.t_error
+
+    rules = [(kw, ''.join(f'[{c.lower()}{c.upper()}]' for c in kw), _keep) for kw in LEGACY_KEYWORDS]
+    rules.append(('BOOL', '[tT][rR][uU][eE]|[fF][aA][lL][sS][eE]', _bool))
+    rules.append(('ID', r'[a-zA-Z_][a-zA-Z0-9_]*', _keep))
+    for name in ('NUMBER', 'PHRASE', 'COMMENT', 'NEWLINE'):
+        action = getattr(pasAnalex, f't_{name}')
+        rules.append((name, action.__doc__, action))
+    for lineno, (name, pattern, action) in enumerate(rules, 1):
+        setattr(module, f't_{name}', _rule(pattern, action, lineno))
+    return lex.lex(module=module)
+
+
+def tokenize(lexer, source):
+    lexer.input(source)
+    lexer.lineno = 1
+    count = 0
+    start = time.perf_counter()
+    while lexer.token():
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    source = straight_line_program(blocks)
+
+    legacy_count, legacy_time = tokenize(legacy_lexer(), source)
+    count, elapsed = tokenize(pasAnalex.build_lexer(), source)
+    assert count == legacy_count, "token streams differ"
+
+    print(f"source: {len(source) / 1024:.0f} KiB, {count} tokens")
+    print(f"one rule per keyword: {legacy_count / legacy_time:,.0f} tokens/s")
+    print(f"keyword table:        {count / elapsed:,.0f} tokens/s")
+    print(f"speedup:              {legacy_time / elapsed:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Parse time scaling: list-building grammar actions must stay linear in list length.
+
+Usage: python benchmarks/bench_parser.py [sizes...]   (default: 1000 10000 100000)
+"""
+import sys
+import time
+
+from synthetic import procedures_program, statement_block_program
+
+from pasSyn import parser
+
+
+def parse_time(source):
+    start = time.perf_counter()
+    ast = parser.parse(source)
+    elapsed = time.perf_counter() - start
+    assert ast is not None, "parse failed"
+    return elapsed
+
+
+def report(title, build, sizes):
+    print(title)
+    previous = None
+    for size in sizes:
+        elapsed = parse_time(build(size))
+        per_item = elapsed / size * 1e6
+        growth = f"  x{elapsed / previous[1]:.1f} time for x{size / previous[0]:.0f} size" if previous else ""
+        print(f"  {size:>7}: {elapsed * 1000:9.1f} ms  {per_item:6.1f} us/item{growth}")
+        previous = (size, elapsed)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    report("statements in one begin/end block", statement_block_program, sizes)
+    report("procedure declarations", procedures_program, [max(1, size // 10) for size in sizes])
+
+
+if __name__ == '__main__':
+    main()
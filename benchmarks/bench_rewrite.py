@@ -0,0 +1,204 @@
+"""Expression rewriting: rule table (RewriteRules) vs. the previous if/elif chain in optimize_BinaryOp.
+
+First the rewrites per second of each alone on single nodes of a few
+shapes (for a shape only the table rewrites, the chain's number is the
+cost of finding nothing to do), then the whole fold pass on two large
+expressions: `a + a + ... + a`, where no rule applies (both must produce
+the same tree), and a sum of terms that each simplify (`a * 1`, `b - b`,
+`(a + 1) + 2`...), which also exercises the rules the chain did not have.
+
+Usage: python benchmarks/bench_rewrite.py [terms...]   (default: 10000 100000)
+"""
+import contextlib
+import gc
+import io
+import sys
+import time
+
+from synthetic import long_expression_program
+
+from ASTNode import *
+from ASTOptimizer import ASTOptimizer
+from CompileStats import count_nodes
+from RewriteRules import BINARY, COMPARISONS, nodes_equal
+from pasSyn import parser
+
+SIMPLIFIABLE_TERMS = ["a * 1", "(b + 1) + 2", "b - b", "0 + a", "(a * 2) * 3", "(b - 4) + 1", "a div 2"]
+
+
+def simplifiable_expression_program(terms):
+    expression = " + ".join(SIMPLIFIABLE_TERMS[n % len(SIMPLIFIABLE_TERMS)] for n in range(terms))
+    return f"program Rw;\nvar\n    a, b, x: integer;\nbegin\n    readln(a);\n    readln(b);\n    x := {expression};\n    writeln(x)\nend.\n"
+
+
+def _is_number(node, value):
+    return isinstance(node, Literal) and node.type_name == 'NUMBER' and node.value == value
+
+
+def _is_bool(node, value):
+    return isinstance(node, Literal) and node.type_name == 'BOOLEAN' and node.value == value
+
+
+def chain_rewrite(node):
+    # Versão anterior de optimize_BinaryOp: testes isinstance/type_name/operator em cadeia para cada nó
+    op = node.operator
+
+    if isinstance(node.left, Literal) and isinstance(node.right, Literal):
+        if node.left.type_name == node.right.type_name:
+            left_val = node.left.value
+            right_val = node.right.value
+
+            if op in COMPARISONS and (op in (Operator.EQ, Operator.NE) or node.left.type_name != 'BOOLEAN'):
+                return Literal(COMPARISONS[op](left_val, right_val), 'BOOLEAN')
+
+            if node.left.type_name == 'NUMBER':
+                if op == Operator.PLUS:
+                    return Literal(left_val + right_val, 'NUMBER')
+                elif op == Operator.MINUS:
+                    return Literal(left_val - right_val, 'NUMBER')
+                elif op == Operator.TIMES:
+                    return Literal(left_val * right_val, 'NUMBER')
+                elif op == Operator.DIVIDE:
+                    if right_val == 0:
+                        return node
+                    return Literal(left_val / right_val, 'NUMBER')
+                elif op in (Operator.DIV, Operator.MOD) and isinstance(left_val, int) and isinstance(right_val, int):
+                    if right_val == 0:
+                        return node
+                    quotient = abs(left_val) // abs(right_val)
+                    if (left_val < 0) != (right_val < 0):
+                        quotient = -quotient
+                    if op == Operator.DIV:
+                        return Literal(quotient, 'NUMBER')
+                    return Literal(left_val - right_val * quotient, 'NUMBER')
+
+            elif node.left.type_name == 'BOOLEAN':
+                if op == Operator.AND:
+                    return Literal(left_val and right_val, 'BOOLEAN')
+                elif op == Operator.OR:
+                    return Literal(left_val or right_val, 'BOOLEAN')
+
+            elif node.left.type_name == 'PHRASE' and op == Operator.PLUS:
+                return Literal(left_val + right_val, 'PHRASE')
+
+    if op == Operator.PLUS:
+        if _is_number(node.right, 0):
+            return node.left
+        elif _is_number(node.left, 0):
+            return node.right
+    elif op == Operator.MINUS:
+        if _is_number(node.right, 0):
+            return node.left
+        elif nodes_equal(node.left, node.right):
+            return Literal(0, 'NUMBER')
+    elif op == Operator.TIMES:
+        if _is_number(node.right, 1):
+            return node.left
+        elif _is_number(node.left, 1):
+            return node.right
+        elif _is_number(node.right, 0) or _is_number(node.left, 0):
+            return Literal(0, 'NUMBER')
+    elif op == Operator.DIVIDE:
+        if _is_number(node.right, 1):
+            return node.left
+        elif _is_number(node.left, 0) and not _is_number(node.right, 0):
+            return Literal(0, 'NUMBER')
+    elif op == Operator.AND:
+        if _is_bool(node.right, False) or _is_bool(node.left, False):
+            return Literal(False, 'BOOLEAN')
+        elif _is_bool(node.right, True):
+            return node.left
+        elif _is_bool(node.left, True):
+            return node.right
+    elif op == Operator.OR:
+        if _is_bool(node.right, True) or _is_bool(node.left, True):
+            return Literal(True, 'BOOLEAN')
+        elif _is_bool(node.right, False):
+            return node.left
+        elif _is_bool(node.left, False):
+            return node.right
+
+    return node
+
+
+class ChainOptimizer(ASTOptimizer):
+    def optimize_BinaryOp(self, node):
+        node.left = yield node.left
+        node.right = yield node.right
+        return chain_rewrite(node)
+
+
+# Formas de nó para o débito por nó: (descrição, construtor de um nó novo)
+SHAPES = [
+    ("a + b (no rule)", lambda: BinaryOp(Identifier('a'), Operator.PLUS, Identifier('b'))),
+    ("a < b (no rule)", lambda: BinaryOp(Identifier('a'), Operator.LT, Identifier('b'))),
+    ("2 + 3", lambda: BinaryOp(Literal(2, 'NUMBER'), Operator.PLUS, Literal(3, 'NUMBER'))),
+    ("a * 1", lambda: BinaryOp(Identifier('a'), Operator.TIMES, Literal(1, 'NUMBER'))),
+    ("a - a", lambda: BinaryOp(Identifier('a'), Operator.MINUS, Identifier('a'))),
+    ("p and true", lambda: BinaryOp(Identifier('p'), Operator.AND, Literal(True, 'BOOLEAN'))),
+    ("(a + 1) + 2 (*)", lambda: BinaryOp(BinaryOp(Identifier('a'), Operator.PLUS, Literal(1, 'NUMBER')),
+                                     Operator.PLUS, Literal(2, 'NUMBER'))),
+]
+
+
+def best_of(runs, function):
+    # Melhor de `runs` tempos, sem o coletor de lixo a interferir
+    times = []
+    gc.disable()
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = function()
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return result, min(times)
+
+
+def rewrite_rate(rewrite, make, count):
+    nodes = [make() for _ in range(count)]
+    _, elapsed = best_of(3, lambda: [rewrite(node) for node in nodes])
+    return count / elapsed
+
+
+def expression_of(ast):
+    statements = ast.block.statement_part.statement_sequence.statements
+    return next(stmt.value for stmt in statements if isinstance(stmt, Assignment))
+
+
+def optimize_source(cls, source):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = parser.parse(source)
+    nodes = count_nodes(expression_of(ast))
+    start = time.perf_counter()
+    ast = cls().optimize(ast)
+    return ast, nodes, time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+
+    print(f"{'node':<20}{'chain rewrites/s':>18}{'table rewrites/s':>18}")
+    for label, make in SHAPES:
+        chain = rewrite_rate(chain_rewrite, make, 100_000)
+        table = rewrite_rate(BINARY.rewrite, make, 100_000)
+        print(f"{label:<20}{chain:>18,.0f}{table:>18,.0f}")
+    print("(*) the chain has no reassociation rule: it returns the node unchanged, the table builds a + 3")
+
+    print(f"\n{'expression':<28}{'optimizer':<18}{'nodes in':>10}{'nodes out':>11}{'ms':>10}{'nodes/s':>14}")
+    for terms in sizes:
+        for label, source in ((f"a + ... + a ({terms})", long_expression_program(terms)),
+                              (f"simplifiable ({terms})", simplifiable_expression_program(terms))):
+            results = {}
+            for cls in (ChainOptimizer, ASTOptimizer):
+                gc.collect()
+                ast, nodes, elapsed = min((optimize_source(cls, source) for _ in range(3)), key=lambda run: run[2])
+                results[cls] = expression_of(ast)
+                print(f"{label:<28}{cls.__name__:<18}{nodes:>10}{count_nodes(results[cls]):>11}"
+                      f"{elapsed * 1000:>10.1f}{nodes / elapsed:>14,.0f}")
+            if label.startswith('a +') and not nodes_equal(results[ChainOptimizer], results[ASTOptimizer]):
+                raise SystemExit(f"{label}: the rule table and the chain disagree")
+
+
+if __name__ == '__main__':
+    main()
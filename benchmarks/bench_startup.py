@@ -0,0 +1,73 @@
+"""Startup time of the front end (import of pasSyn until lexer and parser are ready).
+
+Usage: python benchmarks/bench_startup.py [--runs N] [--budget MS]
+
+Every run is a fresh interpreter, as in CI where main.py is invoked once per file.
+With --budget the script exits with status 1 if the median ready time exceeds it.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from synthetic import SRC_DIR
+
+READY = """
+import time
+start = time.perf_counter()
+import pasSyn
+print((time.perf_counter() - start) * 1000)
+"""
+
+REGENERATE = """
+import time
+import pasSyn
+from ply import lex, yacc
+start = time.perf_counter()
+lex.lex(module=pasSyn.sys.modules['pasAnalex'])
+yacc.yacc(module=pasSyn, tabmodule='_no_tables', debug=False, write_tables=False,
+          errorlog=yacc.NullLogger())
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def measure(snippet, runs):
+    # Bytecode em cache, como numa instalação normal; a primeira execução só aquece a cache
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    subprocess.run([sys.executable, '-c', snippet], cwd=SRC_DIR, env=env, check=True,
+                   capture_output=True)
+    ready, wall = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, '-c', snippet], cwd=SRC_DIR, env=env,
+                             capture_output=True, text=True, check=True).stdout
+        wall.append((time.perf_counter() - start) * 1000)
+        ready.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(ready), statistics.median(wall)
+
+
+def main():
+    args = argparse.ArgumentParser()
+    args.add_argument('--runs', type=int, default=20)
+    args.add_argument('--budget', type=float, default=None)
+    opts = args.parse_args()
+
+    before = set(os.listdir(SRC_DIR))
+    ready, wall = measure(READY, opts.runs)
+    regenerate, _ = measure(REGENERATE, max(1, opts.runs // 4))
+    written = set(os.listdir(SRC_DIR)) - before - {'__pycache__'}
+
+    print(f"import-to-ready (prebuilt tables): {ready:.1f} ms")
+    print(f"process wall time:                 {wall:.1f} ms")
+    print(f"table regeneration (reference):    {regenerate:.1f} ms")
+    print(f"files written at runtime:          {sorted(written) or 'none'}")
+    if opts.budget is not None and ready > opts.budget:
+        print(f"over budget ({opts.budget:.1f} ms)")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
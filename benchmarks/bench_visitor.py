@@ -0,0 +1,69 @@
+"""Visitor dispatch: cached per-class table vs. getattr(self, f'visit_{name}') per node.
+
+Usage: python benchmarks/bench_visitor.py [blocks]
+"""
+import contextlib
+import inspect
+import io
+import sys
+import time
+
+from synthetic import straight_line_program
+
+from ASTNode import ASTNode
+from ASTVisitor import ASTVisitor
+from pasSyn import parser
+from pasSem import ASTSemanticAnalyzer
+
+
+class NodeCounter(ASTVisitor):
+    def __init__(self):
+        self.count = 0
+
+    def generic_visit(self, node):
+        if isinstance(node, list):
+            for item in node:
+                self.visit(item)
+        elif isinstance(node, ASTNode):
+            self.count += 1
+            for name in node._fields:
+                self.visit(getattr(node, name))
+
+
+def lookup_per_visit(cls):
+    # Despacho anterior: nome do método construído e procurado em cada visita (sem cache)
+    @classmethod
+    def _resolve(visitor_class, node_class):
+        method_name = f'{visitor_class.method_prefix}{node_class.__name__}'
+        handler = getattr(visitor_class, method_name, None) or getattr(visitor_class, visitor_class.generic_method)
+        return handler, bool(handler.__code__.co_flags & inspect.CO_GENERATOR)
+
+    subclass = type(f'{cls.__name__}LookupPerVisit', (cls,), {'_resolve': _resolve})
+    subclass._dispatch = {}
+    return subclass
+
+
+def timed(run):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run()
+    return result, time.perf_counter() - start
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = parser.parse(straight_line_program(blocks))
+
+    for cls in (lookup_per_visit(NodeCounter), NodeCounter):
+        counter = cls()
+        _, elapsed = timed(lambda: counter.visit(ast))
+        print(f"{cls.__name__:<44} {counter.count / elapsed:>10,.0f} visits/s")
+
+    for cls in (lookup_per_visit(ASTSemanticAnalyzer), ASTSemanticAnalyzer):
+        _, elapsed = timed(lambda: cls().analyze(ast))
+        print(f"{cls.__name__ + '.analyze':<44} {elapsed * 1000:>10.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
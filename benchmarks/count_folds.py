@@ -0,0 +1,31 @@
+"""Count the rewrites ASTOptimizer performs (a node replaced by a folded value or removed).
+
+Usage: python benchmarks/count_folds.py [files...]   (default: tests/*.pas)
+"""
+import glob
+import os
+import sys
+from collections import Counter
+
+from synthetic import SRC_DIR
+
+from ASTOptimizer import ASTOptimizer
+from pasSyn import parser
+
+
+def main():
+    files = sys.argv[1:] or sorted(glob.glob(os.path.join(SRC_DIR, '..', 'tests', '*.pas')))
+    total = Counter()
+    for path in files:
+        with open(path) as f:
+            ast = parser.parse(f.read())
+        optimizer = ASTOptimizer()
+        optimizer.optimize(ast)
+        total += optimizer.rewrites
+        detail = ', '.join(f"{name}={count}" for name, count in sorted(optimizer.rewrites.items()))
+        print(f"{os.path.basename(path):<24}{sum(optimizer.rewrites.values()):>4}  {detail}")
+    print(f"{'total':<24}{sum(total.values()):>4}")
+
+
+if __name__ == '__main__':
+    main()
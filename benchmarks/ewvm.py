@@ -0,0 +1,189 @@
+"""Minimal EWVM interpreter for the instructions code_generator emits.
+
+Globals are the cells at the bottom of the stack (gp = 0) and the locals of
+a call start at its fp; storing past the top of the stack grows it, which
+is what the generator relies on when it gives each variable the next free
+cell. Used to count executed instructions and to compare program output
+across -O levels.
+
+Usage: python benchmarks/ewvm.py program.vm [input lines...]
+"""
+import sys
+
+
+class VMError(Exception):
+    pass
+
+
+def parse(text):
+    code = []
+    labels = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.endswith(':') and ' ' not in line:
+            labels[line[:-1]] = len(code)
+            continue
+        op, _, arg = line.partition(' ')
+        code.append((op.lower(), arg.strip()))
+    return code, labels
+
+
+def _number(text):
+    return float(text) if '.' in text else int(text)
+
+
+def _string(text):
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        text = text[1:-1]
+    return text.replace('\\"', '"').replace('\\n', '\n')
+
+
+def _trunc_div(a, b):
+    quotient = abs(a) // abs(b)
+    return -quotient if (a < 0) != (b < 0) else quotient
+
+
+def run(text, inputs=(), max_steps=10_000_000, depth=None, profile=None):
+    """Run EWVM code; return (output, executed instruction count).
+
+    If `depth` is a dict, the maximum stack height ('stack') and number of
+    nested calls ('calls') reached are stored in it. If `profile` is a dict,
+    it counts how many times each opcode was executed.
+    """
+    code, labels = parse(text)
+    inputs = list(inputs)
+    stack = []
+    fp = 0
+    calls = []
+    output = []
+    pc = 0
+    steps = 0
+    max_stack = 0
+    max_calls = 0
+
+    def store(address, value):
+        if address >= len(stack):
+            stack.extend([None] * (address - len(stack) + 1))
+        stack[address] = value
+
+    def target(label):
+        if label not in labels:
+            raise VMError(f"unknown label {label}")
+        return labels[label]
+
+    while pc < len(code):
+        steps += 1
+        if steps > max_steps:
+            raise VMError("step limit exceeded")
+        op, arg = code[pc]
+        pc += 1
+        if profile is not None:
+            profile[op] = profile.get(op, 0) + 1
+        try:
+            if op == 'pushi' or op == 'pushf':
+                stack.append(_number(arg))
+            elif op == 'pushs':
+                stack.append(_string(arg))
+            elif op == 'pushg':
+                stack.append(stack[int(arg)])
+            elif op == 'storeg':
+                store(int(arg), stack.pop())
+            elif op == 'pushl':
+                stack.append(stack[fp + int(arg)])
+            elif op == 'storel':
+                store(fp + int(arg), stack.pop())
+            elif op in ('add', 'sub', 'mul', 'div', 'mod', 'equal', 'inf', 'infeq', 'sup', 'supeq', 'and', 'or'):
+                b = stack.pop()
+                a = stack.pop()
+                if op == 'add':
+                    stack.append(a + b)
+                elif op == 'sub':
+                    stack.append(a - b)
+                elif op == 'mul':
+                    stack.append(a * b)
+                elif op == 'div':
+                    stack.append(_trunc_div(a, b))
+                elif op == 'mod':
+                    stack.append(a - b * _trunc_div(a, b))
+                elif op == 'equal':
+                    stack.append(int(a == b))
+                elif op == 'inf':
+                    stack.append(int(a < b))
+                elif op == 'infeq':
+                    stack.append(int(a <= b))
+                elif op == 'sup':
+                    stack.append(int(a > b))
+                elif op == 'supeq':
+                    stack.append(int(a >= b))
+                elif op == 'and':
+                    stack.append(int(bool(a) and bool(b)))
+                else:
+                    stack.append(int(bool(a) or bool(b)))
+            elif op == 'not':
+                stack.append(int(not stack.pop()))
+            elif op == 'jz':
+                if stack.pop() == 0:
+                    pc = target(arg)
+            elif op == 'jump':
+                pc = target(arg)
+            elif op in ('writes', 'writei', 'writef'):
+                output.append(str(stack.pop()))
+            elif op == 'writeln':
+                output.append('\n')
+            elif op == 'read':
+                if not inputs:
+                    raise VMError("no more input")
+                stack.append(str(inputs.pop(0)))
+            elif op == 'atoi':
+                stack.append(int(stack.pop()))
+            elif op == 'strlen':
+                stack.append(len(stack.pop()))
+            elif op == 'charat':
+                index = stack.pop()
+                stack.append(ord(stack.pop()[index]))
+            elif op == 'pusha':
+                stack.append(target(arg))
+            elif op == 'call':
+                address = stack.pop()
+                calls.append((pc, fp))
+                pc, fp = address, len(stack)
+                max_calls = max(max_calls, len(calls))
+            elif op == 'return':
+                pc, fp = calls.pop()
+            elif op == 'pushn':
+                stack.extend([0] * int(arg))
+            elif op == 'dup':
+                stack.extend(stack[len(stack) - int(arg):])
+            elif op == 'pop':
+                del stack[len(stack) - int(arg):]
+            elif op in ('start', 'nop'):
+                pass
+            elif op == 'stop':
+                break
+            else:
+                raise VMError(f"unsupported instruction {op}")
+        except (IndexError, KeyError, TypeError, ValueError) as error:
+            raise VMError(f"{op} {arg} at instruction {pc - 1}: {error!r}") from error
+        if len(stack) > max_stack:
+            max_stack = len(stack)
+    if depth is not None:
+        depth['stack'] = max_stack
+        depth['calls'] = max_calls
+    return ''.join(output), steps
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python benchmarks/ewvm.py program.vm [input lines...]")
+        return 1
+    with open(sys.argv[1]) as f:
+        output, steps = run(f.read(), sys.argv[2:])
+    sys.stdout.write(output)
+    print(f"\n[{steps} instructions executed]")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""VM cells reserved per program and subprogram at -O1, before and after slot allocation.
+
+"cells" is what the generator reserves from the declarations (one per
+variable and temporary), "slots" what the slot allocator leaves in the pushn,
+and "max live" the most cells live at the same point, below which no
+allocation can go.
+
+Usage: python benchmarks/frame_sizes.py [files...]   (default: tests/*.pas)
+"""
+import contextlib
+import glob
+import io
+import os
+import sys
+
+from synthetic import SRC_DIR
+
+from PassManager import PassManager, optimize_code
+from SlotAllocation import SlotAllocator
+from code_generator import Generator
+from pasSyn import parser
+
+
+def frames(source, filename):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = PassManager.for_level(1).run(parser.parse(source))
+        generator = Generator(filename)
+        generator.visit(ast)
+    allocator = SlotAllocator()
+    allocator.optimize(optimize_code(generator.code, ('cfg',)))
+    return allocator.frames
+
+
+def main():
+    files = sys.argv[1:] or sorted(glob.glob(os.path.join(SRC_DIR, '..', 'tests', '*.pas')))
+    total_cells = total_slots = 0
+    print(f"{'program':<20}{'frame':<14}{'cells':>7}{'slots':>7}{'max live':>10}")
+    for path in files:
+        with open(path) as f:
+            source = f.read()
+        name = os.path.basename(path)
+        try:
+            found = frames(source, path)
+        except Exception as error:  # o gerador não trata todos os programas
+            print(f"{name:<20}code generation failed: {error!r}")
+            continue
+        for frame in found:
+            total_cells += frame.cells
+            total_slots += frame.slots
+            print(f"{name:<20}{frame.name:<14}{frame.cells:>7}{frame.slots:>7}{frame.max_live:>10}")
+    print(f"{'total':<20}{'':<14}{total_cells:>7}{total_slots:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Which calls the inliner expands at -O1, and the instruction delta it causes.
+
+For every program with subprograms, compares -O1 with -O1 without the
+inline pass: emitted instructions and, for the tests/ programs that
+bench_dynamic.py has an input for, executed instructions.
+
+Usage: python benchmarks/inline_report.py [--threshold NODES] [files...]   (default: tests/*.pas)
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+
+from synthetic import SRC_DIR
+
+from bench_dynamic import INPUTS
+from ewvm import run
+from Inliner import DEFAULT_THRESHOLD
+from PassManager import OPT_LEVELS, PassManager
+from code_generator import Generator
+from pasSyn import parser
+
+
+def compile_with(source, filename, pass_manager):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ast = pass_manager.run(parser.parse(source))
+        generator = Generator(filename)
+        generator.visit(ast)
+    return generator
+
+
+def main():
+    args = argparse.ArgumentParser(description="Report the calls inlined at -O1 and the instruction delta.")
+    args.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD)
+    args.add_argument('files', nargs='*')
+    opts = args.parse_args()
+    files = opts.files or sorted(glob.glob(os.path.join(SRC_DIR, '..', 'tests', '*.pas')))
+    o1_passes, o1_iterations = OPT_LEVELS[1]
+    options = {'inline': {'threshold': opts.threshold}}
+
+    for path in files:
+        with open(path) as f:
+            source = f.read()
+        if not parser.parse(source).block.proc_func_part:
+            continue
+        name = os.path.splitext(os.path.basename(path))[0]
+        inlined = PassManager(o1_passes, o1_iterations, options)
+        print(f"{name}:")
+        try:
+            with_inline = compile_with(source, path, inlined)
+            without_inline = compile_with(source, path, PassManager([p for p in o1_passes if p != 'inline'], o1_iterations))
+            failure = None
+        except Exception as error:  # o gerador não trata todos os programas
+            failure = error
+        for note in inlined.notes:
+            print(f"  {note}")
+        if failure:
+            print(f"  code generation failed: {failure!r}")
+            continue
+        before, after = without_inline.instruction_count(), with_inline.instruction_count()
+        print(f"  emitted instructions:  {before} -> {after} ({after - before:+d})")
+        if name in INPUTS:
+            _, before = run(without_inline.text(), INPUTS[name])
+            _, after = run(with_inline.text(), INPUTS[name])
+            print(f"  executed instructions: {before} -> {after} ({after - before:+d})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Static and executed jumps per program: generated code, after the peephole stage alone, and
+after the control-flow graph passes followed by the peephole stage (the jumps -O1 emits:
+the slots pass in between does not move them).
+
+Each program is compiled at -O1 and run on the bundled EWVM interpreter with
+the inputs of bench_dynamic.py; all three versions must print the same output.
+
+Usage: python benchmarks/jump_counts.py [program...]
+"""
+import os
+import sys
+
+from bench_dynamic import INPUTS, TESTS_DIR, compile_level
+
+from ewvm import run
+from Instructions import Op, parse
+from PassManager import optimize_code
+
+JUMPS = (Op.JUMP, Op.JZ)
+
+
+def static_jumps(code):
+    return sum(1 for op, _ in code if op in JUMPS)
+
+
+def dynamic_jumps(code, inputs):
+    profile = {}
+    output, _ = run(code.serialize(), inputs, profile=profile)
+    return output, sum(profile.get(op.mnemonic, 0) for op in JUMPS)
+
+
+def main():
+    names = sys.argv[1:] or sorted(INPUTS)
+    variants = ('generated', 'peephole', 'cfg+peephole')
+    print(f"{'program':<16}" + ''.join(f"{name:>26}" for name in variants))
+    print(f"{'':<16}" + ''.join(f"{'static':>13}{'executed':>13}" for _ in variants))
+    totals = [[0, 0] for _ in variants]
+    for name in names:
+        generated = parse(compile_level(os.path.join(TESTS_DIR, f"{name}.pas"), 1, vm_passes=False))
+        versions = [generated, optimize_code(generated, ('peephole',)), optimize_code(generated, ('cfg', 'peephole'))]
+        row = []
+        outputs = set()
+        for index, code in enumerate(versions):
+            output, executed = dynamic_jumps(code, INPUTS[name])
+            outputs.add(output)
+            row.append((static_jumps(code), executed))
+            totals[index][0] += row[-1][0]
+            totals[index][1] += row[-1][1]
+        if len(outputs) != 1:
+            raise SystemExit(f"{name}: the optimized code prints something else")
+        print(f"{name:<16}" + ''.join(f"{static:>13}{executed:>13}" for static, executed in row))
+    print(f"{'total':<16}" + ''.join(f"{static:>13}{executed:>13}" for static, executed in totals))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Emitted VM instructions per program at each -O level, and what each optimization pass saves.
+
+For every pass in -O1 (and the cfg, slots and peephole stages run on the generated code),
+"saved" is the number of instructions the program grows by when that pass
+alone is left out of -O1.
+
+Usage: python benchmarks/opt_report.py [files...]   (default: tests/*.pas)
+"""
+import contextlib
+import glob
+import io
+import os
+import sys
+from collections import Counter
+
+from synthetic import SRC_DIR
+
+from PassManager import OPT_LEVELS, VM_PASSES, PassManager, optimize_code
+from code_generator import Generator
+from pasSyn import parser
+
+
+def instruction_count(source, filename, pass_manager, vm_passes=tuple(VM_PASSES)):
+    # None se o gerador não consegue compilar o programa (ex.: chamadas recursivas a -O0)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ast = pass_manager.run(parser.parse(source))
+            generator = Generator(filename)
+            generator.visit(ast)
+    except Exception:
+        return None
+    return optimize_code(generator.code, vm_passes).instruction_count()
+
+
+def _cell(value, width):
+    return f"{'-' if value is None else value:>{width}}"
+
+
+def main():
+    files = sys.argv[1:] or sorted(glob.glob(os.path.join(SRC_DIR, '..', 'tests', '*.pas')))
+    levels = sorted(OPT_LEVELS)
+    o1_passes, o1_iterations = OPT_LEVELS[1]
+    vm_passes = tuple(VM_PASSES)
+    saved = list(o1_passes) + list(vm_passes)
+    totals = Counter()
+
+    print(f"{'program':<20}" + ''.join(f"{'-O' + str(level):>8}" for level in levels)
+          + "  saved at -O1: " + ', '.join(saved))
+    for path in files:
+        with open(path) as f:
+            source = f.read()
+        row = {}
+        for level in levels:
+            row[level] = instruction_count(source, path, PassManager.for_level(level), vm_passes if level > 0 else ())
+        for name in saved:
+            without = PassManager([p for p in o1_passes if p != name], o1_iterations)
+            count = instruction_count(source, path, without, [p for p in vm_passes if p != name])
+            row[name] = None if count is None or row[1] is None else count - row[1]
+        # Os totais só somam os programas compilados a todos os níveis
+        if all(value is not None for value in row.values()):
+            totals.update(row)
+        print(f"{os.path.basename(path):<20}" + ''.join(_cell(row[level], 8) for level in levels)
+              + "  " + ', '.join(f"{name}={_cell(row[name], 0)}" for name in saved))
+    print(f"{'total':<20}" + ''.join(f"{totals[level]:>8}" for level in levels)
+          + "  " + ', '.join(f"{name}={totals[name]}" for name in saved))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""VM stack height and call depth of the recursive tests/ programs as their input grows.
+
+The functions are compiled at -O1 without the inline pass, so the call from
+the main program stays; with their recursion removed the stack stays the
+same size for any input (O(1)) where the recursive form needs one frame per
+level (O(n)). Every run is checked against the expected result.
+
+Usage: python benchmarks/recursion_depth.py
+"""
+import contextlib
+import io
+import math
+import os
+
+from synthetic import SRC_DIR
+
+from ewvm import run
+from PassManager import OPT_LEVELS, PassManager
+from code_generator import Generator
+from pasSyn import parser
+
+TESTS_DIR = os.path.join(SRC_DIR, '..', 'tests')
+
+
+def _fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+# Programa -> [(entrada, resultado esperado, níveis de recursão na forma original)]
+# O MDC de dois números de Fibonacci seguidos é o pior caso do algoritmo de Euclides
+CASES = {
+    'fatorial_rec': [([str(n)], math.factorial(n), n + 1) for n in (5, 10, 20, 40, 80)],
+    'mdc_rec': [([str(_fibonacci(n + 1)), str(_fibonacci(n))], 1, n) for n in (5, 10, 20, 40, 80)],
+}
+
+
+def compile_without_inline(path):
+    passes, max_iterations = OPT_LEVELS[1]
+    with open(path) as f:
+        source = f.read()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pass_manager = PassManager([name for name in passes if name != 'inline'], max_iterations)
+        ast = pass_manager.run(parser.parse(source))
+        generator = Generator(path)
+        generator.visit(ast)
+    return generator.text(), pass_manager.notes
+
+
+def main():
+    print(f"{'program':<14}{'levels':>8}{'executed':>10}{'calls':>7}{'stack':>7}")
+    for name, cases in CASES.items():
+        code, notes = compile_without_inline(os.path.join(TESTS_DIR, f"{name}.pas"))
+        for inputs, expected, levels in cases:
+            depth = {}
+            output, steps = run(code, inputs, depth=depth)
+            if not output.rstrip().endswith(str(expected)):
+                raise SystemExit(f"{name} {inputs}: expected {expected}, got {output!r}")
+            print(f"{name:<14}{levels:>8}{steps:>10}{depth['calls']:>7}{depth['stack']:>7}")
+        for note in notes:
+            print(f"  {note}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Stress test: every compiler phase on very deep ASTs, at the default recursion limit.
+
+Usage: python benchmarks/stress_deep_nesting.py [depth]   (default: 100000)
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import long_expression_program, nested_if_program
+
+from pasSyn import parser
+from ASTDump import dump_ast
+from PassManager import PassManager
+from pasSem import ASTSemanticAnalyzer
+from code_generator import Generator
+
+
+def compile_source(source, out_path):
+    phases = []
+
+    def phase(name, run):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run()
+        phases.append(f"{name} {(time.perf_counter() - start) * 1000:.0f} ms")
+        return result
+
+    ast = phase("parse", lambda: parser.parse(source))
+    assert ast is not None, "parse failed"
+    with open(os.devnull, 'w') as sink:
+        for fmt in ('json', 'jsonl'):
+            phase(f"dump {fmt}", lambda: dump_ast(ast, sink, fmt))
+    ast = phase("optimize -O2", lambda: PassManager.for_level(2).run(ast))
+    assert phase("analyze", lambda: ASTSemanticAnalyzer().analyze(ast)), "semantic errors"
+
+    generator = Generator(out_path)
+    generator.filename = out_path
+    phase("generate", lambda: generator.generate(ast))
+    return phases
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"recursion limit: {sys.getrecursionlimit()}")
+    cases = [
+        (f"{depth}-term expression chain", long_expression_program(depth)),
+        (f"{depth // 10} nested if/begin blocks", nested_if_program(depth // 10)),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for title, source in cases:
+            phases = compile_source(source, os.path.join(tmp, 'deep.vm'))
+            print(f"{title}: ok ({', '.join(phases)})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+def straight_line_program(blocks):
+    """Pascal source with `blocks` repetitions of a small statement group (~5 lines each)."""
+    lines = [
+        "program Bench;",
+        "var",
+        "    a, b, c, i: integer;",
+        "begin",
+        "    a := 0;",
+        "    b := 1;",
+        "    c := 2;",
+        "    i := 0;",
+    ]
+    for _ in range(blocks):
+        lines.append("    a := a + b;")
+        lines.append("    b := b * 2 - a;")
+        lines.append("    if a > c then c := a + 1 else c := c - 1;")
+        lines.append("    while i < 10 do i := i + 1;")
+        lines.append("    writeln('linha');")
+    lines.append("    writeln('fim')")
+    lines.append("end.")
+    return "\n".join(lines) + "\n"
+
+
+def statement_block_program(statements):
+    """A single begin/end block with `statements` assignments."""
+    body = ["    a := a + 1;"] * statements
+    return "program Bench;\nvar\n    a: integer;\nbegin\n" + "\n".join(body) + "\n    a := 0\nend.\n"
+
+
+def procedures_program(procedures):
+    """A program declaring `procedures` small procedures."""
+    lines = ["program Bench;", "var", "    a: integer;"]
+    for n in range(procedures):
+        lines.append(f"procedure p{n}(x: integer, y: integer);")
+        lines.append("begin")
+        lines.append("    a := x + y")
+        lines.append("end;")
+    lines.append("begin")
+    lines.append("    a := 0")
+    lines.append("end.")
+    return "\n".join(lines) + "\n"
+
+
+def long_expression_program(terms):
+    """`x := a + a + ... + a` with `terms` operands: a left-deep BinaryOp spine."""
+    expression = " + ".join(["a"] * terms)
+    return f"program Deep;\nvar\n    a, x: integer;\nbegin\n    readln(a);\n    x := {expression};\n    writeln(x)\nend.\n"
+
+
+def nested_if_program(depth):
+    """`depth` nested if statements, each wrapping the next in a begin/end block."""
+    lines = ["program Deep;", "var", "    a, x: integer;", "begin", "    readln(a);", "    x := 0;"]
+    lines.extend(["    if a > 0 then begin"] * depth)
+    lines.append("    x := a + 1")
+    lines.extend(["    end"] * depth)
+    lines[-1] += ";"
+    lines.append("    writeln(x)")
+    lines.append("end.")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,225 @@
+"""Content-addressed on-disk cache of parsed/optimized ASTs.
+
+Usage: python ASTCache.py <cache_dir> [--clear]
+"""
+import glob
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import zlib
+
+import ASTNode
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MAX_BYTES = 256 * 2**20
+FORMAT_VERSION = 2
+
+# Codificação da AST em pré-ordem: um byte por valor em `ops` e os escalares
+# (e comprimentos de listas) em `consts`, serializados com marshal + zlib.
+# É iterativa, pelo que árvores muito profundas não esgotam a pilha do Python.
+# Os Operator (que o marshal não serializa) são guardados pelo seu valor.
+_SCALAR, _LIST, _OPERATOR = 0, 1, 2
+NODE_CLASSES = sorted(
+    (cls for cls in vars(ASTNode).values()
+     if isinstance(cls, type) and issubclass(cls, ASTNode.ASTNode) and cls is not ASTNode.ASTNode),
+    key=lambda cls: cls.__name__)
+_NODE_OPS = {cls: op for op, cls in enumerate(NODE_CLASSES, 3)}
+
+
+def encode_ast(root):
+    ops = bytearray()
+    consts = []
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        op = _NODE_OPS.get(value.__class__)
+        if op is not None:
+            ops.append(op)
+            stack.extend(getattr(value, name) for name in reversed(value._fields))
+        elif isinstance(value, list):
+            ops.append(_LIST)
+            consts.append(len(value))
+            stack.extend(reversed(value))
+        elif isinstance(value, ASTNode.Operator):
+            ops.append(_OPERATOR)
+            consts.append(value.value)
+        else:
+            ops.append(_SCALAR)
+            consts.append(value)
+    return zlib.compress(marshal.dumps((FORMAT_VERSION, bytes(ops), consts)), 1)
+
+
+def decode_ast(data):
+    version, ops, consts = marshal.loads(zlib.decompress(data))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported AST cache format: {version}")
+
+    # Cada frame: [classe do nó ou _LIST, valores já lidos, valores em falta]
+    frames = [[None, [], 1]]
+    ci = 0
+    for op in ops:
+        if op == _SCALAR:
+            value = consts[ci]
+            ci += 1
+        elif op == _LIST:
+            count = consts[ci]
+            ci += 1
+            if count:
+                frames.append([_LIST, [], count])
+                continue
+            value = []
+        elif op == _OPERATOR:
+            value = ASTNode.Operator(consts[ci])
+            ci += 1
+        else:
+            cls = NODE_CLASSES[op - 3]
+            if cls._fields:
+                frames.append([cls, [], len(cls._fields)])
+                continue
+            value = cls.__new__(cls)
+
+        while True:
+            frame = frames[-1]
+            frame[1].append(value)
+            frame[2] -= 1
+            if frame[2] or len(frames) == 1:
+                break
+            frames.pop()
+            kind, values = frame[0], frame[1]
+            if kind is _LIST:
+                value = values
+            else:
+                value = kind.__new__(kind)
+                for name, field_value in zip(kind._fields, values):
+                    setattr(value, name, field_value)
+    return frames[0][1][0]
+
+
+def compiler_version():
+    # Qualquer alteração ao código do compilador (gramática, nós, otimizador) invalida a cache
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(SRC_DIR, '*.py'))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ASTCache:
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.version = compiler_version()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, source, stage):
+        digest = hashlib.sha256()
+        for part in (self.version, stage, source):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.ast")
+
+    def get(self, source, stage):
+        path = self._path(self.key(source, stage))
+        try:
+            with open(path, 'rb') as f:
+                ast = decode_ast(f.read())
+        except (OSError, ValueError, EOFError, TypeError, zlib.error):
+            self.stats["misses"] += 1
+            return None
+        try:
+            os.utime(path)  # LRU: mtime = último acesso
+        except OSError:
+            pass
+        self.stats["hits"] += 1
+        return ast
+
+    def put(self, source, stage, ast):
+        try:
+            data = encode_ast(ast)
+        except ValueError:  # valores que o marshal não serializa
+            return False
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(self.key(source, stage)))
+        self.stats["stores"] += 1
+        self.evict()
+        return True
+
+    def entries(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.ast'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.stats["evictions"] += 1
+
+    def save_stats(self):
+        # Estatísticas acumuladas entre execuções, em <cache_dir>/stats.json
+        totals = self.load_stats()
+        for name, count in self.stats.items():
+            totals[name] = totals.get(name, 0) + count
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(totals, f)
+        os.replace(tmp_path, os.path.join(self.cache_dir, 'stats.json'))
+
+    def load_stats(self):
+        try:
+            with open(os.path.join(self.cache_dir, 'stats.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+        stats_path = os.path.join(self.cache_dir, 'stats.json')
+        if os.path.exists(stats_path):
+            os.remove(stats_path)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python ASTCache.py <cache_dir> [--clear]")
+        return 1
+    cache = ASTCache(sys.argv[1])
+    if '--clear' in sys.argv[2:]:
+        cache.clear()
+        print("AST cache cleared.")
+        return 0
+
+    entries = cache.entries()
+    totals = cache.load_stats()
+    lookups = totals.get("hits", 0) + totals.get("misses", 0)
+    print(f"entries:   {len(entries)} ({sum(size for _, size, _ in entries) / 1024:.1f} KiB)")
+    for name in ("hits", "misses", "stores", "evictions"):
+        print(f"{name + ':':<10} {totals.get(name, 0)}")
+    if lookups:
+        print(f"hit rate:  {totals.get('hits', 0) / lookups:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
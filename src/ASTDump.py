@@ -0,0 +1,143 @@
+import json
+from ASTNode import ASTNode
+
+# Formatos de dump da AST e extensão dos ficheiros correspondentes:
+#   text  - formato indentado de print_ast
+#   json  - um documento JSON compacto; cada nó é {"_type": "<Classe>", "<campo>": ...}
+#   jsonl - uma linha JSON por nó, em pré-ordem: {"id", "parent", "field", "index", "type", ...}
+#           com os campos escalares; os nós filhos aparecem nas suas próprias linhas
+DUMP_FORMATS = {'text': 'txt', 'json': 'json', 'jsonl': 'jsonl'}
+
+FLUSH_SIZE = 1 << 16
+
+
+class _BufferedWriter:
+    def __init__(self, out):
+        self.out = out
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        self.out.write(''.join(self.parts))
+        self.parts = []
+        self.size = 0
+
+
+def dump_ast(node, out, fmt='text'):
+    """Write the AST rooted at node to the file object out, incrementally."""
+    writer = _BufferedWriter(out)
+    if fmt == 'text':
+        _dump_text(node, writer.write)
+    elif fmt == 'json':
+        _dump_json(node, writer.write)
+    elif fmt == 'jsonl':
+        _dump_jsonl(node, writer.write)
+    else:
+        raise ValueError(f"Unknown AST dump format: {fmt}")
+    writer.flush()
+
+
+# Nas pilhas abaixo, uma str é texto a escrever tal como está;
+# um tuplo é um valor da AST ainda por escrever.
+
+def _dump_text(root, write):
+    stack = [(root, 0)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            write(item)
+            continue
+
+        node, depth = item
+        if node is None:
+            write("None")
+        elif isinstance(node, list):
+            indent = "  " * depth
+            write("[\n")
+            stack.append(f"{indent}]")
+            for element in reversed(node):
+                stack.append(",\n")
+                stack.append((element, depth + 1))
+                stack.append(f"{indent}  ")
+        elif isinstance(node, ASTNode):
+            class_name = node.__class__.__name__
+            fields = node._fields
+            if not fields:
+                write(f"{class_name}()")
+                continue
+            indent = "  " * depth
+            write(f"{class_name}(\n")
+            stack.append(f"\n{indent})")
+            for i in range(len(fields) - 1, -1, -1):
+                stack.append((getattr(node, fields[i]), depth + 1))
+                stack.append(f"{indent}  {fields[i]}=")
+                if i:
+                    stack.append(",\n")
+        else:
+            write(str(node))
+
+
+def _scalar(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _dump_json(root, write):
+    stack = [(root,)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            write(item)
+            continue
+
+        node = item[0]
+        if isinstance(node, list):
+            write("[")
+            stack.append("]")
+            for i in range(len(node) - 1, -1, -1):
+                stack.append((node[i],))
+                if i:
+                    stack.append(",")
+        elif isinstance(node, ASTNode):
+            write('{"_type":' + json.dumps(node.__class__.__name__))
+            stack.append("}")
+            for field in reversed(node._fields):
+                stack.append((getattr(node, field),))
+                stack.append("," + json.dumps(field) + ":")
+        else:
+            write(json.dumps(_scalar(node)))
+
+
+def _dump_jsonl(root, write):
+    if isinstance(root, list):
+        stack = [(node, None, None, i) for i, node in enumerate(root)][::-1]
+    else:
+        stack = [(root, None, None, None)]
+    next_id = 0
+    while stack:
+        node, parent, field, index = stack.pop()
+        if not isinstance(node, ASTNode):
+            continue
+
+        record = {"id": next_id, "parent": parent, "field": field, "index": index,
+                  "type": node.__class__.__name__}
+        children = []
+        for name in node._fields:
+            value = getattr(node, name)
+            if isinstance(value, ASTNode):
+                children.append((value, next_id, name, None))
+            elif isinstance(value, list):
+                record[name] = [_scalar(v) for v in value if not isinstance(v, ASTNode)]
+                children.extend((v, next_id, name, i) for i, v in enumerate(value) if isinstance(v, ASTNode))
+            else:
+                record[name] = _scalar(value)
+        write(json.dumps(record, separators=(',', ':')) + "\n")
+        stack.extend(reversed(children))
+        next_id += 1
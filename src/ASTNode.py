@@ -1,8 +1,47 @@
+from enum import Enum
+
+
+class Operator(str, Enum):
+    # Operadores canónicos, independentes da grafia no código-fonte (div, DIV, Div, ...)
+    PLUS = '+'
+    MINUS = '-'
+    TIMES = '*'
+    DIVIDE = '/'
+    DIV = 'div'
+    MOD = 'mod'
+    EQ = '='
+    NE = '<>'
+    LT = '<'
+    LE = '<='
+    GT = '>'
+    GE = '>='
+    AND = 'and'
+    OR = 'or'
+    NOT = 'not'
+
+    def __str__(self):
+        return self.value
+
+    @classmethod
+    def from_source(cls, text):
+        return cls(text.lower())
+
+
 class ASTNode:
+    # Nós sem __dict__: os campos de cada classe são os seus __slots__, expostos em _fields
+    __slots__ = ()
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls.__dict__.get('__slots__', ())
+
     def __repr__(self):
         return self.__str__()
 
 class Program(ASTNode):
+    __slots__ = ('header', 'block')
+
     def __init__(self, header, block):
         self.header = header
         self.block = block
@@ -11,6 +50,8 @@ class Program(ASTNode):
         return f"Program({self.header}, {self.block})"
 
 class Header(ASTNode):
+    __slots__ = ('program_name',)
+
     def __init__(self, program_name):
         self.program_name = program_name
     
@@ -18,6 +59,8 @@ class Header(ASTNode):
         return f"Header(PROGRAM {self.program_name})"
 
 class Block(ASTNode):
+    __slots__ = ('var_decl_part', 'proc_func_part', 'statement_part', 'extra_var_decl')
+
     def __init__(self, var_decl_part, proc_func_part, statement_part, extra_var_decl=None):
         self.var_decl_part = var_decl_part
         self.proc_func_part = proc_func_part
@@ -30,6 +73,8 @@ class Block(ASTNode):
         return f"Block({self.var_decl_part}, {self.proc_func_part}, {self.statement_part})"
 
 class VarDeclarationPart(ASTNode):
+    __slots__ = ('declarations',)
+
     def __init__(self, declarations=None):
         self.declarations = declarations or []
     
@@ -37,6 +82,8 @@ class VarDeclarationPart(ASTNode):
         return f"VarDeclarationPart({self.declarations})"
 
 class VarDeclaration(ASTNode):
+    __slots__ = ('id_list', 'type_name')
+
     def __init__(self, id_list, type_name):
         self.id_list = id_list
         self.type_name = type_name
@@ -45,6 +92,8 @@ class VarDeclaration(ASTNode):
         return f"VarDeclaration({self.id_list}, {self.type_name})"
 
 class IdList(ASTNode):
+    __slots__ = ('ids',)
+
     def __init__(self, ids):
         self.ids = ids
     
@@ -52,6 +101,8 @@ class IdList(ASTNode):
         return f"IdList({self.ids})"
 
 class ArrayId(ASTNode):
+    __slots__ = ('id_name', 'expression')
+
     def __init__(self, id_name, expression):
         self.id_name = id_name
         self.expression = expression
@@ -60,6 +111,8 @@ class ArrayId(ASTNode):
         return f"ArrayId({self.id_name}, {self.expression})"
 
 class Type(ASTNode):
+    __slots__ = ('type_name',)
+
     def __init__(self, type_name):
         self.type_name = type_name
     
@@ -67,6 +120,8 @@ class Type(ASTNode):
         return f"Type({self.type_name})"
 
 class ArrayType(ASTNode):
+    __slots__ = ('range', 'element_type')
+
     def __init__(self, range_node, element_type):
         self.range = range_node
         self.element_type = element_type
@@ -75,6 +130,8 @@ class ArrayType(ASTNode):
         return f"ArrayType({self.range}, {self.element_type})"
 
 class Range(ASTNode):
+    __slots__ = ('start', 'end')
+
     def __init__(self, start, end):
         self.start = start
         self.end = end
@@ -83,6 +140,8 @@ class Range(ASTNode):
         return f"Range({self.start}, {self.end})"
 
 class StatementPart(ASTNode):
+    __slots__ = ('statement_sequence',)
+
     def __init__(self, statement_sequence):
         self.statement_sequence = statement_sequence
     
@@ -90,6 +149,8 @@ class StatementPart(ASTNode):
         return f"StatementPart({self.statement_sequence})"
 
 class StatementSequence(ASTNode):
+    __slots__ = ('statements',)
+
     def __init__(self, statements):
         self.statements = statements if isinstance(statements, list) else [statements]
     
@@ -97,6 +158,8 @@ class StatementSequence(ASTNode):
         return f"StatementSequence({self.statements})"
 
 class Assignment(ASTNode):
+    __slots__ = ('target', 'value')
+
     def __init__(self, target, value):
         self.target = target
         self.value = value
@@ -105,6 +168,8 @@ class Assignment(ASTNode):
         return f"Assignment({self.target}, {self.value})"
 
 class ArrayAssignment(ASTNode):
+    __slots__ = ('array_id', 'index', 'value')
+
     def __init__(self, array_id, index, value):
         self.array_id = array_id
         self.index = index
@@ -114,6 +179,8 @@ class ArrayAssignment(ASTNode):
         return f"ArrayAssignment({self.array_id}, {self.index}, {self.value})"
 
 class BinaryOp(ASTNode):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
@@ -123,6 +190,8 @@ class BinaryOp(ASTNode):
         return f"BinaryOp({self.left}, {self.operator}, {self.right})"
 
 class UnaryOp(ASTNode):
+    __slots__ = ('operator', 'operand')
+
     def __init__(self, operator, operand):
         self.operator = operator
         self.operand = operand
@@ -131,6 +200,8 @@ class UnaryOp(ASTNode):
         return f"UnaryOp({self.operator}, {self.operand})"
 
 class IfStatement(ASTNode):
+    __slots__ = ('condition', 'then_branch', 'else_branch')
+
     def __init__(self, condition, then_branch, else_branch=None):
         self.condition = condition
         self.then_branch = then_branch
@@ -142,6 +213,8 @@ class IfStatement(ASTNode):
         return f"IfStatement({self.condition}, {self.then_branch})"
 
 class WhileStatement(ASTNode):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
@@ -150,6 +223,8 @@ class WhileStatement(ASTNode):
         return f"WhileStatement({self.condition}, {self.body})"
 
 class RepeatStatement(ASTNode):
+    __slots__ = ('body', 'condition')
+
     def __init__(self, body, condition):
         self.body = body
         self.condition = condition
@@ -158,6 +233,8 @@ class RepeatStatement(ASTNode):
         return f"RepeatStatement({self.body}, {self.condition})"
 
 class ForStatement(ASTNode):
+    __slots__ = ('init', 'direction', 'limit', 'body')
+
     def __init__(self, init, direction, limit, body):
         self.init = init
         self.direction = direction 
@@ -168,6 +245,8 @@ class ForStatement(ASTNode):
         return f"ForStatement({self.init}, {self.direction}, {self.limit}, {self.body})"
 
 class ProcedureCall(ASTNode):
+    __slots__ = ('procedure_name', 'params')
+
     def __init__(self, procedure_name, params=None):
         self.procedure_name = procedure_name
         self.params = params or []
@@ -176,6 +255,8 @@ class ProcedureCall(ASTNode):
         return f"ProcedureCall({self.procedure_name}, {self.params})"
 
 class FunctionCall(ASTNode):
+    __slots__ = ('function_name', 'params')
+
     def __init__(self, function_name, params=None):
         self.function_name = function_name
         self.params = params or []
@@ -184,6 +265,8 @@ class FunctionCall(ASTNode):
         return f"FunctionCall({self.function_name}, {self.params})"
 
 class WritelnStatement(ASTNode):
+    __slots__ = ('params',)
+
     def __init__(self, params=None):
         self.params = params or []
     
@@ -191,6 +274,8 @@ class WritelnStatement(ASTNode):
         return f"WritelnStatement({self.params})"
 
 class ReadlnStatement(ASTNode):
+    __slots__ = ('params',)
+
     def __init__(self, params=None):
         self.params = params or []
     
@@ -198,14 +283,20 @@ class ReadlnStatement(ASTNode):
         return f"ReadlnStatement({self.params})"
 
 class BreakStatement(ASTNode):
+    __slots__ = ()
+
     def __str__(self):
         return "BreakStatement()"
 
 class ContinueStatement(ASTNode):
+    __slots__ = ()
+
     def __str__(self):
         return "ContinueStatement()"
 
 class CaseStatement(ASTNode):
+    __slots__ = ('expression', 'case_list')
+
     def __init__(self, expression, case_list):
         self.expression = expression
         self.case_list = case_list
@@ -214,6 +305,8 @@ class CaseStatement(ASTNode):
         return f"CaseStatement({self.expression}, {self.case_list})"
 
 class CaseOption(ASTNode):
+    __slots__ = ('value', 'statement')
+
     def __init__(self, value, statement):
         self.value = value
         self.statement = statement
@@ -222,6 +315,10 @@ class CaseOption(ASTNode):
         return f"CaseOption({self.value}, {self.statement})"
 
 class Literal(ASTNode):
+    # type_name e tipo Python de value: 'NUMBER' (int ou float), 'BOOLEAN' (bool),
+    # 'PHRASE' (str, sem as plicas)
+    __slots__ = ('value', 'type_name')
+
     def __init__(self, value, type_name):
         self.value = value
         self.type_name = type_name 
@@ -230,6 +327,8 @@ class Literal(ASTNode):
         return f"Literal({self.value}, {self.type_name})"
 
 class Identifier(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
     
@@ -237,6 +336,8 @@ class Identifier(ASTNode):
         return f"Identifier({self.name})"
 
 class LengthFunction(ASTNode):
+    __slots__ = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression
     
@@ -244,6 +345,8 @@ class LengthFunction(ASTNode):
         return f"LengthFunction({self.expression})"
 
 class ProcedureDeclaration(ASTNode):
+    __slots__ = ('heading', 'block')
+
     def __init__(self, heading, block):
         self.heading = heading
         self.block = block
@@ -252,6 +355,8 @@ class ProcedureDeclaration(ASTNode):
         return f"ProcedureDeclaration({self.heading}, {self.block})"
 
 class ProcedureHeading(ASTNode):
+    __slots__ = ('name', 'params')
+
     def __init__(self, name, params=None):
         self.name = name
         self.params = params or []
@@ -260,6 +365,8 @@ class ProcedureHeading(ASTNode):
         return f"ProcedureHeading({self.name}, {self.params})"
 
 class FunctionDeclaration(ASTNode):
+    __slots__ = ('heading', 'block')
+
     def __init__(self, heading, block):
         self.heading = heading
         self.block = block
@@ -268,6 +375,8 @@ class FunctionDeclaration(ASTNode):
         return f"FunctionDeclaration({self.heading}, {self.block})"
 
 class FunctionHeading(ASTNode):
+    __slots__ = ('name', 'return_type', 'params')
+
     def __init__(self, name, return_type, params=None):
         self.name = name
         self.return_type = return_type
@@ -277,6 +386,8 @@ class FunctionHeading(ASTNode):
         return f"FunctionHeading({self.name}, {self.return_type}, {self.params})"
 
 class Parameter(ASTNode):
+    __slots__ = ('name', 'type_name')
+
     def __init__(self, name, type_name):
         self.name = name
         self.type_name = type_name
@@ -0,0 +1,99 @@
+from ASTNode import *
+
+
+def iter_nodes(root):
+    # Percorre todos os nós da subárvore em pré-ordem, sem recursão
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            yield value
+            stack.extend(reversed([getattr(value, name) for name in value._fields]))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+
+
+def exits_loop(body):
+    # Há no corpo um break/continue deste ciclo (os dos ciclos interiores não contam)?
+    stack = [body]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (BreakStatement, ContinueStatement)):
+            return True
+        if isinstance(value, ASTNode) and not isinstance(value, (WhileStatement, ForStatement, RepeatStatement)):
+            stack.extend(getattr(value, name) for name in value._fields)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
+
+def assigned_names(root):
+    """Return (names, has_call): the variables the subtree may write and whether it calls a subprogram."""
+    names = set()
+    has_call = False
+    for node in iter_nodes(root):
+        if isinstance(node, Assignment):
+            names.add(node.target.name)
+        elif isinstance(node, ArrayAssignment):
+            names.add(node.array_id)
+        elif isinstance(node, ReadlnStatement):
+            names.update(param.name for param in node.params if isinstance(param, Identifier))
+        elif isinstance(node, ProcedureCall):
+            has_call = True
+    return names, has_call
+
+
+def used_names(root):
+    """Return (names, has_call): the variables the subtree reads and whether it calls a subprogram."""
+    names = set()
+    has_call = False
+    for node in iter_nodes(root):
+        if isinstance(node, Identifier):
+            names.add(node.name)
+        elif isinstance(node, ArrayId):
+            names.add(node.id_name)
+        elif isinstance(node, ArrayAssignment):
+            names.add(node.array_id)
+        elif isinstance(node, ProcedureCall):
+            has_call = True
+    return names, has_call
+
+
+def declared_names(var_decl_part):
+    # Variáveis simples declaradas numa secção var (os arrays ficam de fora)
+    names = set()
+    if var_decl_part and var_decl_part.declarations:
+        for declaration in var_decl_part.declarations:
+            names.update(ident.name for ident in declaration.id_list if isinstance(ident, Identifier))
+    return names
+
+
+def declare_variables(block, variables):
+    # Acrescenta declarações (uma por tipo) das variáveis [(nome, tipo)] à secção var do bloco;
+    # no programa principal com subprogramas as variáveis vêm depois deles
+    decl_part = block.extra_var_decl or block.var_decl_part
+    if decl_part is None:
+        decl_part = block.var_decl_part = VarDeclarationPart()
+    for type_name in sorted({type_name for _, type_name in variables}):
+        ids = [Identifier(name) for name, var_type in variables if var_type == type_name]
+        decl_part.declarations.append(VarDeclaration(ids, Type(type_name)))
+
+
+def expr_key(root):
+    # Chave plana (pré-ordem) de uma expressão: expressões estruturalmente iguais têm a mesma chave
+    # (o tipo do valor conta: 1 == 1.0 em Python, mas um é inteiro e o outro real)
+    key = []
+    for node in iter_nodes(root):
+        if isinstance(node, Literal):
+            key.append((node.type_name, type(node.value), node.value))
+        elif isinstance(node, Identifier):
+            key.append(('Identifier', node.name))
+        elif isinstance(node, ArrayId):
+            key.append(('ArrayId', node.id_name))
+        elif isinstance(node, (BinaryOp, UnaryOp)):
+            key.append((node.__class__.__name__, node.operator))
+        elif isinstance(node, ProcedureCall):
+            key.append(('ProcedureCall', node.procedure_name))
+        else:
+            key.append((node.__class__.__name__,))
+    return tuple(key)
@@ -0,0 +1,58 @@
+import inspect
+
+
+class ASTVisitor:
+    # Prefixo dos métodos de visita e método usado quando nenhum se aplica
+    method_prefix = 'visit_'
+    generic_method = 'generic_visit'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Tabela de despacho por classe de visitor: tipo do nó -> (função, é gerador)
+        cls._dispatch = {}
+
+    def visit(self, node):
+        if node is None:
+            return None
+
+        dispatch = self._dispatch
+        handler, is_generator = dispatch.get(node.__class__) or self._resolve(node.__class__)
+        if not is_generator:
+            return handler(self, node)
+
+        # Percurso com pilha explícita: um método-gerador faz `resultado = yield filho`
+        # para visitar um filho, e o valor de `return` é o resultado da sua visita.
+        # A profundidade da AST não consome a pilha do Python.
+        stack = [handler(self, node)]
+        value = None
+        while stack:
+            try:
+                child = stack[-1].send(value)
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+                continue
+
+            if child is None:
+                value = None
+                continue
+            handler, is_generator = dispatch.get(child.__class__) or self._resolve(child.__class__)
+            if is_generator:
+                stack.append(handler(self, child))
+                value = None
+            else:
+                value = handler(self, child)
+        return value
+
+    @classmethod
+    def _resolve(cls, node_class):
+        # Procura pela MRO, para que subclasses de um nó usem o método da classe base
+        for klass in node_class.__mro__:
+            handler = getattr(cls, cls.method_prefix + klass.__name__, None)
+            if handler is not None:
+                break
+        else:
+            handler = getattr(cls, cls.generic_method)
+        entry = (handler, inspect.isgeneratorfunction(handler))
+        cls._dispatch[node_class] = entry
+        return entry
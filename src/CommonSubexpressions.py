@@ -0,0 +1,207 @@
+from ASTNode import *
+from ASTUtils import iter_nodes
+from TempOptimizer import TempOptimizer
+
+
+class CommonSubexpressionElimination(TempOptimizer):
+    """Common subexpression elimination within basic blocks.
+
+    Expressions are value-numbered bottom-up: a variable's number changes
+    every time it is assigned or read, so two subtrees with the same number
+    compute the same value. A block is a run of assignments, readln and
+    writeln statements, ending at the first compound statement (the
+    condition of an if and the initial value of a for still belong to it)
+    or statement with a call. Integer/boolean expressions computed more
+    than once in a block are computed once, into the variable the first
+    occurrence is assigned to when it is not overwritten in between or
+    into a new temporary otherwise, if that saves instructions.
+    """
+
+    temp_prefix = '_cse'
+
+    def __init__(self):
+        super().__init__()
+        self.numbers = {}
+
+    def optimize_StatementSequence(self, node):
+        node = yield from super().optimize_StatementSequence(node)
+        statements = []
+        block = []
+        for stmt in node.statements:
+            if self._is_barrier(stmt):
+                statements.extend(self._eliminate(block))
+                statements.append(stmt)
+                block = []
+            else:
+                block.append(stmt)
+                if isinstance(stmt, (IfStatement, ForStatement)):
+                    statements.extend(self._eliminate(block))
+                    block = []
+        statements.extend(self._eliminate(block))
+        node.statements = statements
+        return node
+
+    def optimize_IfStatement(self, node):
+        result = yield from super().optimize_IfStatement(node)
+        if result is node:
+            node.then_branch = self._single(node.then_branch)
+            node.else_branch = self._single(node.else_branch)
+        return result
+
+    def optimize_WhileStatement(self, node):
+        result = yield from super().optimize_WhileStatement(node)
+        if result is node:
+            node.body = self._single(node.body)
+        return result
+
+    def optimize_ForStatement(self, node):
+        result = yield from super().optimize_ForStatement(node)
+        result.body = self._single(result.body)
+        return result
+
+    def _single(self, stmt):
+        # Corpo de uma só atribuição (sem begin/end): as repetições dentro dela
+        if not isinstance(stmt, Assignment) or self._is_barrier(stmt):
+            return stmt
+        statements = self._eliminate([stmt])
+        return stmt if len(statements) == 1 else StatementSequence(statements)
+
+    def _is_barrier(self, stmt):
+        if isinstance(stmt, (Assignment, ReadlnStatement, WritelnStatement, ArrayAssignment)):
+            site = stmt
+        elif isinstance(stmt, IfStatement):
+            site = stmt.condition
+        elif isinstance(stmt, ForStatement):
+            site = stmt.init
+        else:
+            return True
+        # Uma chamada pode alterar qualquer variável
+        return any(isinstance(node, ProcedureCall) for node in iter_nodes(site))
+
+    def _sites(self, stmt):
+        # (nó dono, campo, pode ser substituída por inteiro) de cada expressão avaliada pela instrução
+        if isinstance(stmt, Assignment):
+            # `Funcao := variavel` é tratado pelo gerador como o retorno da função
+            return [(stmt, 'value', stmt.target.name != self.function_name)]
+        if isinstance(stmt, IfStatement):
+            return [(stmt, 'condition', True)]
+        if isinstance(stmt, ForStatement):
+            return [(stmt.init, 'value', True)]
+        return []
+
+    def _written(self, stmt):
+        if isinstance(stmt, Assignment):
+            return {stmt.target.name}
+        if isinstance(stmt, ForStatement):
+            return {stmt.init.target.name}
+        if isinstance(stmt, ArrayAssignment):
+            return {stmt.array_id}
+        if isinstance(stmt, ReadlnStatement):
+            return {param.name for param in stmt.params if isinstance(param, Identifier)} | \
+                   {param.id_name for param in stmt.params if isinstance(param, ArrayId)}
+        return set()
+
+    def _eliminate(self, block):
+        if not block:
+            return block
+        self.numbers = {}
+        versions = {}
+        writes = []
+        # Por site: (índice da instrução, dono, campo, raiz substituível, {id(nó): (número, tipo)})
+        sites = []
+        counts = {}
+        for index, stmt in enumerate(block):
+            for owner, field, whole in self._sites(stmt):
+                numbered = self._number(getattr(owner, field), versions)
+                sites.append((index, owner, field, whole, numbered))
+                for number, _, _ in numbered.values():
+                    counts[number] = counts.get(number, 0) + 1
+            written = self._written(stmt)
+            writes.append(written)
+            for name in written:
+                versions[name] = versions.get(name, 0) + 1
+
+        # Ocorrências maximais das expressões repetidas: (índice, nó pai, campo, nó, tipo, custo)
+        uses = {}
+        for index, owner, field, whole, numbered in sites:
+            stack = [(owner, field, whole)]
+            while stack:
+                parent, parent_field, replaceable = stack.pop()
+                expr = getattr(parent, parent_field)
+                number, type_name, cost = numbered.get(id(expr), (None, None, 0))
+                if number is not None and replaceable and counts[number] > 1:
+                    uses.setdefault(number, []).append((index, parent, parent_field, expr, type_name, cost))
+                elif isinstance(expr, BinaryOp):
+                    stack.append((expr, 'right', True))
+                    stack.append((expr, 'left', True))
+
+        inserted = {}
+        for number, occurrences in uses.items():
+            if len(occurrences) < 2:
+                continue
+            first_index, first_parent, first_field, first_expr, type_name, cost = occurrences[0]
+            last_index = occurrences[-1][0]
+            holder = None
+            if isinstance(first_parent, Assignment) and first_field == 'value':
+                name = first_parent.target.name
+                # Só serve uma variável do mesmo tipo (um real guardaria `a * b` inteiro como real)
+                if first_index < last_index and self._lookup(name) == type_name and \
+                   not any(name in writes[i] for i in range(first_index + 1, last_index)):
+                    holder = name
+            if holder is None:
+                # Um temporário custa um store e um load por uso: só compensa se
+                # as avaliações poupadas forem mais do que isso
+                if (len(occurrences) - 1) * cost <= len(occurrences) + 1:
+                    continue
+                holder = self._new_temp(type_name)
+                inserted.setdefault(first_index, []).append(Assignment(Identifier(holder), first_expr))
+                setattr(first_parent, first_field, Identifier(holder))
+            for _, parent, field, *_ in occurrences[1:]:
+                setattr(parent, field, Identifier(holder))
+            self.rewrites['subexpression'] += len(occurrences) - 1
+
+        statements = []
+        for index, stmt in enumerate(block):
+            statements.extend(inserted.get(index, ()))
+            statements.append(stmt)
+        return statements
+
+    def _number(self, root, versions):
+        # Número de valor, tipo e custo (instruções emitidas) dos nós de tipo
+        # inteiro/booleano (BinaryOp e length()), de baixo para cima
+        types = self._types(root)
+        values = {}
+        costs = {}
+        numbered = {}
+        stack = [(root, False)]
+        while stack:
+            node, ready = stack.pop()
+            if isinstance(node, BinaryOp):
+                if not ready:
+                    stack.append((node, True))
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+                    continue
+                left, right = values[id(node.left)], values[id(node.right)]
+                key = None if left is None or right is None else ('op', node.operator, left, right)
+                cost = costs[id(node.left)] + costs[id(node.right)] + (2 if node.operator == Operator.NE else 1)
+            elif isinstance(node, Literal):
+                key = ('literal', node.type_name, type(node.value), node.value)
+                cost = 1
+            elif isinstance(node, Identifier):
+                key = ('var', node.name, versions.get(node.name, 0))
+                cost = 1
+            elif isinstance(node, LengthFunction) and isinstance(node.expression, Identifier):
+                name = node.expression.name
+                key = ('length', name, versions.get(name, 0))
+                cost = 2
+            else:
+                key = None
+                cost = 1
+            number = None if key is None else self.numbers.setdefault(key, len(self.numbers))
+            values[id(node)] = number
+            costs[id(node)] = cost
+            if number is not None and types[id(node)] is not None and isinstance(node, (BinaryOp, LengthFunction)):
+                numbered[id(node)] = (number, types[id(node)], cost)
+        return numbered
+
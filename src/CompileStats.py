@@ -0,0 +1,67 @@
+"""Per-phase compile statistics for main.py --stats.
+
+Each phase records wall time, CPU time and the peak memory allocated
+while it ran (tracemalloc), plus any counts attached to it (AST nodes,
+emitted instructions).
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from ASTNode import ASTNode
+
+
+def count_nodes(root):
+    count = 0
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            count += 1
+            stack.extend(getattr(value, name) for name in value._fields)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return count
+
+
+class CompileStats:
+    def __init__(self):
+        self.phases = []
+        tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name):
+        record = {"phase": name}
+        self.phases.append(record)
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] = (time.perf_counter() - wall) * 1000
+            record["cpu_ms"] = (time.process_time() - cpu) * 1000
+            record["peak_kib"] = (tracemalloc.get_traced_memory()[1] - base) / 1024
+
+    def stop(self):
+        tracemalloc.stop()
+
+    def report(self, fmt='text'):
+        totals = {"wall_ms": sum(p["wall_ms"] for p in self.phases),
+                  "cpu_ms": sum(p["cpu_ms"] for p in self.phases),
+                  "peak_kib": max((p["peak_kib"] for p in self.phases), default=0)}
+        if fmt == 'json':
+            return json.dumps({"phases": self.phases, "total": totals}, indent=2)
+
+        lines = [f"{'phase':<12}{'wall ms':>10}{'cpu ms':>10}{'peak KiB':>11}  counts"]
+        for p in self.phases:
+            counts = ', '.join(f"{k}={v}" for k, v in p.items()
+                               if k not in ("phase", "wall_ms", "cpu_ms", "peak_kib", "passes", "notes"))
+            lines.append(f"{p['phase']:<12}{p['wall_ms']:>10.2f}{p['cpu_ms']:>10.2f}{p['peak_kib']:>11.1f}  {counts}")
+            # Passes do otimizador, uma linha cada por baixo da fase
+            for opt_pass in p.get("passes", ()):
+                lines.append(f"  {opt_pass['name']:<10}{opt_pass['ms']:>10.2f}{'':>21}  "
+                             f"runs={opt_pass['runs']}, rewrites={opt_pass['rewrites']}")
+        lines.append(f"{'total':<12}{totals['wall_ms']:>10.2f}{totals['cpu_ms']:>10.2f}{totals['peak_kib']:>11.1f}")
+        return '\n'.join(lines)
@@ -0,0 +1,185 @@
+from ASTNode import *
+from ASTOptimizer import ASTOptimizer
+from ASTUtils import assigned_names, exits_loop
+
+
+class ConstantPropagation(ASTOptimizer):
+    """Flow-sensitive constant and copy propagation.
+
+    self.env maps a variable name to what is known about it at the current
+    point: a NUMBER/BOOLEAN Literal (constant) or an Identifier (copy of
+    another variable). Uses of known variables are replaced before the
+    inherited folding runs on the enclosing expression.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.env = {}
+        self.function_name = None
+
+    def optimize_Block(self, node):
+        self.env = {}
+        node.var_decl_part = yield node.var_decl_part
+        if node.proc_func_part:
+            optimized_procs = []
+            for proc_or_func in node.proc_func_part:
+                optimized_procs.append((yield proc_or_func))
+            node.proc_func_part = optimized_procs
+        if node.extra_var_decl:
+            node.extra_var_decl = yield node.extra_var_decl
+
+        # Um subprograma pode ser chamado de qualquer ponto: nada se sabe à entrada
+        self.env = {}
+        node.statement_part = yield node.statement_part
+        return node
+
+    def optimize_FunctionDeclaration(self, node):
+        enclosing = self.function_name
+        self.function_name = node.heading.name
+        node.heading = yield node.heading
+        node.block = yield node.block
+        self.function_name = enclosing
+        return node
+
+    def optimize_Identifier(self, node):
+        fact = self.env.get(node.name)
+        if fact is None:
+            return node
+        if isinstance(fact, Literal):
+            return Literal(fact.value, fact.type_name)
+        return Identifier(fact.name)
+
+    def optimize_ArrayId(self, node):
+        # O gerador precisa de uma variável como índice; o nome do array pode seguir uma cópia
+        fact = self.env.get(node.id_name)
+        if isinstance(fact, Identifier):
+            return ArrayId(fact.name, node.expression)
+        return node
+
+    def optimize_ProcedureCall(self, node):
+        # Os argumentos ficam como estão (o gerador espera variáveis) e a chamada
+        # pode alterar globais ou parâmetros por referência
+        self.env = {}
+        return node
+
+    def optimize_Assignment(self, node):
+        name = node.target.name
+        is_result = name == self.function_name
+        # `Funcao := variavel` é o retorno da função, que o gerador só trata com um Identifier
+        if not (is_result and isinstance(node.value, Identifier)):
+            node.value = yield node.value
+
+        self._kill(name)
+        if not is_result:
+            value = node.value
+            if isinstance(value, Literal) and value.type_name in ('NUMBER', 'BOOLEAN'):
+                self.env[name] = value
+            elif isinstance(value, Identifier) and value.name != name:
+                self.env[name] = value
+        return node
+
+    def optimize_ReadlnStatement(self, node):
+        for param in node.params:
+            if isinstance(param, Identifier):
+                self._kill(param.name)
+        return node
+
+    def optimize_IfStatement(self, node):
+        node.condition = yield node.condition
+
+        if self._is_bool(node.condition):
+            return (yield node.then_branch if node.condition.value else node.else_branch)
+
+        entry = self.env
+        self.env = dict(entry)
+        node.then_branch = yield node.then_branch
+        then_env = self.env
+        self.env = dict(entry)
+        if node.else_branch:
+            node.else_branch = yield node.else_branch
+        self.env = self._meet(then_env, self.env)
+        return node
+
+    def optimize_WhileStatement(self, node):
+        # Pela aresta de retorno do ciclo, o que o corpo altera deixa de ser conhecido
+        before = dict(self.env)
+        self._kill_assigned(node)
+        node.condition = yield node.condition
+
+        if self._is_bool(node.condition, False):
+            self.env = before
+            return None
+
+        entry = self.env
+        self.env = dict(entry)
+        node.body = yield node.body
+        self.env = entry
+        return node
+
+    def optimize_RepeatStatement(self, node):
+        self._kill_assigned(node)
+        entry = self.env
+        self.env = dict(entry)
+        node.body = yield node.body
+        # A condição também é avaliada depois de um `continue`: usa só o que vale em todo o ciclo
+        self.env = entry
+        node.condition = yield node.condition
+
+        if self._is_bool(node.condition, True) and not exits_loop(node.body):
+            return node.body
+        return node
+
+    def optimize_ForStatement(self, node):
+        node.init = yield node.init
+        self._kill_assigned(node)
+        node.limit = yield node.limit
+
+        entry = self.env
+        self.env = dict(entry)
+        node.body = yield node.body
+        self.env = entry
+        return node
+
+    def optimize_CaseStatement(self, node):
+        node.expression = yield node.expression
+
+        if isinstance(node.expression, Literal):
+            for option in node.case_list:
+                label = option.value
+                if isinstance(label, Literal) and label.type_name == node.expression.type_name \
+                        and label.value == node.expression.value:
+                    return (yield option.statement)
+
+        # Sem ramo por omissão: o estado à saída inclui o de nenhuma opção escolhida
+        entry = self.env
+        exit_env = entry
+        for option in node.case_list:
+            self.env = dict(entry)
+            option.statement = yield option.statement
+            exit_env = self._meet(exit_env, self.env)
+        self.env = exit_env
+        return node
+
+    def _kill(self, name):
+        self.env.pop(name, None)
+        for other, fact in list(self.env.items()):
+            if isinstance(fact, Identifier) and fact.name == name:
+                del self.env[other]
+
+    def _kill_assigned(self, node):
+        names, has_call = assigned_names(node)
+        if has_call:
+            self.env = {}
+        for name in names:
+            self._kill(name)
+
+    def _meet(self, left, right):
+        return {name: fact for name, fact in left.items()
+                if name in right and self._same_fact(fact, right[name])}
+
+    def _same_fact(self, a, b):
+        if isinstance(a, Literal) and isinstance(b, Literal):
+            return a.type_name == b.type_name and a.value == b.value
+        if isinstance(a, Identifier) and isinstance(b, Identifier):
+            return a.name == b.name
+        return False
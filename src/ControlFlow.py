@@ -0,0 +1,211 @@
+"""Basic blocks and control-flow graph of EWVM code, and the optimizations done on it."""
+from collections import Counter
+
+from Instructions import Instructions, Op
+
+# Instruções que acabam um bloco: depois delas só se entra por uma etiqueta
+TERMINATORS = {Op.JUMP, Op.JZ, Op.RETURN, Op.STOP}
+# As que não deixam seguir para o bloco seguinte
+NO_FALLTHROUGH = {Op.JUMP, Op.RETURN, Op.STOP}
+# Um salto para um bloco só com uma destas pode ser substituído por ela
+EXITS = {Op.RETURN, Op.STOP}
+
+
+class BasicBlock:
+    """Labels followed by straight-line code; only the last instruction jumps."""
+
+    __slots__ = ('labels', 'code', 'successors', 'predecessors')
+
+    def __init__(self):
+        self.labels = []
+        self.code = []
+        self.successors = []
+        self.predecessors = []
+
+    @property
+    def terminator(self):
+        if self.code and self.code[-1][0] in TERMINATORS:
+            return self.code[-1]
+        return None
+
+    def falls_through(self):
+        return not self.code or self.code[-1][0] not in NO_FALLTHROUGH
+
+    def __repr__(self):
+        names = ','.join(label.name for label in self.labels)
+        return f"<BasicBlock {names or '-'}: {len(self.code)} instructions>"
+
+
+class ControlFlowGraph:
+    """Blocks of a whole .vm program in their layout order.
+
+    Entries are the first block and the blocks of subprograms (labels
+    pushed with pusha); a `call` does not end a block, since execution
+    continues after it when the subprogram returns. A pusha of a label
+    not defined in the code (a subprogram the generator emitted no body
+    for) is left as an external reference.
+    """
+
+    def __init__(self, code):
+        self.blocks = []
+        current = None
+        for op, arg in code:
+            if op is Op.LABEL:
+                if current is None or current.code:
+                    current = BasicBlock()
+                    self.blocks.append(current)
+                current.labels.append(arg)
+                continue
+            if current is None:
+                current = BasicBlock()
+                self.blocks.append(current)
+            current.code.append((op, arg))
+            if op in TERMINATORS:
+                current = None
+        self.link()
+
+    def link(self):
+        self.block_of = {label: block for block in self.blocks for label in block.labels}
+        for block in self.blocks:
+            block.successors = []
+            block.predecessors = []
+        self.entries = [self.blocks[0]] if self.blocks else []
+        for index, block in enumerate(self.blocks):
+            terminator = block.terminator
+            if terminator and terminator[0] in (Op.JUMP, Op.JZ):
+                block.successors.append(self.block_of[terminator[1]])
+            if block.falls_through() and index + 1 < len(self.blocks):
+                block.successors.append(self.blocks[index + 1])
+            for op, arg in block.code:
+                if op is Op.PUSHA and arg in self.block_of:
+                    self.entries.append(self.block_of[arg])
+        for block in self.blocks:
+            for successor in block.successors:
+                successor.predecessors.append(block)
+
+    def references(self):
+        refs = Counter()
+        for block in self.blocks:
+            for op, arg in block.code:
+                if op in (Op.JUMP, Op.JZ, Op.PUSHA):
+                    refs[arg] += 1
+        return refs
+
+    def instructions(self):
+        code = Instructions()
+        for block in self.blocks:
+            for label in block.labels:
+                code.emit(Op.LABEL, label)
+            for op, arg in block.code:
+                code.emit(op, arg)
+        return code
+
+
+class ControlFlowOptimizer:
+    """Jump threading, unreachable block removal, block merging and dead labels.
+
+    - a jump to a block that only jumps again goes straight to the final
+      target, and a jump to a block that only returns/stops is replaced by
+      that instruction;
+    - blocks not reachable from an entry are removed;
+    - a block with a single predecessor is appended to it when that
+      predecessor falls through or jumps to it and nothing else can; a
+      block reached by a jump is moved only if it does not fall through;
+    - labels no instruction refers to are dropped.
+    The passes repeat until none changes the graph; self.applied counts
+    what each one did.
+    """
+
+    def __init__(self):
+        self.applied = Counter()
+
+    def optimize(self, code):
+        cfg = ControlFlowGraph(code)
+        changed = bool(cfg.blocks)
+        while changed:
+            changed = False
+            for transform in (self.thread_jumps, self.remove_unreachable, self.merge_blocks):
+                if transform(cfg):
+                    cfg.link()
+                    changed = True
+        self.remove_dead_labels(cfg)
+        return cfg.instructions()
+
+    def thread_jumps(self, cfg):
+        changed = False
+        for block in cfg.blocks:
+            terminator = block.terminator
+            if not terminator or terminator[0] not in (Op.JUMP, Op.JZ):
+                continue
+            op, target = terminator
+            seen = {target}
+            final = cfg.block_of[target]
+            while len(final.code) == 1 and final.code[0][0] is Op.JUMP and final.code[0][1] not in seen:
+                target = final.code[0][1]
+                seen.add(target)
+                final = cfg.block_of[target]
+            if op is Op.JUMP and len(final.code) == 1 and final.code[0][0] in EXITS:
+                block.code[-1] = final.code[0]
+                self.applied['jump-to-exit'] += 1
+                changed = True
+            elif target is not terminator[1]:
+                block.code[-1] = (op, target)
+                self.applied['threaded'] += 1
+                changed = True
+        return changed
+
+    def remove_unreachable(self, cfg):
+        reachable = set()
+        stack = list(cfg.entries)
+        while stack:
+            block = stack.pop()
+            if id(block) not in reachable:
+                reachable.add(id(block))
+                stack.extend(block.successors)
+        removed = [block for block in cfg.blocks if id(block) not in reachable]
+        if not removed:
+            return False
+        cfg.blocks = [block for block in cfg.blocks if id(block) in reachable]
+        self.applied['unreachable-block'] += len(removed)
+        return True
+
+    def merge_blocks(self, cfg):
+        entries = {id(block) for block in cfg.entries}
+        merged = False
+        index = 0
+        while index < len(cfg.blocks):
+            block = cfg.blocks[index]
+            successor = block.successors[0] if len(block.successors) == 1 else None
+            if successor is None or successor is block or id(successor) in entries or \
+               len(successor.predecessors) != 1:
+                index += 1
+                continue
+            adjacent = index + 1 < len(cfg.blocks) and cfg.blocks[index + 1] is successor
+            terminator = block.terminator
+            if terminator is None:
+                # Segue para o bloco seguinte sem saltar
+                if not adjacent:
+                    index += 1
+                    continue
+            elif terminator[0] is not Op.JUMP or not (adjacent or not successor.falls_through()):
+                index += 1
+                continue
+            else:
+                block.code.pop()
+            block.code.extend(successor.code)
+            cfg.blocks.remove(successor)
+            # As arestas do sucessor passam a sair deste bloco, que pode voltar a juntar-se
+            block.successors = successor.successors
+            for target in block.successors:
+                target.predecessors = [block if pred is successor else pred for pred in target.predecessors]
+            self.applied['merged-block'] += 1
+            merged = True
+        return merged
+
+    def remove_dead_labels(self, cfg):
+        refs = cfg.references()
+        for block in cfg.blocks:
+            live = [label for label in block.labels if refs[label]]
+            if len(live) < len(block.labels):
+                self.applied['dead-label'] += len(block.labels) - len(live)
+                block.labels = live
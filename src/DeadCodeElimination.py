@@ -0,0 +1,256 @@
+from ASTNode import *
+from ASTOptimizer import ASTOptimizer
+from ASTUtils import declared_names, iter_nodes, used_names
+from CommonSubexpressions import CommonSubexpressionElimination
+from LoopInvariantMotion import LoopInvariantMotion
+
+# Temporários criados pelos passes: declarados no bloco, sem significado para o programa
+TEMP_PREFIXES = (LoopInvariantMotion.temp_prefix, CommonSubexpressionElimination.temp_prefix)
+
+
+class DeadCodeElimination(ASTOptimizer):
+    """Dead store and unreachable statement elimination, driven by liveness.
+
+    Statements are visited backwards: on entry to a statement handler
+    self.live holds the variables live after it, on exit the ones live
+    before it. Only variables declared in the enclosing block can have
+    their stores removed; any call makes all of them live. With
+    self.transform False the handlers only compute liveness (used for the
+    fixed point of loop bodies). Compiler temporaries left with no use in
+    their block are taken out of its var section.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.live = set()
+        self.locals = set()
+        self.transform = True
+        # Por ciclo: (vivas depois de um break, vivas depois de um continue)
+        self.loops = []
+
+    def optimize_Block(self, node):
+        enclosing = self.locals
+        if node.proc_func_part:
+            optimized_procs = []
+            for proc_or_func in node.proc_func_part:
+                optimized_procs.append((yield proc_or_func))
+            node.proc_func_part = optimized_procs
+
+        # No fim do corpo nenhuma variável local está viva
+        self.locals = declared_names(node.var_decl_part) | declared_names(node.extra_var_decl)
+        self.live = set()
+        node.statement_part = yield node.statement_part
+        self.locals = enclosing
+        self._drop_unused_temps(node)
+        return node
+
+    def optimize_StatementSequence(self, node):
+        statements = node.statements
+        for i, stmt in enumerate(statements):
+            if isinstance(stmt, (BreakStatement, ContinueStatement)) and i + 1 < len(statements):
+                if self.transform:
+                    self.rewrites['unreachable'] += len(statements) - i - 1
+                    statements = statements[:i + 1]
+                break
+
+        kept = []
+        for stmt in reversed(statements):
+            optimized_stmt = yield stmt
+            if optimized_stmt:
+                kept.append(optimized_stmt)
+        if self.transform:
+            kept.reverse()
+            node.statements = kept
+        return node
+
+    def optimize_Assignment(self, node):
+        name = node.target.name
+        reads, has_call = self._uses(node.value)
+        if self.transform and name in self.locals and name not in self.live and not has_call:
+            return None
+        self.live.discard(name)
+        self.live |= reads
+        return node
+
+    def optimize_ArrayAssignment(self, node):
+        self.live |= self._uses(node.index)[0] | self._uses(node.value)[0]
+        self.live.add(node.array_id)
+        return node
+
+    def optimize_ReadlnStatement(self, node):
+        for param in node.params:
+            if isinstance(param, Identifier):
+                self.live.discard(param.name)
+            else:
+                self.live |= self._uses(param)[0]
+        return node
+
+    def optimize_WritelnStatement(self, node):
+        for param in node.params:
+            self.live |= self._uses(param)[0]
+        return node
+
+    def optimize_ProcedureCall(self, node):
+        self.live |= self._uses(node)[0]
+        return node
+
+    def optimize_BreakStatement(self, node):
+        if self.loops:
+            self.live = set(self.loops[-1][0])
+        return node
+
+    def optimize_ContinueStatement(self, node):
+        if self.loops:
+            self.live = set(self.loops[-1][1])
+        return node
+
+    def optimize_IfStatement(self, node):
+        live_out = self.live
+        self.live = set(live_out)
+        then_branch = yield node.then_branch
+        live_then = self.live
+        self.live = set(live_out)
+        else_branch = yield node.else_branch
+        cond_reads, cond_call = self._uses(node.condition)
+        self.live |= live_then | cond_reads
+
+        if self.transform:
+            node.then_branch = then_branch
+            node.else_branch = else_branch
+            if self._is_empty(then_branch) and self._is_empty(else_branch) and not cond_call:
+                self.live = live_out
+                return None
+        return node
+
+    def optimize_CaseStatement(self, node):
+        live_out = self.live
+        live_in = set(live_out)
+        for option in node.case_list:
+            self.live = set(live_out)
+            statement = yield option.statement
+            if self.transform:
+                option.statement = statement
+            live_in |= self.live
+        self.live = live_in | self._uses(node.expression)[0]
+        return node
+
+    def optimize_WhileStatement(self, node):
+        live_out = self.live
+        cond_reads = self._uses(node.condition)[0]
+        if not self.transform:
+            self.live = live_out | self._uses(node)[0]
+            return node
+
+        # Ponto fixo: vivas no teste do ciclo = saída + condição + entrada do corpo
+        header = live_out | cond_reads
+        while True:
+            self.live = set(header)
+            self.loops.append((live_out, header))
+            yield from self._analyze(node.body)
+            self.loops.pop()
+            new_header = live_out | cond_reads | self.live
+            if new_header == header:
+                break
+            header = new_header
+
+        self.live = set(header)
+        self.loops.append((live_out, header))
+        node.body = yield node.body
+        self.loops.pop()
+        self.live = set(header)
+        return node
+
+    def optimize_RepeatStatement(self, node):
+        live_out = self.live
+        cond_reads = self._uses(node.condition)[0]
+        if not self.transform:
+            self.live = live_out | self._uses(node)[0]
+            return node
+
+        # O fim do corpo (onde também vai parar um continue) avalia a condição
+        # e volta ao início do corpo ou sai
+        header = set()
+        while True:
+            bottom = live_out | cond_reads | header
+            self.live = set(bottom)
+            self.loops.append((live_out, bottom))
+            yield from self._analyze(node.body)
+            self.loops.pop()
+            if self.live == header:
+                break
+            header = self.live
+
+        self.live = set(bottom)
+        self.loops.append((live_out, bottom))
+        node.body = yield node.body
+        self.loops.pop()
+        self.live = set(header)
+        return node
+
+    def optimize_ForStatement(self, node):
+        live_out = self.live
+        var = node.init.target.name
+        # Em cada volta o ciclo lê a variável de controlo e o limite
+        loop_reads = {var} | self._uses(node.limit)[0]
+        if not self.transform:
+            header = live_out | self._uses(node)[0]
+        else:
+            header = live_out | loop_reads
+            while True:
+                self.live = header | {var}
+                self.loops.append((live_out, header | {var}))
+                yield from self._analyze(node.body)
+                self.loops.pop()
+                new_header = live_out | loop_reads | self.live
+                if new_header == header:
+                    break
+                header = new_header
+
+            self.live = header | {var}
+            self.loops.append((live_out, header | {var}))
+            node.body = yield node.body
+            self.loops.pop()
+
+        # A atribuição inicial faz parte do ciclo e nunca é removida
+        self.live = (header - {var}) | self._uses(node.init.value)[0]
+        return node
+
+    def _drop_unused_temps(self, block):
+        # Um temporário do LICM/CSE cujos usos foram entretanto removidos
+        # continuaria a ocupar uma célula da VM
+        used = {ident.name for ident in iter_nodes([block.statement_part, block.proc_func_part])
+                if isinstance(ident, Identifier)}
+        for decl_part in (block.var_decl_part, block.extra_var_decl):
+            if not decl_part or not decl_part.declarations:
+                continue
+            kept = []
+            for declaration in decl_part.declarations:
+                ids = [ident for ident in declaration.id_list
+                       if not (isinstance(ident, Identifier) and ident.name.startswith(TEMP_PREFIXES)
+                               and ident.name not in used)]
+                self.rewrites['unused temporary'] += len(declaration.id_list) - len(ids)
+                declaration.id_list = ids
+                if ids:
+                    kept.append(declaration)
+            decl_part.declarations = kept
+
+    def _is_empty(self, stmt):
+        if isinstance(stmt, StatementPart):
+            stmt = stmt.statement_sequence
+        if isinstance(stmt, StatementSequence):
+            return not stmt.statements
+        return not stmt
+
+    def _analyze(self, node):
+        transform = self.transform
+        self.transform = False
+        yield node
+        self.transform = transform
+
+    def _uses(self, node):
+        if node is None:
+            return set(), False
+        names, has_call = used_names(node)
+        if has_call:
+            names |= self.locals
+        return names, has_call
@@ -0,0 +1,56 @@
+"""VM cells of the variables of the program and of each subprogram, laid out from their declarations."""
+from ASTNode import *
+from Instructions import Op
+
+
+class FrameLayout:
+    """Fixed offsets of the variables of one scope.
+
+    The globals of the program, and the result and local variables of a
+    subprogram, take cells 0, 1, ... in declaration order; the parameters
+    of a subprogram sit below fp (-n .. -1) in the order they are pushed.
+    The layout is computed before the code of the scope is generated, so
+    the frame is reserved with a single pushn and every access is one
+    lookup in self.offsets. An array takes a single cell, the one its
+    reads and uses share.
+    """
+
+    __slots__ = ('offsets', 'size', 'load', 'store')
+
+    def __init__(self, load=Op.PUSHG, store=Op.STOREG):
+        self.offsets = {}
+        self.size = 0
+        self.load = load
+        self.store = store
+
+    @classmethod
+    def for_program(cls, program):
+        layout = cls()
+        layout.declare(program.block.var_decl_part)
+        layout.declare(program.block.extra_var_decl)
+        return layout
+
+    @classmethod
+    def for_subprogram(cls, subprogram):
+        layout = cls(Op.PUSHL, Op.STOREL)
+        params = subprogram.heading.params
+        for index, param in enumerate(params):
+            layout.offsets[param.name] = index - len(params)
+        if isinstance(subprogram, FunctionDeclaration):
+            # O resultado é a primeira variável local
+            layout.add(subprogram.heading.name)
+        layout.declare(subprogram.block.var_decl_part)
+        layout.declare(subprogram.block.extra_var_decl)
+        return layout
+
+    def add(self, name):
+        if name not in self.offsets:
+            self.offsets[name] = self.size
+            self.size += 1
+
+    def declare(self, var_decl_part):
+        if var_decl_part and var_decl_part.declarations:
+            for declaration in var_decl_part.declarations:
+                for ident in declaration.id_list:
+                    # `v[n]: tipo` (rejeitado pela análise semântica) também fica com uma célula
+                    self.add(ident.id_name if isinstance(ident, ArrayId) else ident.name)
@@ -0,0 +1,249 @@
+import copy
+
+from ASTNode import *
+from ASTOptimizer import ASTOptimizer
+from ASTUtils import assigned_names, declare_variables, iter_nodes, used_names
+from CompileStats import count_nodes
+
+# Tamanho máximo (nós da AST do corpo, já com as suas chamadas expandidas) de
+# um subprograma chamado em mais de um sítio para ser expandido
+DEFAULT_THRESHOLD = 40
+
+
+class Inliner(ASTOptimizer):
+    """Inline expansion of the program's functions and procedures.
+
+    Each call statement (`P(args)` or `x := F(args)`) is replaced by the
+    callee's body, with parameters, local variables and the function result
+    renamed to fresh variables of the caller (_inlN_name) and the arguments
+    assigned to the parameters first. A subprogram called from one place is
+    always expanded; one called from several only up to `threshold` nodes.
+
+    The generator passes call results to writeln on the stack in programs
+    that have subprograms, so expanding some calls and keeping others would
+    break their output: either every subprogram is expanded and removed, or
+    nothing changes. The reason is recorded in self.notes, as is every
+    expanded call.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        super().__init__()
+        self.threshold = threshold
+        self.notes = []
+        self.names = set()
+        self.counter = 0
+
+    def optimize_Program(self, node):
+        block = node.block
+        subprograms = {sub.heading.name: sub for sub in block.proc_func_part or ()}
+        if not subprograms:
+            return node
+        self.names = {ident.name for ident in iter_nodes(node) if isinstance(ident, (Identifier, Parameter))}
+        self.names.update(subprograms)
+
+        # Corpos onde há chamadas a expandir: os subprogramas e o programa principal
+        bodies = {name: sub.block for name, sub in subprograms.items()}
+        bodies[node.header.program_name] = block
+        calls = {caller: self._call_sites(body.statement_part, subprograms) for caller, body in bodies.items()}
+
+        reason = self._check(subprograms, bodies, calls)
+        order = None if reason else self._leaves_first(subprograms, calls)
+        if order is None:
+            self.notes.append(f"not inlining: {reason or 'recursive calls'}")
+            return node
+
+        # Tamanho de cada subprograma depois de expandidas as chamadas que faz
+        sizes = {}
+        for name in order:
+            body = subprograms[name].block.statement_part
+            sizes[name] = count_nodes(body) + sum(sizes[callee] - 1 for callee in calls[name])
+            sites = sum(callees.count(name) for callees in calls.values())
+            if sites > 1 and sizes[name] > self.threshold:
+                self.notes.append(f"not inlining: {name} ({sizes[name]} nodes, {sites} calls) "
+                                  f"is above the inline threshold ({self.threshold})")
+                return node
+
+        for name in order:
+            for caller, body in bodies.items():
+                if name in calls[caller]:
+                    declarations = []
+                    self._expand_calls(body.statement_part, subprograms[name], declarations)
+                    declare_variables(body, declarations)
+                    count = calls[caller].count(name)
+                    self.notes.append(f"inlined {name} into {caller} "
+                                      f"({count} call{'s' if count != 1 else ''}, {sizes[name]} nodes)")
+                    self.rewrites['ProcedureCall'] += count
+            if not any(name in callees for callees in calls.values()):
+                self.notes.append(f"removed unused {name}")
+            del bodies[name]
+        block.proc_func_part = []
+        return node
+
+    def _check(self, subprograms, bodies, calls):
+        for name, sub in subprograms.items():
+            if sub.block.proc_func_part:
+                return f"{name} has nested subprograms"
+            declarations = sub.block.var_decl_part.declarations if sub.block.var_decl_part else []
+            if not all(isinstance(decl.type_name, Type) and all(isinstance(ident, Identifier) for ident in decl.id_list)
+                       for decl in declarations) or \
+               not all(isinstance(param.type_name, Type) for param in sub.heading.params):
+                return f"{name} has array parameters or variables"
+        for caller, callees in calls.items():
+            if callees is None:
+                return f"a call in {caller} is not a statement or the whole value of an assignment"
+        for caller, body in bodies.items():
+            # Uma função sem argumentos também pode ser chamada só pelo nome
+            targets = {id(stmt.target) for stmt in iter_nodes(body.statement_part) if isinstance(stmt, Assignment)}
+            for ident in iter_nodes(body.statement_part):
+                if isinstance(ident, Identifier) and ident.name in subprograms and \
+                        not (ident.name == caller and id(ident) in targets):
+                    return f"{ident.name} is called without parentheses in {caller}"
+        for caller, callees in calls.items():
+            for callee in set(callees):
+                # Os nomes globais usados pelo subprograma não podem estar escondidos no chamador
+                if caller in subprograms and self._free_names(subprograms[callee]) & self._local_names(subprograms[caller]):
+                    return f"{callee} uses a global variable hidden by a local of {caller}"
+        return None
+
+    def _call_sites(self, statement_part, subprograms):
+        # Subprogramas chamados (uma entrada por chamada), ou None se alguma chamada
+        # aparecer fora de uma instrução `P(args)` ou `x := F(args)` ou tiver outra nos argumentos
+        callees = []
+        stack = [statement_part]
+        while stack:
+            stmt = stack.pop()
+            call = self._call(stmt, subprograms)
+            if call is None:
+                stack.extend(self._children(stmt))
+            elif len(call.params or ()) != len(subprograms[call.procedure_name].heading.params):
+                return None
+            else:
+                callees.append(call.procedure_name)
+        calls = sum(1 for node in iter_nodes(statement_part)
+                    if isinstance(node, ProcedureCall) and node.procedure_name in subprograms)
+        return callees if calls == len(callees) else None
+
+    def _call(self, stmt, subprograms):
+        if isinstance(stmt, Assignment):
+            stmt = stmt.value
+        if isinstance(stmt, ProcedureCall) and stmt.procedure_name in subprograms:
+            return stmt
+        return None
+
+    def _children(self, stmt):
+        # Instruções contidas diretamente numa instrução composta
+        if isinstance(stmt, StatementPart):
+            return [stmt.statement_sequence]
+        if isinstance(stmt, StatementSequence):
+            return list(stmt.statements)
+        if isinstance(stmt, IfStatement):
+            return [branch for branch in (stmt.then_branch, stmt.else_branch) if branch]
+        if isinstance(stmt, (WhileStatement, RepeatStatement, ForStatement)):
+            return [stmt.body]
+        if isinstance(stmt, CaseStatement):
+            return [option.statement for option in stmt.case_list]
+        return []
+
+    def _leaves_first(self, subprograms, calls):
+        # Ordem em que cada subprograma aparece depois dos que chama; None se houver recursão
+        order = []
+        state = {}
+        for root in subprograms:
+            if root in state:
+                continue
+            stack = [(root, iter(set(calls[root])))]
+            state[root] = 'open'
+            while stack:
+                name, callees = stack[-1]
+                callee = next(callees, None)
+                if callee is None:
+                    stack.pop()
+                    state[name] = 'done'
+                    order.append(name)
+                elif state.get(callee) == 'open':
+                    return None
+                elif callee not in state:
+                    state[callee] = 'open'
+                    stack.append((callee, iter(set(calls[callee]))))
+        return order
+
+    def _local_names(self, sub):
+        names = {param.name for param in sub.heading.params} | {sub.heading.name}
+        if sub.block.var_decl_part:
+            for declaration in sub.block.var_decl_part.declarations:
+                names.update(ident.id_name if isinstance(ident, ArrayId) else ident.name for ident in declaration.id_list)
+        return names
+
+    def _free_names(self, sub):
+        body = sub.block.statement_part
+        return (used_names(body)[0] | assigned_names(body)[0]) - self._local_names(sub)
+
+    def _expand_calls(self, statement_part, sub, declarations):
+        name = sub.heading.name
+        stack = [statement_part]
+        while stack:
+            stmt = stack.pop()
+            if isinstance(stmt, StatementPart):
+                stmt.statement_sequence = self._expand(stmt.statement_sequence, sub, declarations)
+                stack.append(stmt.statement_sequence)
+            elif isinstance(stmt, StatementSequence):
+                statements = []
+                for child in stmt.statements:
+                    expanded = self._expand(child, sub, declarations)
+                    if expanded is not child:
+                        statements.extend(expanded.statements)
+                    else:
+                        statements.append(child)
+                        stack.append(child)
+                stmt.statements = statements
+            elif isinstance(stmt, IfStatement):
+                stmt.then_branch = self._expand(stmt.then_branch, sub, declarations)
+                if stmt.else_branch:
+                    stmt.else_branch = self._expand(stmt.else_branch, sub, declarations)
+                stack.extend(self._children(stmt))
+            elif isinstance(stmt, (WhileStatement, RepeatStatement, ForStatement)):
+                stmt.body = self._expand(stmt.body, sub, declarations)
+                stack.append(stmt.body)
+            elif isinstance(stmt, CaseStatement):
+                for option in stmt.case_list:
+                    option.statement = self._expand(option.statement, sub, declarations)
+                    stack.append(option.statement)
+
+    def _expand(self, stmt, sub, declarations):
+        call = self._call(stmt, {sub.heading.name: sub})
+        if call is None:
+            return stmt
+
+        prefix = f"_inl{self.counter}_"
+        while any(name.startswith(prefix) for name in self.names):
+            self.counter += 1
+            prefix = f"_inl{self.counter}_"
+        self.counter += 1
+
+        rename = {}
+        variables = [(param.name, param.type_name.type_name) for param in sub.heading.params]
+        if sub.block.var_decl_part:
+            for declaration in sub.block.var_decl_part.declarations:
+                variables.extend((ident.name, declaration.type_name.type_name) for ident in declaration.id_list)
+        if isinstance(sub, FunctionDeclaration):
+            variables.append((sub.heading.name, sub.heading.return_type.type_name))
+        for name, type_name in variables:
+            rename[name] = prefix + name
+            declarations.append((prefix + name, type_name))
+        self.names.update(rename.values())
+
+        body = copy.deepcopy(sub.block.statement_part)
+        for node in iter_nodes(body):
+            if isinstance(node, Identifier):
+                node.name = rename.get(node.name, node.name)
+            elif isinstance(node, ArrayId):
+                node.id_name = rename.get(node.id_name, node.id_name)
+            elif isinstance(node, ArrayAssignment):
+                node.array_id = rename.get(node.array_id, node.array_id)
+
+        statements = [Assignment(Identifier(rename[param.name]), arg)
+                      for param, arg in zip(sub.heading.params, call.params or ())]
+        statements.extend(body.statement_sequence.statements)
+        if isinstance(stmt, Assignment):
+            statements.append(Assignment(stmt.target, Identifier(rename[sub.heading.name])))
+        return StatementSequence(statements)
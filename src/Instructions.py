@@ -0,0 +1,179 @@
+"""EWVM code as data.
+
+The Generator emits (opcode, operand) pairs into an Instructions buffer
+instead of text lines; later stages can walk and rewrite them, and
+serialize() produces the .vm text at the end.
+"""
+from array import array
+from enum import Enum
+
+
+class Label:
+    """A jump/call target. Instructions refer to the object, not its name."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Label({self.name!r})"
+
+    def __str__(self):
+        return self.name
+
+
+class Op(Enum):
+    """EWVM opcodes with the type of their operand (NoneType if they take none).
+
+    LABEL is not an instruction: it marks where its Label operand is placed.
+    """
+
+    LABEL = ('label', Label)
+    PUSHI = ('pushi', int)
+    PUSHF = ('pushf', float)
+    PUSHS = ('pushs', str)
+    PUSHG = ('pushg', int)
+    PUSHL = ('pushl', int)
+    PUSHN = ('pushn', int)
+    PUSHA = ('pusha', Label)
+    DUP = ('dup', int)
+    STOREG = ('storeg', int)
+    STOREL = ('storel', int)
+    POP = ('pop', int)
+    ADD = ('add', None)
+    SUB = ('sub', None)
+    MUL = ('mul', None)
+    DIV = ('div', None)
+    MOD = ('mod', None)
+    EQUAL = ('equal', None)
+    INF = ('inf', None)
+    INFEQ = ('infeq', None)
+    SUP = ('sup', None)
+    SUPEQ = ('supeq', None)
+    AND = ('and', None)
+    OR = ('or', None)
+    NOT = ('not', None)
+    JUMP = ('jump', Label)
+    JZ = ('jz', Label)
+    CALL = ('call', None)
+    RETURN = ('return', None)
+    START = ('start', None)
+    STOP = ('stop', None)
+    NOP = ('nop', None)
+    READ = ('read', None)
+    ATOI = ('atoi', None)
+    STRLEN = ('strlen', None)
+    CHARAT = ('charat', None)
+    WRITEI = ('writei', None)
+    WRITEF = ('writef', None)
+    WRITES = ('writes', None)
+    WRITELN = ('writeln', None)
+
+    def __init__(self, mnemonic, operand):
+        self.mnemonic = mnemonic
+        # NoneType para os opcodes sem operando: a verificação em emit é um só `type(arg) is`
+        self.operand = type(None) if operand is None else operand
+
+
+# Código numérico de cada opcode, guardado no array de Instructions
+OPS = tuple(Op)
+for _code, _op in enumerate(OPS):
+    _op.code = _code
+BY_MNEMONIC = {op.mnemonic: op for op in OPS}
+
+# Texto de cada opcode no .vm, com %s no lugar do operando
+_TEXT = tuple("%s:\n" if op is Op.LABEL else
+              f"{op.mnemonic}\n" if op.operand is type(None) else
+              f"{op.mnemonic} %s\n" for op in OPS)
+
+
+class Instructions:
+    """Append-only sequence of (Op, operand) pairs.
+
+    Opcodes are stored one byte each in an array and operands in a parallel
+    list, so a function with many thousands of instructions costs two
+    compact buffers instead of one tuple or string per instruction.
+    """
+
+    __slots__ = ('ops', 'args')
+
+    def __init__(self, pairs=()):
+        self.ops = array('B')
+        self.args = []
+        for op, arg in pairs:
+            self.emit(op, arg)
+
+    def emit(self, op, arg=None):
+        operand = op.operand
+        # bool é subclasse de int, mas `pushi True` não é EWVM válido
+        if type(arg) is not operand and (type(arg) is bool or not isinstance(arg, operand)):
+            expected = 'no operand' if operand is type(None) else operand.__name__
+            raise TypeError(f"{op.mnemonic} expects {expected}, got {arg!r}")
+        self.ops.append(op.code)
+        self.args.append(arg)
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __getitem__(self, index):
+        return OPS[self.ops[index]], self.args[index]
+
+    def __iter__(self):
+        return zip(map(OPS.__getitem__, self.ops), self.args)
+
+    def instruction_count(self):
+        # As etiquetas não são instruções
+        return len(self.ops) - self.ops.count(Op.LABEL.code)
+
+    def serialize(self):
+        text = []
+        append = text.append
+        pushs = Op.PUSHS.code
+        for code, arg in zip(self.ops, self.args):
+            if arg is None:
+                append(_TEXT[code])
+            elif code == pushs:
+                phrase = arg.replace('"', '\\"')
+                append(f'pushs "{phrase}"\n')
+            else:
+                append(_TEXT[code] % arg)
+        return ''.join(text)
+
+
+def _operand(op, text, labels):
+    if op.operand is type(None):
+        if text:
+            raise ValueError(f"{op.mnemonic} takes no operand, got {text!r}")
+        return None
+    if op.operand is Label:
+        if text not in labels:
+            labels[text] = Label(text)
+        return labels[text]
+    if op.operand is str:
+        if len(text) >= 2 and text[0] == text[-1] == '"':
+            text = text[1:-1]
+        return text.replace('\\"', '"')
+    return op.operand(text)
+
+
+def parse(text):
+    """Read .vm text back into Instructions (the inverse of serialize)."""
+    code = Instructions()
+    labels = {}
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.endswith(':') and ' ' not in line:
+            code.emit(Op.LABEL, _operand(Op.LABEL, line[:-1], labels))
+            continue
+        mnemonic, _, arg = line.partition(' ')
+        op = BY_MNEMONIC.get(mnemonic.lower())
+        if op is None or op is Op.LABEL:
+            raise ValueError(f"line {number}: unknown instruction {mnemonic!r}")
+        try:
+            code.emit(op, _operand(op, arg.strip(), labels))
+        except ValueError as error:
+            raise ValueError(f"line {number}: {error}") from error
+    return code
@@ -0,0 +1,137 @@
+from ASTNode import *
+from ASTUtils import assigned_names, expr_key
+from TempOptimizer import TempOptimizer
+
+
+class LoopInvariantMotion(TempOptimizer):
+    """Loop-invariant code motion for while, repeat and for loops.
+
+    An integer or boolean expression (BinaryOp or length() of a string
+    variable) whose variables are not written by the loop is computed once
+    into a compiler-generated temporary, declared in the enclosing block and
+    assigned just before the loop. Loops that call a subprogram are left
+    alone. Expressions that may fail (div/mod by a variable) are only moved
+    out of a while condition, which always runs at least once.
+    """
+
+    temp_prefix = '_licm'
+
+    def __init__(self):
+        super().__init__()
+        # Estado do ciclo a ser tratado
+        self.modified = set()
+        self.hoisted = {}
+
+    def optimize_StatementSequence(self, node):
+        optimized_statements = []
+        for stmt in node.statements:
+            optimized_stmt = yield stmt
+            if isinstance(optimized_stmt, StatementSequence) and isinstance(stmt, (WhileStatement, RepeatStatement, ForStatement)):
+                optimized_statements.extend(optimized_stmt.statements)
+            elif optimized_stmt:
+                optimized_statements.append(optimized_stmt)
+        node.statements = optimized_statements
+        return node
+
+    def optimize_WhileStatement(self, node):
+        result = yield from super().optimize_WhileStatement(node)
+        if result is not node:
+            return result
+        return self._hoist(node, 'condition', True)
+
+    def optimize_RepeatStatement(self, node):
+        result = yield from super().optimize_RepeatStatement(node)
+        if result is not node:
+            return result
+        return self._hoist(node, 'condition', False)
+
+    def optimize_ForStatement(self, node):
+        result = yield from super().optimize_ForStatement(node)
+        # O gerador volta a ler o limite em cada iteração
+        return self._hoist(result, 'limit', False)
+
+    def _hoist(self, loop, test_field, test_may_fail):
+        # Os ciclos interiores já foram tratados: o que era invariante também
+        # para este ciclo está agora numa atribuição antes deles
+        self.modified, has_call = assigned_names(loop)
+        if has_call:
+            return loop
+        self.hoisted = {}
+        setattr(loop, test_field, self._replace(getattr(loop, test_field), test_may_fail))
+
+        stack = [loop.body]
+        while stack:
+            stmt = stack.pop()
+            if isinstance(stmt, StatementPart):
+                stack.append(stmt.statement_sequence)
+            elif isinstance(stmt, StatementSequence):
+                stack.extend(stmt.statements)
+            elif isinstance(stmt, IfStatement):
+                stmt.condition = self._replace(stmt.condition, False)
+                stack.extend(branch for branch in (stmt.then_branch, stmt.else_branch) if branch)
+            elif isinstance(stmt, CaseStatement):
+                stack.extend(option.statement for option in stmt.case_list)
+            elif isinstance(stmt, Assignment):
+                # `Funcao := variavel` é tratado pelo gerador como o retorno da função
+                whole = stmt.target.name != self.function_name
+                stmt.value = self._replace(stmt.value, False, whole)
+
+        if not self.hoisted:
+            return loop
+        assignments = [Assignment(Identifier(name), expr) for expr, name in self.hoisted.values()]
+        return StatementSequence(assignments + [loop])
+
+    def _replace(self, expr, may_fail, whole=True):
+        facts = self._facts(expr)
+        if whole and self._is_invariant(expr, facts, may_fail):
+            return self._temp(expr, facts)
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BinaryOp):
+                for field in ('left', 'right'):
+                    child = getattr(node, field)
+                    if self._is_invariant(child, facts, may_fail):
+                        setattr(node, field, self._temp(child, facts))
+                    else:
+                        stack.append(child)
+        return expr
+
+    def _facts(self, root):
+        # Por nó (id): (tipo, invariante, pode falhar), calculado de baixo para cima
+        types = self._types(root)
+        facts = {}
+        stack = [(root, False)]
+        while stack:
+            node, ready = stack.pop()
+            if isinstance(node, BinaryOp):
+                if not ready:
+                    stack.append((node, True))
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+                    continue
+                _, left_invariant, left_fails = facts[id(node.left)]
+                _, right_invariant, right_fails = facts[id(node.right)]
+                facts[id(node)] = (types[id(node)], left_invariant and right_invariant,
+                                   left_fails or right_fails or self._may_fail(node))
+            elif isinstance(node, Literal):
+                facts[id(node)] = (types[id(node)], True, False)
+            elif isinstance(node, Identifier):
+                facts[id(node)] = (types[id(node)], node.name not in self.modified, False)
+            elif isinstance(node, LengthFunction) and isinstance(node.expression, Identifier):
+                facts[id(node)] = (types[id(node)], node.expression.name not in self.modified, False)
+            else:
+                facts[id(node)] = (None, False, False)
+        return facts
+
+    def _is_invariant(self, node, facts, may_fail):
+        if not isinstance(node, (BinaryOp, LengthFunction)):
+            return False
+        type_name, invariant, fails = facts[id(node)]
+        return type_name is not None and invariant and (may_fail or not fails)
+
+    def _temp(self, expr, facts):
+        key = expr_key(expr)
+        if key not in self.hoisted:
+            self.hoisted[key] = (expr, self._new_temp(facts[id(expr)][0]))
+        return Identifier(self.hoisted[key][1])
@@ -0,0 +1,107 @@
+import copy
+
+from ASTNode import *
+from ASTOptimizer import ASTOptimizer
+from ASTUtils import assigned_names, iter_nodes
+from CompileStats import count_nodes
+
+# Ciclos com até FULL_UNROLL_LIMIT iterações são desenrolados por completo;
+# os maiores repetem o corpo DEFAULT_FACTOR vezes por iteração
+FULL_UNROLL_LIMIT = 8
+DEFAULT_FACTOR = 4
+# Máximo de nós da AST nas cópias do corpo de um ciclo
+DEFAULT_BUDGET = 120
+
+
+class LoopUnroller(ASTOptimizer):
+    """Unrolling of for loops whose bounds are integer literals.
+
+    A loop with at most `full_limit` iterations is replaced by one copy of
+    the body per iteration, each preceded by the assignment of the control
+    variable. A longer one becomes a while loop running `factor` copies of
+    the body per test, followed by a for loop over the remaining
+    iterations. The copies of the body may not exceed `budget` AST nodes;
+    bodies that write the control variable, call a subprogram or use
+    break/continue are left alone. The control variable ends with the
+    value the generator's loop leaves in it (one past the limit).
+    """
+
+    def __init__(self, factor=DEFAULT_FACTOR, full_limit=FULL_UNROLL_LIMIT, budget=DEFAULT_BUDGET):
+        super().__init__()
+        self.factor = factor
+        self.full_limit = full_limit
+        self.budget = budget
+        self.notes = []
+
+    def optimize_StatementSequence(self, node):
+        optimized_statements = []
+        for stmt in node.statements:
+            optimized_stmt = yield stmt
+            if isinstance(optimized_stmt, StatementSequence) and isinstance(stmt, ForStatement):
+                optimized_statements.extend(optimized_stmt.statements)
+            elif optimized_stmt:
+                optimized_statements.append(optimized_stmt)
+        node.statements = optimized_statements
+        return node
+
+    def optimize_ForStatement(self, node):
+        node = yield from super().optimize_ForStatement(node)
+        start, limit = node.init.value, node.limit
+        if not (self._is_int(start) and self._is_int(limit)):
+            return node
+        name = node.init.target.name
+        written, has_call = assigned_names(node.body)
+        if name in written or has_call or \
+           any(isinstance(stmt, (BreakStatement, ContinueStatement)) for stmt in iter_nodes(node.body)):
+            return node
+
+        step = 1 if node.direction == 'to' else -1
+        trips = max(0, (limit.value - start.value) * step + 1)
+        size = count_nodes(node.body)
+        if trips <= self.full_limit:
+            if size * trips > self.budget:
+                return node
+            statements = []
+            for index in range(trips):
+                statements.append(self._set(name, start.value + index * step))
+                statements.extend(self._copy(node.body))
+            statements.append(self._set(name, start.value + trips * step))
+            self.notes.append(f"unrolled for {name} := {start.value} {node.direction} {limit.value} ({trips} copies)")
+            return StatementSequence(statements)
+
+        factor = self.factor
+        if factor < 2 or factor > trips or size * factor > self.budget:
+            return node
+        # O while corre as iterações em grupos de `factor`; o for as que sobram
+        remainder = trips % factor
+        last = start.value + (trips - remainder - 1) * step
+        body = []
+        for _ in range(factor):
+            body.extend(self._copy(node.body))
+            body.append(Assignment(Identifier(name),
+                                   BinaryOp(Identifier(name), Operator.PLUS if step > 0 else Operator.MINUS,
+                                            Literal(1, 'NUMBER'))))
+        statements = [
+            node.init,
+            WhileStatement(BinaryOp(Identifier(name), Operator.LE if step > 0 else Operator.GE, Literal(last, 'NUMBER')),
+                           StatementSequence(body)),
+        ]
+        if remainder:
+            statements.append(ForStatement(self._set(name, last + step), node.direction, limit, node.body))
+        self.notes.append(f"unrolled for {name} := {start.value} {node.direction} {limit.value} "
+                          f"by {factor} ({remainder} left over)")
+        return StatementSequence(statements)
+
+    def _is_int(self, node):
+        return isinstance(node, Literal) and node.type_name == 'NUMBER' and isinstance(node.value, int)
+
+    def _set(self, name, value):
+        return Assignment(Identifier(name), Literal(value, 'NUMBER'))
+
+    def _copy(self, body):
+        body = copy.deepcopy(body)
+        if isinstance(body, StatementPart):
+            body = body.statement_sequence
+        if isinstance(body, StatementSequence):
+            return body.statements
+        return [body]
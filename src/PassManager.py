@@ -0,0 +1,90 @@
+import time
+
+from ASTOptimizer import ASTOptimizer
+from CommonSubexpressions import CommonSubexpressionElimination
+from ConstantPropagation import ConstantPropagation
+from ControlFlow import ControlFlowOptimizer
+from DeadCodeElimination import DeadCodeElimination
+from Inliner import Inliner
+from LoopInvariantMotion import LoopInvariantMotion
+from LoopUnrolling import LoopUnroller
+from Peephole import PeepholeOptimizer
+from RecursionElimination import RecursionElimination
+from SlotAllocation import SlotAllocator
+
+# Passes disponíveis, pela ordem em que correm em cada iteração
+PASSES = {
+    'tailrec': RecursionElimination,
+    'inline': Inliner,
+    'constprop': ConstantPropagation,
+    'fold': ASTOptimizer,
+    'unroll': LoopUnroller,
+    'licm': LoopInvariantMotion,
+    'cse': CommonSubexpressionElimination,
+    'dce': DeadCodeElimination,
+}
+
+# Nível de otimização -> (passes, número máximo de iterações)
+#   -O0: só a avaliação de constantes, que o compilador sempre fez (o gerador não trata `not`)
+#   -O1: uma passagem de cada pass
+#   -O2: repete os passes até nenhum alterar a árvore (ponto fixo)
+OPT_LEVELS = {
+    0: (('fold',), 1),
+    1: (('tailrec', 'inline', 'constprop', 'fold', 'unroll', 'licm', 'cse', 'dce'), 1),
+    2: (('tailrec', 'inline', 'constprop', 'fold', 'unroll', 'licm', 'cse', 'dce'), 10),
+}
+
+# Passes sobre o código EWVM gerado, pela ordem em que correm a partir de -O1
+VM_PASSES = {
+    'cfg': ControlFlowOptimizer,
+    'slots': SlotAllocator,
+    'peephole': PeepholeOptimizer,
+}
+
+
+def optimize_code(code, passes=tuple(VM_PASSES)):
+    for name in passes:
+        code = VM_PASSES[name]().optimize(code)
+    return code
+
+
+class PassManager:
+    def __init__(self, passes, max_iterations=1, options=None):
+        self.passes = [(name, PASSES[name]) for name in passes]
+        self.max_iterations = max_iterations
+        # Argumentos de cada pass, por nome: {'inline': {'threshold': 20}}
+        self.options = options or {}
+        self.iterations = 0
+        self.stats = {name: {"runs": 0, "rewrites": 0, "ms": 0.0} for name, _ in self.passes}
+        # Mensagens dos passes (ex.: chamadas expandidas pelo inliner)
+        self.notes = []
+
+    @classmethod
+    def for_level(cls, level, options=None):
+        passes, max_iterations = OPT_LEVELS[level]
+        return cls(passes, max_iterations, options)
+
+    def run(self, ast):
+        while self.iterations < self.max_iterations:
+            self.iterations += 1
+            changed = False
+            for name, pass_class in self.passes:
+                optimizer = pass_class(**self.options.get(name, {}))
+                start = time.perf_counter()
+                ast = optimizer.optimize(ast)
+                elapsed = (time.perf_counter() - start) * 1000
+
+                rewrites = sum(optimizer.rewrites.values())
+                stats = self.stats[name]
+                stats["runs"] += 1
+                stats["rewrites"] += rewrites
+                stats["ms"] += elapsed
+                # Em -O2 um pass que não muda nada repete as mesmas mensagens
+                self.notes.extend(note for note in getattr(optimizer, 'notes', ()) if note not in self.notes)
+                changed = changed or rewrites > 0
+            if not changed:
+                break
+        return ast
+
+    def total_rewrites(self):
+        return sum(stats["rewrites"] for stats in self.stats.values())
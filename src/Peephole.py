@@ -0,0 +1,228 @@
+"""Peephole optimization of EWVM code.
+
+Usage: python Peephole.py [--dry-run] [files...]   (default: ../vm/*.vm)
+
+Rewrites each .vm file in place (only reports with --dry-run) and prints
+how many instructions and labels were removed from it.
+"""
+import glob
+import operator
+import os
+import sys
+from collections import Counter, namedtuple
+
+from Instructions import Label, Op, Instructions, parse
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Operações entre duas constantes que podem ser feitas já
+FOLDABLE = {
+    Op.ADD: operator.add,
+    Op.SUB: operator.sub,
+    Op.MUL: operator.mul,
+    Op.EQUAL: lambda a, b: int(a == b),
+    Op.INF: lambda a, b: int(a < b),
+    Op.INFEQ: lambda a, b: int(a <= b),
+    Op.SUP: lambda a, b: int(a > b),
+    Op.SUPEQ: lambda a, b: int(a >= b),
+}
+# Constante que deixa o outro operando igual
+IDENTITY = {Op.ADD: 0, Op.SUB: 0, Op.MUL: 1, Op.DIV: 1}
+STORE = {Op.PUSHG: Op.STOREG, Op.PUSHL: Op.STOREL}
+# Depois destas só se chega ao código seguinte por uma etiqueta
+ENDS_BLOCK = {Op.JUMP, Op.RETURN, Op.STOP}
+
+# `match(out, peephole)` vê o fim do código já produzido, cuja última instrução
+# é de um dos opcodes em `last` (None: qualquer instrução), e devolve None ou
+# (quantas instruções do fim tirar, o que pôr no lugar delas)
+Pattern = namedtuple('Pattern', 'name size last match')
+
+
+def _store_load(out, peephole):
+    # storeg n; pushg n -> dup 1; storeg n. As variáveis globais ocupam o fundo da
+    # pilha de operandos: só é seguro se a célula n já foi reservada com pushn
+    (store, slot), (load, other) = out[-2], out[-1]
+    if store is Op.STOREG and load is Op.PUSHG and slot == other and slot < peephole.reserved:
+        return 2, [(Op.DUP, 1), (store, slot)]
+    return None
+
+
+def _load_store(out, peephole):
+    # pushg n; storeg n não muda nada
+    (load, slot), (store, other) = out[-2], out[-1]
+    if STORE.get(load) is store and slot == other:
+        return 2, []
+    return None
+
+
+def _dup_store(out, peephole):
+    # dup 1; storeg n; storeg n guarda duas vezes o mesmo valor
+    (dup, count), (first, slot), (second, other) = out[-3:]
+    if dup is Op.DUP and count == 1 and first is second and slot == other:
+        return 3, [(second, slot)]
+    return None
+
+
+def _identity(out, peephole):
+    # pushi 0; add  /  pushi 1; mul ...
+    (push, value), (op, _) = out[-2], out[-1]
+    if push is Op.PUSHI and value == IDENTITY[op]:
+        return 2, []
+    return None
+
+
+def _constant(out, peephole):
+    (first, a), (second, b), (op, _) = out[-3:]
+    if first is Op.PUSHI and second is Op.PUSHI:
+        return 3, [(Op.PUSHI, FOLDABLE[op](a, b))]
+    return None
+
+
+def _unreachable(out, peephole):
+    # Uma instrução sem etiqueta logo depois de jump/return/stop nunca corre
+    if out[-2][0] in ENDS_BLOCK:
+        return 1, []
+    return None
+
+
+def _jump_to_next(out, peephole):
+    # jump L seguido apenas de etiquetas até L:
+    index = len(out) - 1
+    while index > 0 and out[index][0] is Op.LABEL:
+        index -= 1
+    op, target = out[index]
+    if op is Op.JUMP and any(label is target for _, label in out[index + 1:]):
+        return len(out) - index, out[index + 1:]
+    return None
+
+
+def _unused_label(out, peephole):
+    if not peephole.refs[out[-1][1]]:
+        return 1, []
+    return None
+
+
+PATTERNS = [
+    Pattern('store-load', 2, {Op.PUSHG}, _store_load),
+    Pattern('load-store', 2, {Op.STOREG, Op.STOREL}, _load_store),
+    Pattern('dup-store', 3, {Op.STOREG, Op.STOREL}, _dup_store),
+    Pattern('identity', 2, set(IDENTITY), _identity),
+    Pattern('constant', 3, set(FOLDABLE), _constant),
+    Pattern('unreachable', 2, None, _unreachable),
+    Pattern('jump-to-next', 2, {Op.LABEL}, _jump_to_next),
+    Pattern('unused-label', 1, {Op.LABEL}, _unused_label),
+]
+
+
+def _references(pairs, refs, delta):
+    for op, arg in pairs:
+        if op is not Op.LABEL and isinstance(arg, Label):
+            refs[arg] += delta
+
+
+class PeepholeOptimizer:
+    """Sliding-window rewrites over EWVM code, repeated until none applies.
+
+    Each instruction is appended to the output and the patterns indexed by
+    its opcode are matched against the end of the output; a rewrite puts
+    its replacement back in front of the input, so it is matched again
+    together with what precedes it. Between passes, runs of consecutive
+    labels are merged into the first one. self.applied counts the rewrites
+    made by each pattern.
+    """
+
+    def __init__(self, patterns=PATTERNS):
+        self.index = {op: [pattern for pattern in patterns if pattern.last is None or op in pattern.last]
+                      for op in Op}
+        # As etiquetas só são vistas pelos padrões que as pedem
+        self.index[Op.LABEL] = [pattern for pattern in patterns if pattern.last and Op.LABEL in pattern.last]
+        self.applied = Counter()
+        # Referências a cada etiqueta e células globais reservadas no início do programa
+        self.refs = Counter()
+        self.reserved = 0
+
+    def optimize(self, code):
+        pairs = list(code)
+        self.reserved = pairs[0][1] if pairs and pairs[0][0] is Op.PUSHN else 0
+        changed = True
+        while changed:
+            pairs, merged = self._merge_labels(pairs)
+            self.refs = Counter()
+            _references(pairs, self.refs, 1)
+            pairs, changed = self._pass(pairs)
+            changed = changed or merged
+        return Instructions(pairs)
+
+    def _pass(self, pairs):
+        pending = pairs[::-1]
+        out = []
+        changed = False
+        while pending:
+            pair = pending.pop()
+            out.append(pair)
+            for pattern in self.index[pair[0]]:
+                if len(out) < pattern.size:
+                    continue
+                result = pattern.match(out, self)
+                if result is None:
+                    continue
+                count, replacement = result
+                _references(out[-count:], self.refs, -1)
+                _references(replacement, self.refs, 1)
+                del out[-count:]
+                pending.extend(reversed(replacement))
+                self.applied[pattern.name] += 1
+                changed = True
+                break
+        return out, changed
+
+    def _merge_labels(self, pairs):
+        # Em etiquetas seguidas fica só a primeira, e as referências às outras passam para ela
+        alias = {}
+        previous = None
+        for op, arg in pairs:
+            if op is Op.LABEL and previous is not None:
+                alias[arg] = alias.get(previous, previous)
+            previous = arg if op is Op.LABEL else None
+        if not alias:
+            return pairs, False
+        self.applied['merged-label'] += len(alias)
+        return [(op, alias.get(arg, arg)) for op, arg in pairs
+                if not (op is Op.LABEL and arg in alias)], True
+
+
+def optimize_file(path, dry_run=False):
+    with open(path) as f:
+        code = parse(f.read())
+    optimized = PeepholeOptimizer().optimize(code)
+    if not dry_run:
+        with open(path, 'w') as f:
+            f.write(optimized.serialize())
+    return code, optimized
+
+
+def main():
+    dry_run = '--dry-run' in sys.argv[1:]
+    files = [arg for arg in sys.argv[1:] if arg != '--dry-run'] or \
+        sorted(glob.glob(os.path.join(SRC_DIR, '..', 'vm', '*.vm')))
+    total_before = total_after = 0
+    failed = 0
+    print(f"{'file':<22}{'before':>8}{'after':>8}{'removed':>9}{'labels':>8}")
+    for path in files:
+        try:
+            code, optimized = optimize_file(path, dry_run)
+        except ValueError as error:  # um ficheiro que não é EWVM válido não pára os restantes
+            failed += 1
+            print(f"{os.path.basename(path):<22}not parsed: {error}")
+            continue
+        before, after = code.instruction_count(), optimized.instruction_count()
+        labels = (len(code) - before) - (len(optimized) - after)
+        total_before += before
+        total_after += after
+        print(f"{os.path.basename(path):<22}{before:>8}{after:>8}{before - after:>9}{labels:>8}")
+    print(f"{'total':<22}{total_before:>8}{total_after:>8}{total_before - total_after:>9}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
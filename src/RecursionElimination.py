@@ -0,0 +1,226 @@
+import copy
+
+from ASTNode import *
+from ASTUtils import assigned_names, iter_nodes, used_names
+from RewriteRules import NEGATED_COMPARISONS
+from TempOptimizer import TempOptimizer
+
+# Valor inicial do acumulador de cada operação (associativa e comutativa)
+IDENTITY = {Operator.PLUS: 0, Operator.TIMES: 1}
+
+
+class RecursionElimination(TempOptimizer):
+    """Turns self-recursive functions into loops.
+
+    Handles bodies of the form `S; if C then F := base else R` (or with the
+    branches swapped), where R only ends in recursive results: `F := F(args)`
+    (a tail call) or `F := x op F(args)` with op + or * on integers. The
+    function becomes
+        acc := 0|1; S; while not C do begin R'; S end; acc := acc op base; F := acc
+    where each result in R' updates the accumulator and assigns the new
+    arguments to the parameters. Pure tail calls need no accumulator. The
+    VM stack no longer grows with the recursion depth; the reason a
+    recursive function is left alone is recorded in self.notes.
+    """
+
+    temp_prefix = '_rec'
+
+    def __init__(self):
+        super().__init__()
+        self.notes = []
+        self.function = None
+
+    def optimize_FunctionDeclaration(self, node):
+        enclosing = self.function
+        self.function = node
+        node = yield from super().optimize_FunctionDeclaration(node)
+        self.function = enclosing
+        return node
+
+    def optimize_StatementPart(self, node):
+        node = yield from super().optimize_StatementPart(node)
+        # O corpo da função: os temporários ficam declarados no seu bloco
+        if self.function is not None and node is self.function.block.statement_part:
+            self._eliminate(self.function)
+        return node
+
+    def _eliminate(self, function):
+        name = function.heading.name
+        body = function.block.statement_part.statement_sequence
+        calls = [node for node in iter_nodes(body) if isinstance(node, ProcedureCall)]
+        if not any(call.procedure_name == name for call in calls):
+            return
+        reason, loop = self._check(function, body, calls)
+        if reason:
+            self.notes.append(f"not removing recursion from {name}: {reason}")
+            return
+
+        condition, base, recursive, op = loop
+        prefix = body.statements[:-1]
+        acc = self._new_temp('integer') if op else None
+        params = function.heading.params
+        leaves = []
+        loop_body = self._rewrite(recursive, name, params, acc, leaves)
+        loop_body = StatementSequence(self._statements(loop_body) + copy.deepcopy(prefix))
+
+        statements = [Assignment(Identifier(acc), Literal(IDENTITY[op], 'NUMBER'))] if acc else []
+        statements.extend(prefix)
+        statements.append(WhileStatement(condition, loop_body))
+        *base_statements, result = self._statements(base)
+        statements.extend(base_statements)
+        if acc:
+            value = result.value
+            if not (isinstance(value, Literal) and value.value == IDENTITY[op]):
+                statements.append(Assignment(Identifier(acc), BinaryOp(Identifier(acc), op, value)))
+            # `Funcao := variavel` é o que o gerador trata como o retorno da função
+            result = Assignment(Identifier(name), Identifier(acc))
+        statements.append(result)
+        body.statements = statements
+
+        self.rewrites['recursion'] += len(leaves)
+        self.notes.append(f"removed recursion from {name} ({len(leaves)} recursive "
+                          f"call{'s' if len(leaves) != 1 else ''}{', with an accumulator' if acc else ''})")
+
+    def _check(self, function, body, calls):
+        # (motivo, None) se a função não pode ser transformada, senão (None, (condição do ciclo, caso base, ramo recursivo, op))
+        name = function.heading.name
+        params = function.heading.params
+        if function.block.proc_func_part:
+            return "it has nested subprograms", None
+        if not all(isinstance(param.type_name, Type) for param in params):
+            return "it has array parameters", None
+        if any(call.procedure_name != name for call in calls):
+            return "it calls other subprograms", None
+        targets = {id(stmt.target) for stmt in iter_nodes(body) if isinstance(stmt, Assignment)}
+        if any(isinstance(ident, Identifier) and ident.name == name and id(ident) not in targets
+               for ident in iter_nodes(body)):
+            return f"it reads {name} as a variable", None
+
+        tail = body.statements[-1] if body.statements else None
+        if not isinstance(tail, IfStatement) or tail.else_branch is None or \
+           not all(self._is_plain(stmt, name) for stmt in body.statements[:-1]) or \
+           not self._is_plain(tail.condition, name):
+            return "its body does not end in an if/else that returns in both branches", None
+        if self._base_leaf(tail.then_branch, name) and self._recursive_tree(tail.else_branch, name):
+            condition, base, recursive = self._negate(tail.condition), tail.then_branch, tail.else_branch
+            if condition is None:
+                return "the condition of its base case cannot be negated without `not`", None
+        elif self._base_leaf(tail.else_branch, name) and self._recursive_tree(tail.then_branch, name):
+            condition, base, recursive = tail.condition, tail.else_branch, tail.then_branch
+        else:
+            return "its last if needs a base case in one branch and only `F := F(args)` or `F := x op F(args)` in the other", None
+
+        leaves = self._recursive_tree(recursive, name)
+        if len(leaves) != len(calls):
+            return "a recursive call is not the result of a branch", None
+        if any(len(call.params or ()) != len(params) for call in calls):
+            return "a recursive call has the wrong number of arguments", None
+
+        ops = {leaf.value.operator for leaf in leaves if isinstance(leaf.value, BinaryOp)}
+        if len(ops) > 1:
+            return "its recursive results combine different operators", None
+        op = ops.pop() if ops else None
+        if op is not None:
+            if function.heading.return_type.type_name.lower() != 'integer':
+                return "only integer results are accumulated", None
+            # Com acumulador o `x` de `x op F(args)` passa a ser lido antes da chamada
+            local_names = {param.name for param in params} | {name}
+            if function.block.var_decl_part:
+                for declaration in function.block.var_decl_part.declarations:
+                    local_names.update(ident.id_name if isinstance(ident, ArrayId) else ident.name
+                                       for ident in declaration.id_list)
+            if not assigned_names(body)[0] <= local_names:
+                return "it writes global variables", None
+        return None, (condition, base, recursive, op)
+
+    def _is_plain(self, stmt, name):
+        # Sem chamadas recursivas nem atribuições ao resultado
+        return not any(isinstance(node, ProcedureCall) or (isinstance(node, Assignment) and node.target.name == name)
+                       for node in iter_nodes(stmt))
+
+    def _base_leaf(self, stmt, name):
+        statements = self._statements(stmt)
+        last = statements[-1] if statements else None
+        return isinstance(last, Assignment) and last.target.name == name and \
+            self._is_plain(last.value, name) and all(self._is_plain(s, name) for s in statements[:-1])
+
+    def _recursive_tree(self, stmt, name):
+        # Atribuições `F := F(args)` / `F := x op F(args)` em que acaba cada caminho, ou [] se houver outro fim
+        if isinstance(stmt, IfStatement):
+            if stmt.else_branch is None or not self._is_plain(stmt.condition, name):
+                return []
+            then_leaves = self._recursive_tree(stmt.then_branch, name)
+            else_leaves = self._recursive_tree(stmt.else_branch, name)
+            return then_leaves + else_leaves if then_leaves and else_leaves else []
+        statements = self._statements(stmt)
+        if not statements or not all(self._is_plain(s, name) for s in statements[:-1]):
+            return []
+        last = statements[-1]
+        if isinstance(last, (IfStatement, StatementSequence)):
+            return self._recursive_tree(last, name)
+        if isinstance(last, Assignment) and last.target.name == name and self._split(last.value, name):
+            return [last]
+        return []
+
+    def _split(self, value, name):
+        # (chamada recursiva, operando acumulado ou None) de um resultado recursivo
+        if isinstance(value, ProcedureCall) and value.procedure_name == name:
+            return value, None
+        if isinstance(value, BinaryOp) and value.operator in IDENTITY:
+            for call, other in ((value.left, value.right), (value.right, value.left)):
+                if isinstance(call, ProcedureCall) and call.procedure_name == name and self._is_plain(other, name):
+                    return call, other
+        return None
+
+    def _rewrite(self, stmt, name, params, acc, leaves):
+        if isinstance(stmt, IfStatement):
+            stmt.then_branch = self._rewrite(stmt.then_branch, name, params, acc, leaves)
+            stmt.else_branch = self._rewrite(stmt.else_branch, name, params, acc, leaves)
+            return stmt
+        if isinstance(stmt, Assignment):
+            leaves.append(stmt)
+            call, other = self._split(stmt.value, name)
+            statements = []
+            if other is not None:
+                statements.append(Assignment(Identifier(acc), BinaryOp(Identifier(acc), stmt.value.operator, other)))
+            statements.extend(self._rebind(params, call.params or []))
+            return StatementSequence(statements)
+        statements = self._statements(stmt)
+        last = self._rewrite(statements[-1], name, params, acc, leaves)
+        return StatementSequence(statements[:-1] + self._statements(last))
+
+    def _rebind(self, params, args):
+        # Atribuição simultânea dos argumentos aos parâmetros: um argumento que lê um
+        # parâmetro já reatribuído é calculado antes para um temporário
+        changed = [(param, arg) for param, arg in zip(params, args)
+                   if not (isinstance(arg, Identifier) and arg.name == param.name)]
+        temps = []
+        assignments = []
+        for index, (param, arg) in enumerate(changed):
+            if used_names(arg)[0] & {earlier.name for earlier, _ in changed[:index]}:
+                temp = self._new_temp(param.type_name.type_name.lower())
+                temps.append(Assignment(Identifier(temp), arg))
+                arg = Identifier(temp)
+            assignments.append(Assignment(Identifier(param.name), arg))
+        return temps + assignments
+
+    def _statements(self, stmt):
+        if isinstance(stmt, StatementSequence):
+            return list(stmt.statements)
+        return [stmt]
+
+    def _negate(self, condition):
+        # Negação por De Morgan até às comparações (o gerador não tem `not`); None se não houver
+        if isinstance(condition, BinaryOp):
+            if condition.operator in NEGATED_COMPARISONS:
+                return BinaryOp(condition.left, NEGATED_COMPARISONS[condition.operator], condition.right)
+            if condition.operator in (Operator.AND, Operator.OR):
+                left, right = self._negate(condition.left), self._negate(condition.right)
+                if left is None or right is None:
+                    return None
+                return BinaryOp(left, Operator.OR if condition.operator == Operator.AND else Operator.AND, right)
+        elif isinstance(condition, UnaryOp) and condition.operator == Operator.NOT:
+            return condition.operand
+        elif isinstance(condition, Literal) and condition.type_name == 'BOOLEAN':
+            return Literal(not condition.value, 'BOOLEAN')
+        return None
@@ -0,0 +1,295 @@
+import operator
+
+from ASTNode import *
+from ASTUtils import iter_nodes
+
+# Tipo de nó num padrão: o tipo de um Literal ('NUMBER', 'BOOLEAN', 'PHRASE'),
+# o nome da classe para os outros nós, ou ANY para qualquer um
+ANY = '*'
+
+
+def nodes_equal(node1, node2):
+    """Structural equality of two expressions, compared pairwise (stops at the first difference).
+
+    Calls are never equal: two calls may return different values.
+    """
+    stack = [(node1, node2)]
+    while stack:
+        node1, node2 = stack.pop()
+        if type(node1) is not type(node2):
+            return False
+        if isinstance(node1, Literal):
+            if node1.value != node2.value or node1.type_name != node2.type_name:
+                return False
+        elif isinstance(node1, Identifier):
+            if node1.name != node2.name:
+                return False
+        elif isinstance(node1, BinaryOp):
+            if node1.operator != node2.operator:
+                return False
+            stack.append((node1.left, node2.left))
+            stack.append((node1.right, node2.right))
+        elif isinstance(node1, UnaryOp):
+            if node1.operator != node2.operator:
+                return False
+            stack.append((node1.operand, node2.operand))
+        elif isinstance(node1, ArrayId):
+            if node1.id_name != node2.id_name:
+                return False
+            stack.append((node1.expression, node2.expression))
+        elif isinstance(node1, LengthFunction):
+            stack.append((node1.expression, node2.expression))
+        else:
+            return False
+    return True
+
+
+class Rule:
+    """A rewrite of the nodes matching `pattern` (operator and operand kinds) for which `guard` holds.
+
+    A rule whose check does most of the work of the rewrite has no guard and
+    returns None from `rewrite` when it does not apply.
+    """
+
+    __slots__ = ('name', 'pattern', 'guard', 'rewrite')
+
+    def __init__(self, name, pattern, rewrite, guard=None):
+        self.name = name
+        self.pattern = pattern
+        self.rewrite = rewrite
+        self.guard = guard
+
+    def __repr__(self):
+        return f"Rule({self.name!r})"
+
+
+class RuleSet:
+    """Rules for BinaryOp or UnaryOp nodes, looked up by (operator, operand kinds...).
+
+    The candidate rules of each key seen (the ones whose pattern matches it,
+    wildcards included, in declaration order) are computed once and kept in
+    self.index, so a node only tries the rules that can apply to it. The
+    rules are applied until none matches the result.
+    """
+
+    def __init__(self, node_class, rules):
+        self.node_class = node_class
+        self.rules = list(rules)
+        self.index = {}
+
+    def candidates(self, key):
+        rules = self.index.get(key)
+        if rules is None:
+            rules = self.index[key] = tuple(
+                rule for rule in self.rules
+                if rule.pattern[0] == key[0] and all(kind in (ANY, actual) for kind, actual in zip(rule.pattern[1:], key[1:]))
+            )
+        return rules
+
+    def rewrite(self, node):
+        # Corre para cada expressão do programa: a chave é montada aqui, sem chamadas
+        node_class = self.node_class
+        index = self.index
+        while type(node) is node_class:
+            if node_class is BinaryOp:
+                left, right = node.left, node.right
+                key = (node.operator,
+                       left.type_name if type(left) is Literal else type(left).__name__,
+                       right.type_name if type(right) is Literal else type(right).__name__)
+            else:
+                operand = node.operand
+                key = (node.operator, operand.type_name if type(operand) is Literal else type(operand).__name__)
+            rules = index.get(key)
+            if rules is None:
+                rules = self.candidates(key)
+            for rule in rules:
+                if rule.guard is None or rule.guard(node):
+                    result = rule.rewrite(node)
+                    if result is not None:
+                        node = result
+                        break
+            else:
+                return node
+        return node
+
+
+def _number(node, value):
+    return isinstance(node, Literal) and node.type_name == 'NUMBER' and node.value == value
+
+
+def _bool(node, value):
+    return isinstance(node, Literal) and node.type_name == 'BOOLEAN' and node.value == value
+
+
+def _int(node):
+    return isinstance(node, Literal) and node.type_name == 'NUMBER' and isinstance(node.value, int)
+
+
+def _no_calls(node):
+    return not any(isinstance(child, ProcedureCall) for child in iter_nodes(node))
+
+
+def _trunc_div(a, b):
+    # div trunca em direção a zero e o resto tem o sinal do dividendo
+    quotient = abs(a) // abs(b)
+    return -quotient if (a < 0) != (b < 0) else quotient
+
+
+def _fold(op, kind, function, result_kind, guard=None):
+    return Rule(f"fold {kind} {op.value}", (op, kind, kind),
+                lambda node: Literal(function(node.left.value, node.right.value), result_kind), guard)
+
+
+def _nonzero_right(node):
+    return node.right.value != 0
+
+
+def _ints_nonzero_right(node):
+    return isinstance(node.left.value, int) and isinstance(node.right.value, int) and node.right.value != 0
+
+
+# --- Reassociação de constantes inteiras: (x + c1) + c2 -> x + (c1 + c2), (x * c1) * c2 -> x * (c1 * c2)
+
+def _offset(node):
+    # (x, k) se node é x + k, x - k ou k + x com k inteiro
+    if node.operator == Operator.PLUS:
+        if _int(node.right):
+            return node.left, node.right.value
+        if _int(node.left):
+            return node.right, node.left.value
+    elif node.operator == Operator.MINUS and _int(node.right):
+        return node.left, -node.right.value
+    return None
+
+
+def _reassociate_sum(node):
+    # None se não é (x + c1) + c2 com inteiros
+    inner = _offset(node.left)
+    value = node.right.value
+    if inner is None or type(value) is not int:
+        return None
+    operand, offset = inner
+    offset += value if node.operator is Operator.PLUS else -value
+    if offset == 0:
+        return operand
+    if offset < 0:
+        return BinaryOp(operand, Operator.MINUS, Literal(-offset, 'NUMBER'))
+    return BinaryOp(operand, Operator.PLUS, Literal(offset, 'NUMBER'))
+
+
+def _reassociate_product(node):
+    inner = node.left
+    if type(node.right.value) is not int or inner.operator is not Operator.TIMES:
+        return None
+    if _int(inner.right):
+        operand, factor = inner.left, inner.right
+    elif _int(inner.left):
+        operand, factor = inner.right, inner.left
+    else:
+        return None
+    return BinaryOp(operand, Operator.TIMES, Literal(factor.value * node.right.value, 'NUMBER'))
+
+
+# --- Absorção: x and (x or y) -> x, x or (x and y) -> x (y sem chamadas, que deixam de ser feitas)
+
+def _absorbed(node):
+    # O operando x que absorve o outro, ou None
+    inner = Operator.OR if node.operator == Operator.AND else Operator.AND
+    for x, other in ((node.left, node.right), (node.right, node.left)):
+        if isinstance(other, BinaryOp) and other.operator == inner:
+            for y, z in ((other.left, other.right), (other.right, other.left)):
+                if nodes_equal(x, y) and _no_calls(z):
+                    return x
+    return None
+
+
+COMPARISONS = {
+    Operator.EQ: operator.eq,
+    Operator.NE: operator.ne,
+    Operator.LT: operator.lt,
+    Operator.LE: operator.le,
+    Operator.GT: operator.gt,
+    Operator.GE: operator.ge,
+}
+
+NEGATED_COMPARISONS = {
+    Operator.EQ: Operator.NE,
+    Operator.NE: Operator.EQ,
+    Operator.LT: Operator.GE,
+    Operator.GE: Operator.LT,
+    Operator.GT: Operator.LE,
+    Operator.LE: Operator.GT,
+}
+
+BINARY_RULES = [
+    # Avaliação de operações entre literais do mesmo tipo; booleanos só se comparam com = e <>
+    *(_fold(op, kind, function, 'BOOLEAN') for kind in ('NUMBER', 'PHRASE') for op, function in COMPARISONS.items()),
+    _fold(Operator.EQ, 'BOOLEAN', operator.eq, 'BOOLEAN'),
+    _fold(Operator.NE, 'BOOLEAN', operator.ne, 'BOOLEAN'),
+    _fold(Operator.PLUS, 'NUMBER', operator.add, 'NUMBER'),
+    _fold(Operator.MINUS, 'NUMBER', operator.sub, 'NUMBER'),
+    _fold(Operator.TIMES, 'NUMBER', operator.mul, 'NUMBER'),
+    _fold(Operator.DIVIDE, 'NUMBER', operator.truediv, 'NUMBER', _nonzero_right),
+    _fold(Operator.DIV, 'NUMBER', _trunc_div, 'NUMBER', _ints_nonzero_right),
+    _fold(Operator.MOD, 'NUMBER', lambda a, b: a - b * _trunc_div(a, b), 'NUMBER', _ints_nonzero_right),
+    _fold(Operator.AND, 'BOOLEAN', lambda a, b: a and b, 'BOOLEAN'),
+    _fold(Operator.OR, 'BOOLEAN', lambda a, b: a or b, 'BOOLEAN'),
+    _fold(Operator.PLUS, 'PHRASE', operator.add, 'PHRASE'),
+
+    # Elementos neutros e absorventes (o padrão já garante o tipo do literal testado); um
+    # elemento absorvente só descarta o outro operando se este não tiver chamadas
+    Rule("x + 0", (Operator.PLUS, ANY, 'NUMBER'), lambda node: node.left, lambda node: node.right.value == 0),
+    Rule("0 + x", (Operator.PLUS, 'NUMBER', ANY), lambda node: node.right, lambda node: node.left.value == 0),
+    Rule("x - 0", (Operator.MINUS, ANY, 'NUMBER'), lambda node: node.left, lambda node: node.right.value == 0),
+    Rule("x - x", (Operator.MINUS, ANY, ANY), lambda node: Literal(0, 'NUMBER'),
+         lambda node: nodes_equal(node.left, node.right)),
+    Rule("x * 1", (Operator.TIMES, ANY, 'NUMBER'), lambda node: node.left, lambda node: node.right.value == 1),
+    Rule("1 * x", (Operator.TIMES, 'NUMBER', ANY), lambda node: node.right, lambda node: node.left.value == 1),
+    Rule("x * 0", (Operator.TIMES, ANY, 'NUMBER'), lambda node: Literal(0, 'NUMBER'),
+         lambda node: node.right.value == 0 and _no_calls(node.left)),
+    Rule("0 * x", (Operator.TIMES, 'NUMBER', ANY), lambda node: Literal(0, 'NUMBER'),
+         lambda node: node.left.value == 0 and _no_calls(node.right)),
+    Rule("x / 1", (Operator.DIVIDE, ANY, 'NUMBER'), lambda node: node.left, lambda node: node.right.value == 1),
+    Rule("0 / x", (Operator.DIVIDE, 'NUMBER', ANY), lambda node: Literal(0, 'NUMBER'),
+         lambda node: _number(node.left, 0) and not node.right.value == 0 and _no_calls(node.right)),
+    Rule("x and false", (Operator.AND, ANY, 'BOOLEAN'), lambda node: Literal(False, 'BOOLEAN'),
+         lambda node: node.right.value == False and _no_calls(node.left)),
+    Rule("false and x", (Operator.AND, 'BOOLEAN', ANY), lambda node: Literal(False, 'BOOLEAN'),
+         lambda node: node.left.value == False and _no_calls(node.right)),
+    Rule("x and true", (Operator.AND, ANY, 'BOOLEAN'), lambda node: node.left, lambda node: node.right.value == True),
+    Rule("true and x", (Operator.AND, 'BOOLEAN', ANY), lambda node: node.right, lambda node: node.left.value == True),
+    Rule("x or true", (Operator.OR, ANY, 'BOOLEAN'), lambda node: Literal(True, 'BOOLEAN'),
+         lambda node: node.right.value == True and _no_calls(node.left)),
+    Rule("true or x", (Operator.OR, 'BOOLEAN', ANY), lambda node: Literal(True, 'BOOLEAN'),
+         lambda node: node.left.value == True and _no_calls(node.right)),
+    Rule("x or false", (Operator.OR, ANY, 'BOOLEAN'), lambda node: node.left, lambda node: node.right.value == False),
+    Rule("false or x", (Operator.OR, 'BOOLEAN', ANY), lambda node: node.right, lambda node: node.left.value == False),
+
+    # Idempotência e absorção (os dois operandos são sempre avaliados: só sem chamadas)
+    Rule("x and x", (Operator.AND, ANY, ANY), lambda node: node.left,
+         lambda node: nodes_equal(node.left, node.right) and _no_calls(node.right)),
+    Rule("x or x", (Operator.OR, ANY, ANY), lambda node: node.left,
+         lambda node: nodes_equal(node.left, node.right) and _no_calls(node.right)),
+    Rule("x and (x or y)", (Operator.AND, ANY, ANY), _absorbed),
+    Rule("x or (x and y)", (Operator.OR, ANY, ANY), _absorbed),
+
+    # Reassociação de constantes inteiras
+    Rule("(x + c1) + c2", (Operator.PLUS, 'BinaryOp', 'NUMBER'), _reassociate_sum),
+    Rule("(x + c1) - c2", (Operator.MINUS, 'BinaryOp', 'NUMBER'), _reassociate_sum),
+    Rule("(x * c1) * c2", (Operator.TIMES, 'BinaryOp', 'NUMBER'), _reassociate_product),
+]
+
+UNARY_RULES = [
+    Rule("fold not", (Operator.NOT, 'BOOLEAN'), lambda node: Literal(not node.operand.value, 'BOOLEAN')),
+    Rule("fold -", (Operator.MINUS, 'NUMBER'), lambda node: Literal(-node.operand.value, 'NUMBER')),
+    Rule("not not x", (Operator.NOT, 'UnaryOp'), lambda node: node.operand.operand,
+         lambda node: node.operand.operator == Operator.NOT),
+    Rule("- -x", (Operator.MINUS, 'UnaryOp'), lambda node: node.operand.operand,
+         lambda node: node.operand.operator == Operator.MINUS),
+    Rule("not (a < b)", (Operator.NOT, 'BinaryOp'),
+         lambda node: BinaryOp(node.operand.left, NEGATED_COMPARISONS[node.operand.operator], node.operand.right),
+         lambda node: node.operand.operator in NEGATED_COMPARISONS),
+]
+
+BINARY = RuleSet(BinaryOp, BINARY_RULES)
+UNARY = RuleSet(UnaryOp, UNARY_RULES)
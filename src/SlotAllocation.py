@@ -0,0 +1,165 @@
+"""Liveness-based allocation of the VM cells of global variables and subprogram locals."""
+from collections import Counter, namedtuple
+
+from ControlFlow import ControlFlowGraph
+from Instructions import Op
+
+# Opcode que acede a uma célula -> se a escreve
+GLOBAL_ACCESS = {Op.PUSHG: False, Op.STOREG: True}
+LOCAL_ACCESS = {Op.PUSHL: False, Op.STOREL: True}
+
+# Células usadas antes (cells) e depois (slots) da alocação, e o máximo de
+# células vivas ao mesmo tempo, que é o mínimo possível de slots
+Frame = namedtuple('Frame', 'name cells slots max_live')
+
+
+class SlotAllocator:
+    """Shares VM cells between variables that are never live at the same time.
+
+    The generator gives every declared global (pushg/storeg n) and every
+    local of a subprogram (pushl/storel n, n >= 0) its own cell, reserved
+    with `pushn` at the start of the program and after each subprogram's
+    `start`. Here the liveness of each cell is computed on the control-flow
+    graph, cells whose live ranges interfere get different slots (greedy
+    coloring in program order) and the pushn is resized to the slots used.
+    Globals also used inside a subprogram keep a slot of their own.
+    self.frames has the sizes before and after.
+    """
+
+    def __init__(self):
+        self.applied = Counter()
+        self.frames = []
+
+    def optimize(self, code):
+        cfg = ControlFlowGraph(code)
+        if not cfg.blocks:
+            return code
+        functions = []
+        in_function = set()
+        for entry in cfg.entries[1:]:
+            if id(entry) not in in_function:
+                blocks = self._region(entry)
+                in_function.update(id(block) for block in blocks)
+                functions.append((entry, blocks))
+        program = [block for block in cfg.blocks if id(block) not in in_function]
+
+        pinned = {arg for _, blocks in functions for block in blocks
+                  for op, arg in block.code if op in GLOBAL_ACCESS}
+        mapping = self._allocate('program', program, GLOBAL_ACCESS, pinned, program[0] if program else None)
+        self._rename(cfg.blocks, GLOBAL_ACCESS, mapping)
+        for entry, blocks in functions:
+            mapping = self._allocate(entry.labels[0].name, blocks, LOCAL_ACCESS, set(), entry)
+            self._rename(blocks, LOCAL_ACCESS, mapping)
+        return cfg.instructions()
+
+    def _region(self, entry):
+        # Blocos de um subprograma: os que se alcançam a partir da sua entrada
+        seen = {id(entry)}
+        stack = [entry]
+        blocks = []
+        while stack:
+            block = stack.pop()
+            blocks.append(block)
+            for successor in block.successors:
+                if id(successor) not in seen:
+                    seen.add(id(successor))
+                    stack.append(successor)
+        return blocks
+
+    def _allocate(self, name, blocks, access, pinned, entry):
+        # Células -> slots; o pushn do bloco de entrada passa a reservar só os slots
+        at = 1 if entry.code and entry.code[0][0] is Op.START else 0
+        reserved = entry.code[at][1] if len(entry.code) > at and entry.code[at][0] is Op.PUSHN else None
+        cells = list(dict.fromkeys(arg for block in blocks for op, arg in block.code
+                                   if op in access and arg >= 0))
+        cells.extend(sorted(pinned - set(cells)))
+        if not cells:
+            if reserved:
+                # Variáveis declaradas que nunca são usadas
+                del entry.code[at]
+                self.frames.append(Frame(name, reserved, 0, 0))
+                self._count(access, reserved)
+            return {}
+        live_out = self._liveness(blocks, access)
+
+        neighbors = {cell: set() for cell in cells}
+        max_live = 0
+        for block in blocks:
+            live = set(live_out[id(block)])
+            for op, arg in reversed(block.code):
+                if op in access and arg >= 0:
+                    if access[op]:
+                        # Uma escrita não pode ir para o slot de uma célula viva
+                        for other in live:
+                            if other != arg:
+                                neighbors[arg].add(other)
+                                neighbors[other].add(arg)
+                        live.discard(arg)
+                    else:
+                        live.add(arg)
+                max_live = max(max_live, len(live - pinned))
+        for cell in pinned:
+            for other in cells:
+                if other != cell:
+                    neighbors[cell].add(other)
+                    neighbors[other].add(cell)
+
+        slots = {}
+        for cell in sorted(pinned) + [cell for cell in cells if cell not in pinned]:
+            taken = {slots[other] for other in neighbors[cell] if other in slots}
+            slot = 0
+            while slot in taken:
+                slot += 1
+            slots[cell] = slot
+        size = max(slots.values()) + 1
+        before = max(cells) + 1 if reserved is None else reserved
+        self.frames.append(Frame(name, before, size, max_live + len(pinned)))
+        self._count(access, before - size)
+
+        if reserved is None:
+            entry.code.insert(at, (Op.PUSHN, size))
+        else:
+            entry.code[at] = (Op.PUSHN, size)
+        return slots
+
+    def _count(self, access, saved):
+        if saved > 0:
+            self.applied['global-slots' if access is GLOBAL_ACCESS else 'local-slots'] += saved
+
+    def _liveness(self, blocks, access):
+        uses = {}
+        defs = {}
+        for block in blocks:
+            used, defined = set(), set()
+            for op, arg in block.code:
+                if op in access and arg >= 0:
+                    if access[op]:
+                        defined.add(arg)
+                    elif arg not in defined:
+                        used.add(arg)
+            uses[id(block)], defs[id(block)] = used, defined
+
+        region = {id(block) for block in blocks}
+        live_in = {id(block): set() for block in blocks}
+        live_out = {id(block): set() for block in blocks}
+        changed = True
+        while changed:
+            changed = False
+            for block in reversed(blocks):
+                key = id(block)
+                out = set()
+                for successor in block.successors:
+                    if id(successor) in region:
+                        out |= live_in[id(successor)]
+                new_in = uses[key] | (out - defs[key])
+                if out != live_out[key] or new_in != live_in[key]:
+                    live_out[key], live_in[key] = out, new_in
+                    changed = True
+        return live_out
+
+    def _rename(self, blocks, access, mapping):
+        if not mapping:
+            return
+        for block in blocks:
+            block.code = [(op, mapping[arg]) if op in access and arg >= 0 else (op, arg)
+                          for op, arg in block.code]
@@ -0,0 +1,141 @@
+from ASTNode import *
+from ASTOptimizer import ASTOptimizer
+from ASTUtils import declare_variables, iter_nodes
+from RewriteRules import COMPARISONS
+
+ARITHMETIC = {Operator.PLUS, Operator.MINUS, Operator.TIMES, Operator.DIV, Operator.MOD}
+LOGICAL = {Operator.AND, Operator.OR}
+
+
+class TempOptimizer(ASTOptimizer):
+    """Base for passes that keep expression values in compiler-generated temporaries.
+
+    Tracks the declared types of the visible variables, infers the type of
+    integer/boolean expressions and declares the temporaries created while
+    a block is optimized in that block's var section.
+    """
+
+    temp_prefix = '_tmp'
+
+    def __init__(self):
+        super().__init__()
+        # Tipos das variáveis visíveis, um dicionário por bloco
+        self.scopes = []
+        # Temporários a declarar em cada bloco: [(nome, tipo)]
+        self.temps = []
+        self.params = {}
+        self.function_name = None
+        self.names = set()
+        self.counter = 0
+
+    def optimize_Program(self, node):
+        self.names = {ident.name for ident in iter_nodes(node) if isinstance(ident, (Identifier, Parameter))}
+        node.header = yield node.header
+        node.block = yield node.block
+        return node
+
+    def optimize_Block(self, node):
+        types = dict(self.params)
+        self.params = {}
+        for decl_part in (node.var_decl_part, node.extra_var_decl):
+            if decl_part and decl_part.declarations:
+                for declaration in decl_part.declarations:
+                    if isinstance(declaration.type_name, Type):
+                        for ident in declaration.id_list:
+                            # `v[n]: tipo` é um erro semântico, que fica para a análise semântica
+                            if isinstance(ident, Identifier):
+                                types[ident.name] = declaration.type_name.type_name.lower()
+        self.scopes.append(types)
+        self.temps.append([])
+
+        if node.proc_func_part:
+            optimized_procs = []
+            for proc_or_func in node.proc_func_part:
+                optimized_procs.append((yield proc_or_func))
+            node.proc_func_part = optimized_procs
+        node.statement_part = yield node.statement_part
+
+        self.scopes.pop()
+        temps = self.temps.pop()
+        if temps:
+            declare_variables(node, temps)
+        return node
+
+    def optimize_FunctionDeclaration(self, node):
+        enclosing = self.function_name
+        self.function_name = node.heading.name
+        self.params = self._param_types(node.heading.params)
+        node.block = yield node.block
+        self.function_name = enclosing
+        return node
+
+    def optimize_ProcedureDeclaration(self, node):
+        self.params = self._param_types(node.heading.params)
+        node.block = yield node.block
+        return node
+
+    def _new_temp(self, type_name):
+        name = f"{self.temp_prefix}{self.counter}"
+        while name in self.names:
+            self.counter += 1
+            name = f"{self.temp_prefix}{self.counter}"
+        self.counter += 1
+        self.names.add(name)
+        self.temps[-1].append((name, type_name))
+        return name
+
+    def _types(self, root):
+        # Tipo ('integer', 'boolean', 'string', ... ou None) de cada nó (por id), de baixo para cima
+        types = {}
+        stack = [(root, False)]
+        while stack:
+            node, ready = stack.pop()
+            if isinstance(node, BinaryOp):
+                if not ready:
+                    stack.append((node, True))
+                    stack.append((node.right, False))
+                    stack.append((node.left, False))
+                    continue
+                types[id(node)] = self._binary_type(node.operator, types[id(node.left)], types[id(node.right)])
+            elif isinstance(node, Literal):
+                types[id(node)] = self._literal_type(node)
+            elif isinstance(node, Identifier):
+                types[id(node)] = self._lookup(node.name)
+            elif isinstance(node, LengthFunction) and isinstance(node.expression, Identifier):
+                types[id(node)] = 'integer' if self._lookup(node.expression.name) == 'string' else None
+            else:
+                types[id(node)] = None
+        return types
+
+    def _may_fail(self, node):
+        # div/mod por algo que não é uma constante diferente de zero
+        if node.operator not in (Operator.DIV, Operator.MOD, Operator.DIVIDE):
+            return False
+        right = node.right
+        return not (isinstance(right, Literal) and right.type_name == 'NUMBER' and right.value)
+
+    def _lookup(self, name):
+        for types in reversed(self.scopes):
+            if name in types:
+                return types[name]
+        return None
+
+    def _param_types(self, params):
+        return {param.name: param.type_name.type_name.lower()
+                for param in params or () if isinstance(param.type_name, Type)}
+
+    def _literal_type(self, node):
+        if node.type_name == 'BOOLEAN':
+            return 'boolean'
+        if node.type_name == 'NUMBER' and isinstance(node.value, int):
+            return 'integer'
+        return None
+
+    def _binary_type(self, op, left_type, right_type):
+        if op in ARITHMETIC:
+            return 'integer' if left_type == right_type == 'integer' else None
+        if op in COMPARISONS:
+            return 'boolean' if left_type == right_type and left_type in ('integer', 'boolean') else None
+        if op in LOGICAL:
+            return 'boolean' if left_type == right_type == 'boolean' else None
+        return None
@@ -0,0 +1,62 @@
+"""Regenerate the prebuilt lexer (lextab.py) and parser (parsetab.py, parser.out) tables.
+
+Usage: python build_tables.py [--check]
+
+With --check nothing is written; exits with status 1 if either table is out of date
+with respect to the rules in pasAnalex.py / pasSyn.py.
+"""
+import os
+import sys
+from ply import lex, yacc
+
+import pasAnalex
+import pasSyn
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parser_signature():
+    pinfo = yacc.ParserReflect(vars(pasSyn))
+    pinfo.get_all()
+    return pinfo.signature()
+
+
+def tables_are_current():
+    try:
+        import lextab
+        import parsetab
+    except ImportError:
+        return False
+    return (getattr(lextab, '_signature', None) == pasAnalex.lexer_signature()
+            and parsetab._lr_signature == parser_signature())
+
+
+def build():
+    for name in ('lextab', 'parsetab'):
+        sys.modules.pop(name, None)
+        path = os.path.join(SRC_DIR, f"{name}.py")
+        if os.path.exists(path):
+            os.remove(path)
+
+    lex.lex(module=pasAnalex, optimize=1, lextab='lextab', outputdir=SRC_DIR)
+    with open(os.path.join(SRC_DIR, 'lextab.py'), 'a') as f:
+        f.write(f"_signature = {pasAnalex.lexer_signature()!r}\n")
+
+    yacc.yacc(module=pasSyn, debug=True, write_tables=True, outputdir=SRC_DIR)
+
+
+def main():
+    if '--check' in sys.argv[1:]:
+        if tables_are_current():
+            print("Lexer and parser tables are up to date.")
+            return 0
+        print("Lexer/parser tables are stale: run python build_tables.py")
+        return 1
+
+    build()
+    print("Lexer and parser tables regenerated.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
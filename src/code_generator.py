@@ -1,43 +1,90 @@
 import os
 from ASTNode import *
+from ASTVisitor import ASTVisitor
+from FrameLayout import FrameLayout
+from Instructions import Instructions, Label, Op
 
-class Generator:
+class Generator(ASTVisitor):
     def __init__(self, filename):
-        self.stack = {}
-        self.function_stack = {}
+        # Células das variáveis globais e do subprograma a ser gerado
+        self.globals = FrameLayout()
+        self.frame = None
         base_name = os.path.basename(filename)
         file_name_without_ext = os.path.splitext(base_name)[0] 
         self.filename = f"../vm/{file_name_without_ext}.vm"
-        with open(self.filename, 'w') as f:
-            f.write('')
-        self.op_stack_pos = 0
-        self.fun_stack_pos = 0
+        self.code = Instructions()
+        self.labels = {}
         self.loop_counter = 0
         self.if_counter = 0
-        self.in_function = False
+        # Ciclos em que se está: (destino do continue, destino do break)
+        self.loops = []
+        # Etiquetas para onde salta algum break/continue
+        self.jumped = set()
         self.has_function = False
         self.types = {}
         self.current_function = None
 
     def generate(self, ast):
        self.visit(ast) 
+       self.write()
        print("Code generation completed")
-    
-    def visit(self, node):
-        if node is None:
-            return None 
-
-        method_name = f'visit_{node.__class__.__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
 
+    def write(self):
+        with open(self.filename, 'w') as f:
+            f.write(self.text())
+
+    def text(self):
+        return self.code.serialize()
+
+    def instruction_count(self):
+        return self.code.instruction_count()
+
+    def emit(self, op, arg=None):
+        self.code.emit(op, arg)
+
+    def label(self, name):
+        # A mesma Label para a definição de um subprograma e para as chamadas
+        if name not in self.labels:
+            self.labels[name] = Label(name)
+        return self.labels[name]
+
+    def layout_of(self, name):
+        # As variáveis do subprograma escondem as globais com o mesmo nome
+        if self.frame is not None and name in self.frame.offsets:
+            return self.frame
+        return self.globals
+
+    def load(self, name):
+        layout = self.layout_of(name)
+        self.emit(layout.load, layout.offsets[name])
+
+    def store(self, name):
+        layout = self.layout_of(name)
+        self.emit(layout.store, layout.offsets[name])
+
+    def reserve(self, layout):
+        if layout.size:
+            self.emit(Op.PUSHN, layout.size)
+
+    def loop_body(self, body, next_label, end_label):
+        self.loops.append((next_label, end_label))
+        yield body
+        self.loops.pop()
+
+    def place(self, label):
+        # Etiqueta que só um break/continue usa: só aparece se algum saltar para ela
+        if label in self.jumped:
+            self.emit(Op.LABEL, label)
+    
     def generic_visit(self, node):
         print(f"Warning: No visitor defined for {node.__class__.__name__}")
         return None
 
     def visit_Program(self, node):
-        self.visit(node.header)
-        self.visit(node.block)
+        self.globals = FrameLayout.for_program(node)
+        yield node.header
+        self.reserve(self.globals)
+        yield node.block
         return None 
 
     def visit_Header(self, node):
@@ -48,52 +95,50 @@ class Generator:
             self.has_function = True
             
         if node.var_decl_part:
-            self.visit(node.var_decl_part)
+            yield node.var_decl_part
 
         if node.extra_var_decl:
-            self.visit(node.extra_var_decl)
+            yield node.extra_var_decl
         
         if node.statement_part:
-            self.visit(node.statement_part)
+            yield node.statement_part
 
         if self.has_function:
-            command = f"stop\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            self.emit(Op.STOP)
 
         if node.proc_func_part:
             for func in node.proc_func_part:
-                self.visit(func)
+                yield func
 
         return None 
 
     def visit_VarDeclarationPart(self, node):
         if hasattr(node, "declarations") and node.declarations:
             for decl in node.declarations:
-                self.visit(decl)
+                yield decl
         return None
 
     def visit_VarDeclaration(self, node):
        for id in node.id_list:
-           var_name = self.visit(id)
-           self.types[var_name] = self.visit(node.type_name).lower() 
+           var_name = yield id
+           self.types[var_name] = (yield node.type_name).lower() 
        return None
 
     def visit_IdList(self, node):
         var_list = []
         for id in node.ids:
-            var_name = self.visit(id)
+            var_name = yield id
             var_list.append(var_name)
 
         return var_list
 
     def visit_StatementPart(self, node):
-        self.visit(node.statement_sequence)
+        yield node.statement_sequence
         return None
 
     def visit_StatementSequence(self, node):
         for statement in node.statements:
-            self.visit(statement)
+            yield statement
 
         return None
 
@@ -101,156 +146,70 @@ class Generator:
         name = node.procedure_name
         if node.params:
             for param in node.params:
-                param_name = self.visit(param)
-                command = f"pushg {self.stack[param_name]}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command)
+                param_name = yield param
+                self.load(param_name)
         
-        command = f"pusha {name}\ncall\n"
-        with open(self.filename, 'a') as f:
-            f.write(command)
+        self.emit(Op.PUSHA, self.label(name))
+        self.emit(Op.CALL)
     
     def visit_FunctionDeclaration(self, node):
-        self.visit(node.heading)
-        self.in_function = True
-        self.visit(node.block)
-        self.in_function = False
+        self.frame = FrameLayout.for_subprogram(node)
+        yield node.heading
+        yield node.block
+        self.frame = None
     
     def visit_FunctionHeading(self, node):
         fun_name = node.name 
         self.current_function = fun_name
-        command = f"{fun_name}:\nstart\n"
-        with open(self.filename, 'a') as f:
-            f.write(command)
-        
-        self.argument_pointer = self.op_stack_pos
-        if node.params:
-            for param in node.params:
-                self.argument = self.visit(param)
+        self.emit(Op.LABEL, self.label(fun_name))
+        self.emit(Op.START)
+        self.reserve(self.frame)
+        return None
 
     def visit_Assignment(self, node):
-        target_name = self.visit(node.target)
-        print(node.value)
+        target_name = yield node.target
         if isinstance(node.value, Literal):
-            value_type, value = self.visit(node.value)
+            value_type, value = yield node.value
             if value_type == "BOOLEAN":
-                value = int(value)
-                command = f"pushi {value}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command)
-                if target_name not in self.stack:
-                    self.stack[target_name] = self.op_stack_pos
-                    self.op_stack_pos += 1
-                
-                command = f"storeg {self.stack[target_name]}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command)
+                self.emit(Op.PUSHI, int(value))
+                self.store(target_name)
             elif value_type == "NUMBER":
-                command = f"pushi {value}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command)
-                if self.in_function:
-                    if target_name not in self.function_stack:
-                        self.function_stack[target_name] = self.fun_stack_pos
-                        self.fun_stack_pos += 1
-                        self.op_stack_pos += 1
-                    command = f"storel {self.function_stack[target_name]}\n"
-                    with open(self.filename, 'a') as f:
-                        f.write(command)
+                if isinstance(value, float):
+                    self.emit(Op.PUSHF, value)
                 else:
-                    if target_name not in self.stack:
-                        self.stack[target_name] = self.op_stack_pos
-                        self.op_stack_pos += 1
-
-                    command = f"storeg {self.stack[target_name]}\n"
-                    with open(self.filename, 'a') as f:
-                        f.write(command)
+                    self.emit(Op.PUSHI, value)
+                self.store(target_name)
             
         elif isinstance(node.value, LengthFunction):
-            expr = self.visit(node.value.expression)
+            expr = yield node.value.expression
             if isinstance(node.value.expression, Identifier):
-                command = f"pushg {self.stack[expr]}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command)
-            
-            command = "strlen\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-            
-            if self.in_function:
-                if target_name not in self.function_stack:
-                    self.function_stack[target_name] = self.fun_stack_pos
-                    self.fun_stack_pos += 1
-                    self.op_stack_pos += 1
-                command = f"storel {self.function_stack[target_name]}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command) 
-            else:
-                if target_name not in self.stack:
-                    self.stack[target_name] = self.op_stack_pos
-                    self.op_stack_pos += 1
-                    
-                command = f"storeg {self.stack[target_name]}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command) 
-
-        elif isinstance(node.value, BinaryOp):
-            self.visit(node.value)
+                self.load(expr)
             
-            if self.in_function:
-                if target_name not in self.function_stack:
-                    self.function_stack[target_name] = self.fun_stack_pos
-                    self.fun_stack_pos += 1
-                    self.op_stack_pos += 1
-                command = f"storel {self.function_stack[target_name]}\n"
+            self.emit(Op.STRLEN)
+            self.store(target_name)
+
+        elif isinstance(node.value, (BinaryOp, ArrayId)):
+            if isinstance(node.value, ArrayId):
+                # Como operando de uma BinaryOp: a célula onde ficou o último valor lido
+                array_name = yield node.value
+                self.load(array_name)
             else:
-                if target_name not in self.stack:
-                    self.stack[target_name] = self.op_stack_pos
-                    self.op_stack_pos += 1
-                command = f"storeg {self.stack[target_name]}\n"
-            
-            with open(self.filename, 'a') as f:
-                f.write(command)
+                yield node.value
+            self.store(target_name)
 
         elif isinstance(node.value, Identifier):
-            var_name = self.visit(node.value)
+            var_name = yield node.value
 
             if self.current_function == target_name:
-                if var_name in self.function_stack:
-                    command = f"pushl {self.function_stack[var_name]}\nreturn\n"
-                else:
-                    command = f"pushg {self.stack[var_name]}\nreturn\n"
-                self.fun_stack_pos = 0
-                self.function_stack = {}
-                with open(self.filename, 'a') as f:
-                    f.write(command)
+                self.load(var_name)
+                self.emit(Op.RETURN)
                 return target_name
             
-            if self.in_function:
-                if target_name not in self.function_stack:
-                    self.function_stack[target_name] = self.fun_stack_pos
-                    self.fun_stack_pos += 1
-                    self.op_stack_pos += 1
-                
-                if var_name in self.function_stack:
-                    command = f"pushl {self.function_stack[var_name]}\nstorel {self.function_stack[target_name]}\n"
-                else:
-                    command = f"pushg {self.stack[var_name]}\nstorel {self.function_stack[target_name]}\n"
-            else:
-                if target_name not in self.stack:
-                    self.stack[target_name] = self.op_stack_pos
-                    self.op_stack_pos += 1
-
-                if var_name in self.function_stack:
-                    command = f"pushl {self.function_stack[var_name]}\nstoreg {self.stack[target_name]}\n"
-                else:
-                    command = f"pushg {self.stack[var_name]}\nstoreg {self.stack[target_name]}\n"
-            
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            self.load(var_name)
+            self.store(target_name)
 
         elif isinstance(node.value, ProcedureCall):
-            self.visit(node.value)
+            yield node.value
 
         return target_name
     
@@ -258,317 +217,265 @@ class Generator:
         if node.params is not None:
             for param in node.params:
                 if isinstance(param, Literal):
-                    param_type, phrase = self.visit(param) 
-                    phrase = phrase[1:-1]
-                    phrase = phrase.replace('"', '\\"')
-                    command = f'pushs "{phrase}"\nwrites\n'
-                    with open(self.filename, 'a') as f:
-                        f.write(command)
+                    param_type, value = yield param 
+                    if param_type == "PHRASE":
+                        self.emit(Op.PUSHS, value)
+                        self.emit(Op.WRITES)
+                    elif isinstance(value, float):
+                        self.emit(Op.PUSHF, value)
+                        self.emit(Op.WRITEF)
+                    else:
+                        self.emit(Op.PUSHI, int(value))
+                        self.emit(Op.WRITEI)
                 if isinstance(param, Identifier):
-                   param_name = self.visit(param)
+                   param_name = yield param
                    if self.types[param_name] == "integer":
                        if self.has_function:
-                           command = f"writei\n"
-                           with open(self.filename, 'a') as f:
-                               f.write(command)
+                           self.emit(Op.WRITEI)
                        else:
-                           command = f"pushg {self.stack[param_name]}\nwritei\n" 
-                           with open(self.filename, 'a') as f:
-                               f.write(command)
-        command = "writeln\n" 
-        with open(self.filename, 'a') as f:
-            f.write(command)
+                           self.load(param_name)
+                           self.emit(Op.WRITEI)
+        self.emit(Op.WRITELN)
         return None
 
     def visit_ReadlnStatement(self, node):
         if node.params is not None:
             for param in node.params:
                 if isinstance(param, ArrayId):
-                    array_name = self.visit(param)
+                    array_name = yield param
                     if self.types[array_name] == "integer":
-                        command = f"read\natoi\n"
-                        with open(self.filename, 'a') as f:
-                            f.write(command)
-                        self.stack[array_name] = self.op_stack_pos
-                        self.op_stack_pos += 1
+                        self.emit(Op.READ)
+                        self.emit(Op.ATOI)
+                        self.store(array_name)
 
                 if isinstance(param, Identifier):
-                    var_name = self.visit(param)
+                    var_name = yield param
                     if self.types[var_name] == "string":
-                        command = f"read\n"
-                        with open(self.filename, 'a') as f:
-                            f.write(command)
-                        self.stack[var_name] = self.op_stack_pos
-                        self.op_stack_pos += 1
+                        self.emit(Op.READ)
+                        self.store(var_name)
                     elif self.types[var_name] == "integer":
-                        command = f"read\natoi\n"
-                        with open(self.filename, 'a') as f:
-                            f.write(command)
-                        self.stack[var_name] = self.op_stack_pos
-                        self.op_stack_pos += 1
+                        self.emit(Op.READ)
+                        self.emit(Op.ATOI)
+                        self.store(var_name)
 
 
 
     def visit_ForStatement(self, node):
-        init_var_name = self.visit(node.init)
+        init_var_name = yield node.init
         
-        loop_start_label = f"FOR{self.loop_counter}"
-        loop_end_label = f"OUT{self.loop_counter}"
+        loop_start_label = Label(f"FOR{self.loop_counter}")
+        loop_end_label = Label(f"OUT{self.loop_counter}")
+        next_label = Label(f"NEXT{self.loop_counter}")
         self.loop_counter += 1
       
         limit = None
         if isinstance(node.limit, Literal):
-            limit_type, limit = self.visit(node.limit)
+            limit_type, limit = yield node.limit
         elif isinstance(node.limit, Identifier):
-            limit_name = self.visit(node.limit)
+            limit_name = yield node.limit
 
         if node.direction == "to":
-            with open(self.filename, 'a') as f:
-                f.write(f"{loop_start_label}:\n")
+            self.emit(Op.LABEL, loop_start_label)
            
+            self.load(init_var_name)
             if limit is not None:
-                if self.in_function:
-                    command = f"pushl {self.function_stack[init_var_name]}\npushi {limit}\ninfeq\njz {loop_end_label}\n"
-                else:
-                    command = f"pushg {self.stack[init_var_name]}\npushi {limit}\ninfeq\njz {loop_end_label}\n"
+                self.emit(Op.PUSHI, limit)
             else:
-                if self.in_function:
-                    command = f"pushl {self.function_stack[init_var_name]}\npushl {self.function_stack[limit_name]}\ninfeq\njz {loop_end_label}\n"
-                else:
-                    command = f"pushg {self.stack[init_var_name]}\npushg {self.stack[limit_name]}\ninfeq\njz {loop_end_label}\n"
-
-            with open(self.filename, 'a') as f:
-                f.write(command)
+                self.load(limit_name)
+            self.emit(Op.INFEQ)
+            self.emit(Op.JZ, loop_end_label)
             
-            self.visit(node.body)
+            yield from self.loop_body(node.body, next_label, loop_end_label)
+            self.place(next_label)
 
-            if self.in_function:
-                command = f"pushl {self.function_stack[init_var_name]}\npushi 1\nadd\nstorel {self.function_stack[init_var_name]}\n"
-            else:
-                command = f"pushg {self.stack[init_var_name]}\npushi 1\nadd\nstoreg {self.stack[init_var_name]}\n"
-            
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            self.load(init_var_name)
+            self.emit(Op.PUSHI, 1)
+            self.emit(Op.ADD)
+            self.store(init_var_name)
             
-            command = f"jump {loop_start_label}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            self.emit(Op.JUMP, loop_start_label)
 
-            with open(self.filename, 'a') as f:
-                f.write(f"{loop_end_label}:\n")
+            self.emit(Op.LABEL, loop_end_label)
         else:  # "downto" case
-            with open(self.filename, 'a') as f:
-                f.write(f"{loop_start_label}:\n")
+            self.emit(Op.LABEL, loop_start_label)
            
-            if self.in_function:
-                if limit is not None:
-                    command = f"pushl {self.function_stack[init_var_name]}\npushi {limit}\nsupeq\njz {loop_end_label}\n"
-                else:
-                    command = f"pushl {self.function_stack[init_var_name]}\npushl {self.function_stack[limit_name]}\nsupeq\njz {loop_end_label}\n"
+            self.load(init_var_name)
+            if limit is not None:
+                self.emit(Op.PUSHI, limit)
             else:
-                if limit is not None:
-                    command = f"pushg {self.stack[init_var_name]}\npushi {limit}\nsupeq\njz {loop_end_label}\n"
-                else:
-                    command = f"pushg {self.stack[init_var_name]}\npushg {self.stack[limit_name]}\nsupeq\njz {loop_end_label}\n"
-            
-            with open(self.filename, 'a') as f:
-                f.write(command)
+                self.load(limit_name)
+            self.emit(Op.SUPEQ)
+            self.emit(Op.JZ, loop_end_label)
 
-            self.visit(node.body)
+            yield from self.loop_body(node.body, next_label, loop_end_label)
+            self.place(next_label)
             
-            if self.in_function:
-                command = f"pushl {self.function_stack[init_var_name]}\npushi 1\nsub\nstorel {self.function_stack[init_var_name]}\n"
-            else:
-                command = f"pushg {self.stack[init_var_name]}\npushi 1\nsub\nstoreg {self.stack[init_var_name]}\n"
-            
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            self.load(init_var_name)
+            self.emit(Op.PUSHI, 1)
+            self.emit(Op.SUB)
+            self.store(init_var_name)
 
-            command = f"jump {loop_start_label}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            self.emit(Op.JUMP, loop_start_label)
 
-            with open(self.filename, 'a') as f:
-                f.write(f"{loop_end_label}:\n")
+            self.emit(Op.LABEL, loop_end_label)
 
     def visit_WhileStatement(self, node):
-        loop_start_label = f"WHILE{self.loop_counter}"
-        loop_end_label = f"ENDWHILE{self.loop_counter}"
+        loop_start_label = Label(f"WHILE{self.loop_counter}")
+        loop_end_label = Label(f"ENDWHILE{self.loop_counter}")
         self.loop_counter += 1
         
-        with open(self.filename, 'a') as f:
-            f.write(f"{loop_start_label}:\n")
+        self.emit(Op.LABEL, loop_start_label)
         
-        self.visit(node.condition)
+        yield from self.push_condition(node.condition)
         
-        command = f"jz {loop_end_label}\n"
-        with open(self.filename, 'a') as f:
-            f.write(command)
+        self.emit(Op.JZ, loop_end_label)
         
-        self.visit(node.body)
+        yield from self.loop_body(node.body, loop_start_label, loop_end_label)
         
-        command = f"jump {loop_start_label}\n"
-        with open(self.filename, 'a') as f:
-            f.write(command)
+        self.emit(Op.JUMP, loop_start_label)
         
-        with open(self.filename, 'a') as f:
-            f.write(f"{loop_end_label}:\n")
+        self.emit(Op.LABEL, loop_end_label)
         
         return None
 
+    def visit_RepeatStatement(self, node):
+        loop_start_label = Label(f"REPEAT{self.loop_counter}")
+        until_label = Label(f"UNTIL{self.loop_counter}")
+        loop_end_label = Label(f"ENDREPEAT{self.loop_counter}")
+        self.loop_counter += 1
+
+        self.emit(Op.LABEL, loop_start_label)
+
+        yield from self.loop_body(node.body, until_label, loop_end_label)
+        self.place(until_label)
+
+        # Repete enquanto a condição for falsa
+        yield from self.push_condition(node.condition)
+        self.emit(Op.JZ, loop_start_label)
+
+        self.place(loop_end_label)
+        return None
+
+    def visit_BreakStatement(self, node):
+        self.jumped.add(self.loops[-1][1])
+        self.emit(Op.JUMP, self.loops[-1][1])
+        return None
+
+    def visit_ContinueStatement(self, node):
+        self.jumped.add(self.loops[-1][0])
+        self.emit(Op.JUMP, self.loops[-1][0])
+        return None
+
     def visit_IfStatement(self, node):
-        # Se a condição é apenas um Identifier, precisamos fazer push do seu valor
-        if isinstance(node.condition, Identifier):
-            var_name = self.visit(node.condition)
-            if self.in_function and var_name in self.function_stack:
-                command = f"pushl {self.function_stack[var_name]}\n"
-            else:
-                command = f"pushg {self.stack[var_name]}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-        else:
-            self.visit(node.condition)
+        yield from self.push_condition(node.condition)
 
-        else_label = f"ELSE{self.if_counter}"
-        end_if_label = f"ENDIF{self.if_counter}"
+        else_label = Label(f"ELSE{self.if_counter}")
+        end_if_label = Label(f"ENDIF{self.if_counter}")
         self.if_counter += 1
 
-        command = f"jz {else_label}\n"
-        with open(self.filename, 'a') as f:
-            f.write(command)
+        self.emit(Op.JZ, else_label)
 
-        self.visit(node.then_branch)
+        yield node.then_branch
 
-        command = f"jump {end_if_label}\n"
-        with open(self.filename, 'a') as f:
-            f.write(command)
+        self.emit(Op.JUMP, end_if_label)
 
-        with open(self.filename, 'a') as f:
-            f.write(f"{else_label}:\n")
+        self.emit(Op.LABEL, else_label)
         
         if node.else_branch:
-            self.visit(node.else_branch)
+            yield node.else_branch
 
-        with open(self.filename, 'a') as f:
-            f.write(f"{end_if_label}:\n")
+        self.emit(Op.LABEL, end_if_label)
             
         return None
 
+    def push_condition(self, condition):
+        # Uma condição que é só uma variável ou um literal não emite nada ao ser visitada
+        if isinstance(condition, Identifier):
+            var_name = yield condition
+            self.load(var_name)
+        elif isinstance(condition, Literal):
+            self.emit(Op.PUSHI, int(condition.value))
+        else:
+            yield condition
+
     def visit_BinaryOp(self, node):
         if isinstance(node.left, Identifier):
-            left_name = self.visit(node.left)
-            if self.in_function and left_name in self.function_stack:
-                command = f"pushl {self.function_stack[left_name]}\n"
-            else:
-                command = f"pushg {self.stack[left_name]}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            left_name = yield node.left
+            self.load(left_name)
         elif isinstance(node.left, Literal):
-            left_type, left_value = self.visit(node.left)
-            command = f"pushi {left_value}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            left_type, left_value = yield node.left
+            if isinstance(left_value, float):
+                self.emit(Op.PUSHF, left_value)
+            else:
+                self.emit(Op.PUSHI, int(left_value))
         elif isinstance(node.left, ArrayId):
-            array_name = self.visit(node.left)
-            command = f"pushg {self.stack[array_name]}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            array_name = yield node.left
+            self.load(array_name)
 
             if self.types[array_name] == "string":
-               pascal_index = self.visit(node.left.expression) 
-               if self.in_function and pascal_index in self.function_stack:
-                   command = f"pushl {self.function_stack[pascal_index]}\npushi 1\nsub\ncharat\n"
-               else: 
-                   command = f"pushg {self.stack[pascal_index]}\npushi 1\nsub\ncharat\n"
-               with open(self.filename, 'a') as f:
-                   f.write(command)
+               pascal_index = yield node.left.expression 
+               self.load(pascal_index)
+               self.emit(Op.PUSHI, 1)
+               self.emit(Op.SUB)
+               self.emit(Op.CHARAT)
         elif isinstance(node.left, BinaryOp):
-            self.visit(node.left)
+            yield node.left
 
         if isinstance(node.right, ArrayId):
-            array_name = self.visit(node.right)
-            command = f"pushg {self.stack[array_name]}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            array_name = yield node.right
+            self.load(array_name)
         elif isinstance(node.right, Identifier):
-            right_name = self.visit(node.right)
-            if self.in_function and right_name in self.function_stack:
-                command = f"pushl {self.function_stack[right_name]}\n"
-            else:
-                command = f"pushg {self.stack[right_name]}\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            right_name = yield node.right
+            self.load(right_name)
         elif isinstance(node.right, Literal):
-            right_type, right_value = self.visit(node.right)
-            if right_type == "NUMBER":
-                command = f"pushi {right_value}\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command)
-            elif right_type == "PHRASE":
-                right_value = right_value[1:-1]
-                right_value = f'"{right_value}"'
-                command = f"pushs {right_value}\npushi 0\ncharat\n"
-                with open(self.filename, 'a') as f:
-                    f.write(command)
+            right_type, right_value = yield node.right
+            if right_type == "PHRASE":
+                self.emit(Op.PUSHS, right_value)
+                self.emit(Op.PUSHI, 0)
+                self.emit(Op.CHARAT)
+            elif isinstance(right_value, float):
+                self.emit(Op.PUSHF, right_value)
+            else:
+                self.emit(Op.PUSHI, int(right_value))
         elif isinstance(node.right, BinaryOp):
-            self.visit(node.right)
-
-        if node.operator == '+':
-            command = f"add\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-        elif node.operator == '-':
-            command = f"sub\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-        elif node.operator == '*':
-            command = f"mul\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-        elif node.operator == 'div':
-            command = f"div\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-
-        elif node.operator == 'mod':
-            command = f"mod\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+            yield node.right
+
+        if node.operator == Operator.PLUS:
+            self.emit(Op.ADD)
+        elif node.operator == Operator.MINUS:
+            self.emit(Op.SUB)
+        elif node.operator == Operator.TIMES:
+            self.emit(Op.MUL)
+        elif node.operator == Operator.DIV:
+            self.emit(Op.DIV)
+
+        elif node.operator == Operator.MOD:
+            self.emit(Op.MOD)
                 
-        elif node.operator == '=':
-            command = f"equal\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+        elif node.operator == Operator.EQ:
+            self.emit(Op.EQUAL)
         
-        elif node.operator == '>':
-            command = f"sup\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-
-        elif node.operator == '<':
-            command = f"inf\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-
-        elif node.operator == '<=':
-            command = f"infeq\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
-
-        elif node.operator == '>=':
-            command = f"supeq\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+        elif node.operator == Operator.NE:
+            self.emit(Op.EQUAL)
+            self.emit(Op.NOT)
+
+        elif node.operator == Operator.GT:
+            self.emit(Op.SUP)
+
+        elif node.operator == Operator.LT:
+            self.emit(Op.INF)
+
+        elif node.operator == Operator.LE:
+            self.emit(Op.INFEQ)
+
+        elif node.operator == Operator.GE:
+            self.emit(Op.SUPEQ)
             
-        elif node.operator == 'and':
-            command = f"and\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+        elif node.operator == Operator.AND:
+            self.emit(Op.AND)
             
-        elif node.operator == 'or':
-            command = f"or\n"
-            with open(self.filename, 'a') as f:
-                f.write(command)
+        elif node.operator == Operator.OR:
+            self.emit(Op.OR)
 
     def visit_Identifier(self, node):
         return node.name
@@ -580,7 +487,7 @@ class Generator:
         return node.id_name
 
     def visit_ArrayType(self, node):
-        return self.visit(node.element_type) 
+        return (yield node.element_type) 
 
     def visit_Type(self, node):
         return node.type_name
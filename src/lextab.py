@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ARRAY', 'ASSIGN', 'BEGIN', 'BOOL', 'BOOLEAN', 'BREAK', 'CASE', 'COLON', 'COMMA', 'CONTINUE', 'DIFFERENT', 'DIV', 'DIVIDE', 'DO', 'DOT', 'DOWNTO', 'ELSE', 'END', 'EQUALS', 'FOR', 'FUNCTION', 'GREATEREQUAL', 'GREATERTHAN', 'ID', 'IF', 'INTEGER', 'LBRACKET', 'LENGTH', 'LESSEQUAL', 'LESSTHAN', 'LPAREN', 'MINUS', 'MOD', 'NOT', 'NUMBER', 'OF', 'OR', 'PHRASE', 'PLUS', 'PROCEDURE', 'PROGRAM', 'RANGE', 'RBRACKET', 'READ', 'READLN', 'REAL', 'REPEAT', 'RPAREN', 'SEMICOLON', 'STRING', 'THEN', 'TIMES', 'TO', 'UNTIL', 'VAR', 'WHILE', 'WRITE', 'WRITELN'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_NUMBER>\\d+(\\.\\d+)?)|(?P<t_PHRASE>'[^']*')|(?P<t_COMMENT>\\{[^}]*\\}|\\(\\*[^*]*\\*\\))|(?P<t_NEWLINE>\\n+)|(?P<t_RANGE>\\.\\.)|(?P<t_ASSIGN>:=)|(?P<t_DIFFERENT><>)|(?P<t_DOT>\\.)|(?P<t_GREATEREQUAL>>=)|(?P<t_LBRACKET>\\[)|(?P<t_LESSEQUAL><=)|(?P<t_LPAREN>\\()|(?P<t_PLUS>\\+)|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_EQUALS>=)|(?P<t_GREATERTHAN>>)|(?P<t_LESSTHAN><)|(?P<t_MINUS>-)|(?P<t_SEMICOLON>;)", [None, ('t_ID', 'ID'), ('t_NUMBER', 'NUMBER'), None, ('t_PHRASE', 'PHRASE'), ('t_COMMENT', 'COMMENT'), ('t_NEWLINE', 'NEWLINE'), (None, 'RANGE'), (None, 'ASSIGN'), (None, 'DIFFERENT'), (None, 'DOT'), (None, 'GREATEREQUAL'), (None, 'LBRACKET'), (None, 'LESSEQUAL'), (None, 'LPAREN'), (None, 'PLUS'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'EQUALS'), (None, 'GREATERTHAN'), (None, 'LESSTHAN'), (None, 'MINUS'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_signature = '73a0e2d989fa78a8acfd3f0d51122f24'
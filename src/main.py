@@ -1,48 +1,173 @@
+import argparse
+import os
 import sys
+from contextlib import nullcontext, redirect_stdout
 from pasAnalex import lexer
-from pasSyn import parser, print_ast
-from ASTOptimizer import ASTOptimizer
+from pasSyn import parser
+from ASTCache import ASTCache, DEFAULT_MAX_BYTES
+from ASTDump import DUMP_FORMATS, dump_ast
+from CompileStats import CompileStats, count_nodes
+from Inliner import DEFAULT_THRESHOLD
+from LoopUnrolling import DEFAULT_FACTOR
+from PassManager import OPT_LEVELS, VM_PASSES, PassManager
 from pasSem import ASTSemanticAnalyzer
 from code_generator import Generator
 
+def parse_args():
+    args = argparse.ArgumentParser(description="Compile a Pascal program to EWVM code (written to ../vm/<name>.vm).")
+    args.add_argument('filename')
+    args.add_argument('-O', dest='opt_level', type=int, choices=sorted(OPT_LEVELS), default=1, metavar='LEVEL',
+                      help="optimization level: 0 constant folding only, 1 one pass of each optimization, 2 repeat to a fixed point "
+                           "(default: %(default)s)")
+    args.add_argument('--inline-threshold', type=int, default=DEFAULT_THRESHOLD, metavar='NODES',
+                      help="inline subprograms called more than once only up to this many AST nodes "
+                           "(default: %(default)s)")
+    args.add_argument('--unroll-factor', type=int, default=DEFAULT_FACTOR, metavar='N',
+                      help="copies of the body per iteration when a long for loop with constant bounds is "
+                           "unrolled, below 2 only short loops are unrolled (default: %(default)s)")
+    args.add_argument('--dump-ast', choices=DUMP_FORMATS, metavar='FORMAT',
+                      help=f"dump the AST before and after optimization ({', '.join(DUMP_FORMATS)})")
+    args.add_argument('--dump-dir', metavar='DIR',
+                      help="write the AST dumps to <DIR>/<name>.<stage>.<ext> instead of stdout")
+    args.add_argument('--cache-dir', metavar='DIR',
+                      help="reuse parsed/optimized ASTs of unchanged sources from this cache directory")
+    args.add_argument('--cache-size', type=float, default=DEFAULT_MAX_BYTES / 2**20, metavar='MB',
+                      help="evict least recently used cache entries above this size (default: %(default)g)")
+    args.add_argument('--stats', nargs='?', const='text', choices=('text', 'json'), metavar='FORMAT',
+                      help="report wall/CPU time, peak memory and node/instruction counts per phase (text or json; "
+                           "with json on stdout the progress messages go to stderr)")
+    args.add_argument('--stats-file', metavar='FILE',
+                      help="write the --stats report to FILE instead of stdout")
+    return args.parse_args()
+
+def dump(ast, stage, opts):
+    if opts.dump_dir:
+        name = os.path.splitext(os.path.basename(opts.filename))[0]
+        path = os.path.join(opts.dump_dir, f"{name}.{stage}.{DUMP_FORMATS[opts.dump_ast]}")
+        with open(path, 'w') as f:
+            dump_ast(ast, f, opts.dump_ast)
+        print(f"AST dump written to {path}")
+    else:
+        dump_ast(ast, sys.stdout, opts.dump_ast)
+        print()
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python main.py <filename>")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
+    opts = parse_args()
+    if opts.stats == 'json' and not opts.stats_file:
+        # O stdout fica só com o relatório, para ser lido por outro programa
+        report_out = sys.stdout
+        with redirect_stdout(sys.stderr):
+            return compile_file(opts, report_out)
+    return compile_file(opts, sys.stdout)
+
+def compile_file(opts, report_out):
+    filename = opts.filename
     print(f"\nCompiling file: {filename}\n")
-    
+
+    stats = CompileStats() if opts.stats else None
+    phase = stats.phase if stats else lambda name: nullcontext({})
+
     print("Phase 1: Lexical and syntax analysis...")
-    with open(filename, 'r') as file:
-        data = file.read()
-    
-    ast = parser.parse(data)
-    print(print_ast(ast))
-    if not ast:
-        print("Syntax analysis failed.")
-        sys.exit(1)
-    print("Syntax analysis completed successfully.")
-    
-    print("\nPhase 2: AST Optimization...")
-    optimizer = ASTOptimizer()
-    optimized_ast = optimizer.optimize(ast)
-    print("AST Optimization completed.")
-    
-    print("\nOptimized AST:")
-    print(print_ast(optimized_ast))
-    
+    with phase("parse") as record:
+        with open(filename, 'r') as file:
+            data = file.read()
+
+        cache = ASTCache(opts.cache_dir, int(opts.cache_size * 2**20)) if opts.cache_dir else None
+        # O dump da AST original precisa da árvore antes da otimização
+        optimized_stage = f"optimized-O{opts.opt_level}-inline{opts.inline_threshold}-unroll{opts.unroll_factor}"
+        optimized_ast = cache.get(data, optimized_stage) if cache and not opts.dump_ast else None
+
+        if optimized_ast is not None:
+            print("Parsed and optimized AST loaded from cache.")
+            if stats:
+                record["cache"] = "hit"
+                record["optimized_nodes"] = count_nodes(optimized_ast)
+        else:
+            ast = cache.get(data, 'parsed') if cache else None
+            if ast is not None:
+                print("Parsed AST loaded from cache.")
+            else:
+                ast = parser.parse(data)
+                if not ast:
+                    print("Syntax analysis failed.")
+                    sys.exit(1)
+                print("Syntax analysis completed successfully.")
+                if cache:
+                    cache.put(data, 'parsed', ast)
+            if stats:
+                record["nodes"] = count_nodes(ast)
+    if opts.dump_ast and optimized_ast is None:
+        dump(ast, 'parsed', opts)
+
+    if optimized_ast is None:
+        print(f"\nPhase 2: AST Optimization (-O{opts.opt_level})...")
+        with phase("optimize") as record:
+            pass_manager = PassManager.for_level(opts.opt_level, {'inline': {'threshold': opts.inline_threshold},
+                                                                 'unroll': {'factor': opts.unroll_factor}})
+            optimized_ast = pass_manager.run(ast)
+            if cache:
+                cache.put(data, optimized_stage, optimized_ast)
+            if stats:
+                record["nodes"] = count_nodes(optimized_ast)
+                record["iterations"] = pass_manager.iterations
+                record["passes"] = [dict(name=name, **pass_stats) for name, pass_stats in pass_manager.stats.items()]
+                record["notes"] = pass_manager.notes
+        iterations = pass_manager.iterations
+        print(f"AST Optimization completed ({iterations} iteration{'s' if iterations != 1 else ''}, "
+              f"{pass_manager.total_rewrites()} rewrites).")
+        for note in pass_manager.notes:
+            print(f"  {note}")
+
+    if opts.dump_ast:
+        print("\nOptimized AST:")
+        dump(optimized_ast, 'optimized', opts)
+
+    if cache:
+        cache.save_stats()
+        print(f"AST cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses, "
+              f"{cache.stats['evictions']} evictions")
+
     print("\nPhase 3: Semantic Analysis...")
-    semantic_analyzer = ASTSemanticAnalyzer()
-    if not semantic_analyzer.analyze(optimized_ast):
+    with phase("semantic"):
+        semantic_analyzer = ASTSemanticAnalyzer()
+        ok = semantic_analyzer.analyze(optimized_ast)
+    if not ok:
         print("Semantic analysis failed with errors.")
         sys.exit(1)
     print("Semantic analysis completed successfully.")
-    
-    
+
     generator = Generator(filename)
-    generator.generate(optimized_ast)
+    with phase("codegen") as record:
+        generator.visit(optimized_ast)
+        if stats:
+            record["instructions"] = generator.instruction_count()
+    if opts.opt_level > 0:
+        for name, optimizer_class in VM_PASSES.items():
+            with phase(name) as record:
+                optimizer = optimizer_class()
+                generator.code = optimizer.optimize(generator.code)
+                if stats:
+                    record["instructions"] = generator.instruction_count()
+                    record.update(optimizer.applied)
+            summary = ', '.join(f"{key} {count}" for key, count in sorted(optimizer.applied.items()))
+            print(f"VM {name} pass: {summary or 'no changes'}.")
+    with phase("output") as record:
+        generator.write()
+        if stats:
+            record["bytes"] = os.path.getsize(generator.filename)
+    print("Code generation completed")
 
+    if stats:
+        stats.stop()
+        report = stats.report(opts.stats)
+        if opts.stats_file:
+            with open(opts.stats_file, 'w') as f:
+                f.write(report + "\n")
+        elif opts.stats == 'json':
+            print(report, file=report_out)
+        else:
+            print("\nCompile statistics:")
+            print(report)
 
     print("\nCompilation successful!")
     return 0
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programleftPLUSMINUSleftTIMESDIVIDEleftDIVMODleftEQUALSDIFFERENTLESSEQUALLESSTHANGREATERTHANGREATEREQUALleftORANDAND ARRAY ASSIGN BEGIN BOOL BOOLEAN BREAK CASE COLON COMMA CONTINUE DIFFERENT DIV DIVIDE DO DOT DOWNTO ELSE END EQUALS FOR FUNCTION GREATEREQUAL GREATERTHAN ID IF INTEGER LBRACKET LENGTH LESSEQUAL LESSTHAN LPAREN MINUS MOD NOT NUMBER OF OR PHRASE PLUS PROCEDURE PROGRAM RANGE RBRACKET READ READLN REAL REPEAT RPAREN SEMICOLON STRING THEN TIMES TO UNTIL VAR WHILE WRITE WRITELNprogram : header SEMICOLON block DOTheader : PROGRAM IDblock : variable_declaration_part procedure_or_function statement_part \n               | variable_declaration_part procedure_or_function variable_declaration_part statement_partvariable_declaration_part : VAR variable_declaration_list\n                                | variable_declaration_list : variable_declaration_list variable_declaration\n                                | variable_declarationvariable_declaration : id_list COLON type SEMICOLONid_list : ID\n               | ID LBRACKET expression RBRACKET \n               | ID COMMA id_list\n               | ID LBRACKET expression RBRACKET COMMA id_listprocedure_or_function : proc_or_func_declaration SEMICOLON procedure_or_function\n                            | proc_or_func_declaration : procedure_declaration\n                               | function_declarationprocedure_declaration : procedure_heading SEMICOLON blockprocedure_heading : PROCEDURE ID\n                        | PROCEDURE ID LPAREN parameter_list RPARENfunction_declaration : function_heading SEMICOLON blockfunction_heading : FUNCTION type\n                        | FUNCTION ID COLON type\n                        | FUNCTION ID LPAREN parameter_list RPAREN COLON typeparameter_list : parameter COMMA parameter_list\n                     | parameterparameter : ID COLON typetype : REAL\n            | INTEGER\n            | BOOLEAN\n            | STRING\n            | array_typearray_type : ARRAY LBRACKET range RBRACKET OF typerange : expression RANGE expressionstatement_part : BEGIN statement_sequence ENDstatement_sequence : statement SEMICOLON statement_sequence\n                         | statementstatement : assignment_statement\n                | statement_part\n                | if_statement\n                | while_statement\n                | repeat_statement\n                | for_statement\n                | procedure_or_function_call\n                | writeln_statement\n                | readln_statement\n                | break_statement\n                | continue_statement\n                | case_statement\n                | case_statement : CASE expression OF case_list ENDcase_list : case_option SEMICOLON case_list\n                 | case_option SEMICOLONcase_option : NUMBER COLON statement\n                  | BOOL COLON statement\n                  | PHRASE COLON statement\n                  | ID COLON statementwriteln_statement : WRITELN LPAREN param_list RPAREN\n                         | WRITELN LPAREN RPAREN\n                         | WRITE LPAREN param_list RPAREN\n                         | WRITE LPAREN RPARENreadln_statement : READLN LPAREN id_list RPAREN\n                       | READLN LPAREN RPAREN\n                       | READ LPAREN id_list RPAREN\n                       | READ LPAREN RPARENbreak_statement : BREAKcontinue_statement : CONTINUEprocedure_or_function_call : ID LPAREN param_list RPAREN\n                                 | ID LPAREN RPAREN\n                                 | IDparam_list : param_list COMMA param\n                  | paramparam : expressionif_statement : IF expression THEN statement ELSE statement\n                    | IF expression THEN statementwhile_statement : WHILE expression DO statementrepeat_statement : REPEAT statement UNTIL expressionfor_statement : FOR assignment_statement TO expression DO statement\n                    | FOR assignment_statement DOWNTO expression DO statementassignment_statement : ID ASSIGN expression\n                            | ID ASSIGN procedure_or_function_call\n                            | ID LBRACKET expression RBRACKET ASSIGN expressionexpression : expression and_or expression_m\n                  | expression_mexpression_m : expression_s\n                   | expression_m sign expression_sexpression_s : element\n                   | expression_s psign elementand_or : AND\n              | ORpsign : TIMES\n             | DIVIDEsign : PLUS\n            | MINUS\n            | DIV\n            | MOD\n            | EQUALS\n            | DIFFERENT\n            | LESSTHAN\n            | LESSEQUAL\n            | GREATERTHAN\n            | GREATEREQUALlength_function : LENGTH LPAREN expression RPARENelement : ID\n               | NUMBER\n               | BOOL\n               | PHRASE\n               | LPAREN expression RPAREN\n               | NOT element\n               | length_function\n               | ID LBRACKET expression RBRACKET\n               | procedure_or_function_call'
+_lr_signature = 'programleftPLUSMINUSleftTIMESDIVIDEleftDIVMODleftEQUALSDIFFERENTLESSEQUALLESSTHANGREATERTHANGREATEREQUALleftORANDAND ARRAY ASSIGN BEGIN BOOL BOOLEAN BREAK CASE COLON COMMA CONTINUE DIFFERENT DIV DIVIDE DO DOT DOWNTO ELSE END EQUALS FOR FUNCTION GREATEREQUAL GREATERTHAN ID IF INTEGER LBRACKET LENGTH LESSEQUAL LESSTHAN LPAREN MINUS MOD NOT NUMBER OF OR PHRASE PLUS PROCEDURE PROGRAM RANGE RBRACKET READ READLN REAL REPEAT RPAREN SEMICOLON STRING THEN TIMES TO UNTIL VAR WHILE WRITE WRITELNprogram : header SEMICOLON block DOTheader : PROGRAM IDblock : variable_declaration_part procedure_or_function statement_part \n               | variable_declaration_part procedure_or_function variable_declaration_part statement_partvariable_declaration_part : VAR variable_declaration_list\n                                | variable_declaration_list : variable_declaration_list variable_declaration\n                                | variable_declarationvariable_declaration : id_list COLON type SEMICOLONid_list : ID\n               | ID LBRACKET expression RBRACKET \n               | id_list COMMA ID\n               | id_list COMMA ID LBRACKET expression RBRACKETprocedure_or_function : procedure_or_function proc_or_func_declaration SEMICOLON\n                            | proc_or_func_declaration : procedure_declaration\n                               | function_declarationprocedure_declaration : procedure_heading SEMICOLON blockprocedure_heading : PROCEDURE ID\n                        | PROCEDURE ID LPAREN parameter_list RPARENfunction_declaration : function_heading SEMICOLON blockfunction_heading : FUNCTION type\n                        | FUNCTION ID COLON type\n                        | FUNCTION ID LPAREN parameter_list RPAREN COLON typeparameter_list : parameter_list COMMA parameter\n                     | parameterparameter : ID COLON typetype : REAL\n            | INTEGER\n            | BOOLEAN\n            | STRING\n            | array_typearray_type : ARRAY LBRACKET range RBRACKET OF typerange : expression RANGE expressionstatement_part : BEGIN statement_sequence ENDstatement_sequence : statement_sequence SEMICOLON statement\n                         | statementstatement : assignment_statement\n                | statement_part\n                | if_statement\n                | while_statement\n                | repeat_statement\n                | for_statement\n                | procedure_or_function_call\n                | writeln_statement\n                | readln_statement\n                | break_statement\n                | continue_statement\n                | case_statement\n                | case_statement : CASE expression OF case_list ENDcase_list : case_list case_option SEMICOLON\n                 | case_option SEMICOLONcase_option : NUMBER COLON statement\n                  | BOOL COLON statement\n                  | PHRASE COLON statement\n                  | ID COLON statementwriteln_statement : WRITELN LPAREN param_list RPAREN\n                         | WRITELN LPAREN RPAREN\n                         | WRITE LPAREN param_list RPAREN\n                         | WRITE LPAREN RPARENreadln_statement : READLN LPAREN id_list RPAREN\n                       | READLN LPAREN RPAREN\n                       | READ LPAREN id_list RPAREN\n                       | READ LPAREN RPARENbreak_statement : BREAKcontinue_statement : CONTINUEprocedure_or_function_call : ID LPAREN param_list RPAREN\n                                 | ID LPAREN RPAREN\n                                 | IDparam_list : param_list COMMA param\n                  | paramparam : expressionif_statement : IF expression THEN statement ELSE statement\n                    | IF expression THEN statementwhile_statement : WHILE expression DO statementrepeat_statement : REPEAT statement UNTIL expressionfor_statement : FOR assignment_statement TO expression DO statement\n                    | FOR assignment_statement DOWNTO expression DO statementassignment_statement : ID ASSIGN expression\n                            | ID ASSIGN procedure_or_function_call\n                            | ID LBRACKET expression RBRACKET ASSIGN expressionexpression : expression and_or expression_m\n                  | expression_mexpression_m : expression_s\n                   | expression_m sign expression_sexpression_s : element\n                   | expression_s psign elementand_or : AND\n              | ORpsign : TIMES\n             | DIVIDEsign : PLUS\n            | MINUS\n            | DIV\n            | MOD\n            | EQUALS\n            | DIFFERENT\n            | LESSTHAN\n            | LESSEQUAL\n            | GREATERTHAN\n            | GREATEREQUALlength_function : LENGTH LPAREN expression RPARENelement : ID\n               | NUMBER\n               | BOOL\n               | PHRASE\n               | LPAREN expression RPAREN\n               | NOT element\n               | length_function\n               | ID LBRACKET expression RBRACKET\n               | procedure_or_function_call'
     
-_lr_action_items = {'PROGRAM':([0,],[3,]),'$end':([1,9,],[0,-1,]),'SEMICOLON':([2,5,11,12,13,14,15,23,24,28,29,31,32,33,34,35,41,43,44,45,46,47,48,49,50,51,52,53,54,55,56,65,66,69,70,75,76,78,79,80,81,82,83,86,87,90,91,108,133,136,137,138,141,144,145,150,152,154,156,159,166,167,168,169,172,174,175,176,179,180,181,182,184,194,196,199,200,201,202,204,205,206,207,208,209,210,211,212,213,215,216,217,218,],[4,-2,25,-16,-17,26,27,-3,-50,-19,-22,-28,-29,-30,-31,-32,-4,91,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-66,-67,-18,-21,112,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,-50,-23,-109,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-20,-83,-86,-88,-108,-68,-75,-76,-77,-58,-60,-62,-64,203,-111,-103,-50,-50,-50,-51,-50,-50,-50,-50,-24,-33,-82,-74,-78,-79,-54,-55,-56,-57,]),'ID':([3,8,16,17,18,19,24,37,39,40,57,58,59,60,67,71,73,74,84,85,91,92,93,94,100,101,102,103,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,144,145,146,147,148,157,160,163,165,173,197,199,200,201,203,204,205,206,207,],[5,21,28,30,21,-8,56,-7,76,21,76,76,56,99,76,105,105,76,76,76,56,136,76,76,76,76,21,21,-9,76,76,-89,-90,76,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,76,-91,-92,76,56,56,76,76,76,188,105,76,21,76,76,56,56,56,188,56,56,56,56,]),'VAR':([4,7,10,18,19,25,26,27,37,68,112,],[8,-15,8,-5,-8,-15,8,8,-7,-14,-9,]),'PROCEDURE':([4,7,18,19,25,26,27,37,112,],[-6,16,-5,-8,16,-6,-6,-7,-9,]),'FUNCTION':([4,7,18,19,25,26,27,37,112,],[-6,17,-5,-8,17,-6,-6,-7,-9,]),'BEGIN':([4,7,10,18,19,22,24,25,26,27,37,59,68,91,112,144,145,199,200,201,204,205,206,207,],[-6,-15,24,-5,-8,24,24,-15,-6,-6,-7,24,-14,24,-9,24,24,24,24,24,24,24,24,24,]),'DOT':([6,23,41,90,],[9,-3,-4,-35,]),'REAL':([17,38,72,158,191,192,],[31,31,31,31,31,31,]),'INTEGER':([17,38,72,158,191,192,],[32,32,32,32,32,32,]),'BOOLEAN':([17,38,72,158,191,192,],[33,33,33,33,33,33,]),'STRING':([17,38,72,158,191,192,],[34,34,34,34,34,34,]),'ARRAY':([17,38,72,158,191,192,],[36,36,36,36,36,36,]),'COLON':([20,21,30,89,105,114,161,185,186,187,188,195,],[38,-10,72,-12,158,-11,191,204,205,206,207,-13,]),'RPAREN':([21,31,32,33,34,35,76,78,79,80,81,82,83,86,87,89,94,100,101,102,103,106,107,109,114,132,133,140,141,142,143,149,151,153,155,166,167,168,169,170,172,189,190,194,195,196,198,209,],[-10,-28,-29,-30,-31,-32,-70,-84,-85,-87,-105,-106,-107,-110,-112,-12,141,150,152,154,156,159,-26,161,-11,169,-109,172,-69,-72,-73,179,180,181,182,-83,-86,-88,-108,196,-68,-27,-25,-111,-13,-103,-71,-33,]),'LBRACKET':([21,36,56,76,99,136,],[39,74,93,113,93,113,]),'COMMA':([21,31,32,33,34,35,76,78,79,80,81,82,83,86,87,107,114,133,140,141,142,143,149,151,166,167,168,169,172,189,194,196,198,209,],[40,-28,-29,-30,-31,-32,-70,-84,-85,-87,-105,-106,-107,-110,-112,160,165,-109,173,-69,-72,-73,173,173,-83,-86,-88,-108,-68,-27,-111,-103,-71,-33,]),'END':([24,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,65,66,76,78,79,80,81,82,83,86,87,90,91,133,135,136,137,138,141,144,145,150,152,154,156,166,167,168,169,172,174,175,176,179,180,181,182,183,194,196,199,200,201,202,203,210,211,212,213,214,],[-50,90,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-66,-67,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,-50,-109,-36,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-83,-86,-88,-108,-68,-75,-76,-77,-58,-60,-62,-64,202,-111,-103,-50,-50,-50,-51,-53,-82,-74,-78,-79,-52,]),'IF':([24,59,91,144,145,199,200,201,204,205,206,207,],[57,57,57,57,57,57,57,57,57,57,57,57,]),'WHILE':([24,59,91,144,145,199,200,201,204,205,206,207,],[58,58,58,58,58,58,58,58,58,58,58,58,]),'REPEAT':([24,59,91,144,145,199,200,201,204,205,206,207,],[59,59,59,59,59,59,59,59,59,59,59,59,]),'FOR':([24,59,91,144,145,199,200,201,204,205,206,207,],[60,60,60,60,60,60,60,60,60,60,60,60,]),'WRITELN':([24,59,91,144,145,199,200,201,204,205,206,207,],[61,61,61,61,61,61,61,61,61,61,61,61,]),'WRITE':([24,59,91,144,145,199,200,201,204,205,206,207,],[62,62,62,62,62,62,62,62,62,62,62,62,]),'READLN':([24,59,91,144,145,199,200,201,204,205,206,207,],[63,63,63,63,63,63,63,63,63,63,63,63,]),'READ':([24,59,91,144,145,199,200,201,204,205,206,207,],[64,64,64,64,64,64,64,64,64,64,64,64,]),'BREAK':([24,59,91,144,145,199,200,201,204,205,206,207,],[65,65,65,65,65,65,65,65,65,65,65,65,]),'CONTINUE':([24,59,91,144,145,199,200,201,204,205,206,207,],[66,66,66,66,66,66,66,66,66,66,66,66,]),'CASE':([24,59,91,144,145,199,200,201,204,205,206,207,],[67,67,67,67,67,67,67,67,67,67,67,67,]),'LPAREN':([28,30,39,56,57,58,61,62,63,64,67,74,76,84,85,88,92,93,94,100,101,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,136,146,147,148,163,173,197,],[71,73,84,94,84,84,100,101,102,103,84,84,94,84,84,134,84,84,84,84,84,84,84,-89,-90,84,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,84,-91,-92,84,94,84,84,84,84,84,84,]),'NUMBER':([39,57,58,67,74,84,85,92,93,94,100,101,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,146,147,148,157,163,173,197,203,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,-89,-90,81,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,81,-91,-92,81,81,81,81,185,81,81,81,185,]),'BOOL':([39,57,58,67,74,84,85,92,93,94,100,101,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,146,147,148,157,163,173,197,203,],[82,82,82,82,82,82,82,82,82,82,82,82,82,82,-89,-90,82,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,82,-91,-92,82,82,82,82,186,82,82,82,186,]),'PHRASE':([39,57,58,67,74,84,85,92,93,94,100,101,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,146,147,148,157,163,173,197,203,],[83,83,83,83,83,83,83,83,83,83,83,83,83,83,-89,-90,83,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,83,-91,-92,83,83,83,83,187,83,83,83,187,]),'NOT':([39,57,58,67,74,84,85,92,93,94,100,101,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,146,147,148,163,173,197,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,-89,-90,85,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,85,-91,-92,85,85,85,85,85,85,85,]),'LENGTH':([39,57,58,67,74,84,85,92,93,94,100,101,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,146,147,148,163,173,197,],[88,88,88,88,88,88,88,88,88,88,88,88,88,88,-89,-90,88,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,88,-91,-92,88,88,88,88,88,88,88,]),'UNTIL':([44,45,46,47,48,49,50,51,52,53,54,55,56,59,65,66,76,78,79,80,81,82,83,86,87,90,97,133,136,137,138,141,144,145,150,152,154,156,166,167,168,169,172,174,175,176,179,180,181,182,194,196,199,200,201,202,210,211,212,213,],[-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-50,-66,-67,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,146,-109,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-83,-86,-88,-108,-68,-75,-76,-77,-58,-60,-62,-64,-111,-103,-50,-50,-50,-51,-82,-74,-78,-79,]),'ELSE':([44,45,46,47,48,49,50,51,52,53,54,55,56,65,66,76,78,79,80,81,82,83,86,87,90,133,136,137,138,141,144,145,150,152,154,156,166,167,168,169,172,174,175,176,179,180,181,182,194,196,199,200,201,202,210,211,212,213,],[-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-66,-67,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,-109,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-83,-86,-88,-108,-68,199,-76,-77,-58,-60,-62,-64,-111,-103,-50,-50,-50,-51,-82,-74,-78,-79,]),'ASSIGN':([56,99,171,],[92,92,197,]),'TIMES':([76,79,80,81,82,83,86,87,133,136,138,141,167,168,169,172,194,196,],[-70,130,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,130,-88,-108,-68,-111,-103,]),'DIVIDE':([76,79,80,81,82,83,86,87,133,136,138,141,167,168,169,172,194,196,],[-70,131,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,131,-88,-108,-68,-111,-103,]),'PLUS':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,119,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,119,-86,-88,-108,-68,-111,-103,]),'MINUS':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,120,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,120,-86,-88,-108,-68,-111,-103,]),'DIV':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,121,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,121,-86,-88,-108,-68,-111,-103,]),'MOD':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,122,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,122,-86,-88,-108,-68,-111,-103,]),'EQUALS':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,123,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,123,-86,-88,-108,-68,-111,-103,]),'DIFFERENT':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,124,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,124,-86,-88,-108,-68,-111,-103,]),'LESSTHAN':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,125,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,125,-86,-88,-108,-68,-111,-103,]),'LESSEQUAL':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,126,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,126,-86,-88,-108,-68,-111,-103,]),'GREATERTHAN':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,127,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,127,-86,-88,-108,-68,-111,-103,]),'GREATEREQUAL':([76,78,79,80,81,82,83,86,87,133,136,138,141,166,167,168,169,172,194,196,],[-70,128,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,128,-86,-88,-108,-68,-111,-103,]),'RBRACKET':([76,77,78,79,80,81,82,83,86,87,110,133,139,141,164,166,167,168,169,172,193,194,196,],[-70,114,-84,-85,-87,-105,-106,-107,-110,-112,162,-109,171,-69,194,-83,-86,-88,-108,-68,-34,-111,-103,]),'AND':([76,77,78,79,80,81,82,83,86,87,95,96,104,111,132,133,136,137,138,139,141,143,164,166,167,168,169,170,172,176,177,178,193,194,196,210,],[-70,116,-84,-85,-87,-105,-106,-107,-110,-112,116,116,116,116,116,-109,-70,116,-112,116,-69,116,116,-83,-86,-88,-108,116,-68,116,116,116,116,-111,-103,116,]),'OR':([76,77,78,79,80,81,82,83,86,87,95,96,104,111,132,133,136,137,138,139,141,143,164,166,167,168,169,170,172,176,177,178,193,194,196,210,],[-70,117,-84,-85,-87,-105,-106,-107,-110,-112,117,117,117,117,117,-109,-70,117,-112,117,-69,117,117,-83,-86,-88,-108,117,-68,117,117,117,117,-111,-103,117,]),'THEN':([76,78,79,80,81,82,83,86,87,95,133,141,166,167,168,169,172,194,196,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,144,-109,-69,-83,-86,-88,-108,-68,-111,-103,]),'DO':([76,78,79,80,81,82,83,86,87,96,133,141,166,167,168,169,172,177,178,194,196,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,145,-109,-69,-83,-86,-88,-108,-68,200,201,-111,-103,]),'OF':([76,78,79,80,81,82,83,86,87,104,133,141,162,166,167,168,169,172,194,196,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,157,-109,-69,192,-83,-86,-88,-108,-68,-111,-103,]),'RANGE':([76,78,79,80,81,82,83,86,87,111,133,141,166,167,168,169,172,194,196,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,163,-109,-69,-83,-86,-88,-108,-68,-111,-103,]),'TO':([76,78,79,80,81,82,83,86,87,98,133,136,137,138,141,166,167,168,169,172,194,196,210,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,147,-109,-70,-80,-81,-69,-83,-86,-88,-108,-68,-111,-103,-82,]),'DOWNTO':([76,78,79,80,81,82,83,86,87,98,133,136,137,138,141,166,167,168,169,172,194,196,210,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,148,-109,-70,-80,-81,-69,-83,-86,-88,-108,-68,-111,-103,-82,]),}
+_lr_action_items = {'PROGRAM':([0,],[3,]),'$end':([1,9,],[0,-1,]),'SEMICOLON':([2,5,16,17,18,19,20,21,22,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,54,55,59,60,62,63,64,65,66,68,70,72,73,74,75,76,77,80,81,83,84,98,99,126,128,129,130,131,134,137,138,143,145,147,149,154,160,161,162,163,166,168,169,170,173,174,175,176,178,184,190,191,194,195,196,197,198,200,201,202,203,209,210,211,212,214,215,216,217,218,219,],[4,-2,-3,30,-50,-16,-17,57,58,-4,84,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-66,-67,-19,-22,-28,-29,-30,-31,-32,104,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,-50,-18,-21,-109,-36,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-23,-83,-86,-88,-108,-68,-75,-76,-77,-58,-60,-62,-64,199,-20,-111,-103,-50,-50,-50,-51,213,-50,-50,-50,-50,-82,-74,-78,-79,-54,-55,-56,-57,-24,-33,]),'ID':([3,8,11,12,18,23,24,25,27,28,46,47,48,49,56,78,79,84,85,86,87,93,94,95,96,100,102,103,104,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,127,137,138,139,140,141,150,167,177,185,188,192,194,195,196,199,200,201,202,203,213,],[5,14,14,-8,45,59,61,-7,69,70,70,70,45,92,70,70,70,45,129,70,70,70,70,14,14,151,151,70,-9,70,70,70,-89,-90,70,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,70,-91,-92,70,45,45,70,70,70,182,70,182,151,70,70,45,45,45,-53,45,45,45,45,-52,]),'VAR':([4,7,10,11,12,25,30,57,58,104,],[8,-15,8,-5,-8,-7,-14,8,8,-9,]),'BEGIN':([4,7,10,11,12,15,18,25,30,48,57,58,84,104,137,138,194,195,196,200,201,202,203,],[-6,-15,18,-5,-8,18,18,-7,-14,18,-6,-6,18,-9,18,18,18,18,18,18,18,18,18,]),'PROCEDURE':([4,7,10,11,12,25,30,57,58,104,],[-6,-15,23,-5,-8,-7,-14,-6,-6,-9,]),'FUNCTION':([4,7,10,11,12,25,30,57,58,104,],[-6,-15,24,-5,-8,-7,-14,-6,-6,-9,]),'DOT':([6,16,29,83,],[9,-3,-4,-35,]),'COLON':([13,14,61,69,107,151,179,180,181,182,186,189,],[26,-10,101,-12,-11,183,200,201,202,203,206,-13,]),'COMMA':([13,14,62,63,64,65,66,69,70,72,73,74,75,76,77,80,81,107,126,133,134,135,136,142,144,146,148,152,153,155,160,161,162,163,166,189,190,191,193,204,205,219,],[27,-10,-28,-29,-30,-31,-32,-12,-70,-84,-85,-87,-105,-106,-107,-110,-112,-11,-109,167,-69,-72,-73,167,167,27,27,185,-26,185,-83,-86,-88,-108,-68,-13,-111,-103,-71,-27,-25,-33,]),'RPAREN':([14,62,63,64,65,66,69,70,72,73,74,75,76,77,80,81,87,93,94,95,96,107,125,126,133,134,135,136,142,144,146,148,152,153,155,160,161,162,163,164,166,189,190,191,193,204,205,219,],[-10,-28,-29,-30,-31,-32,-12,-70,-84,-85,-87,-105,-106,-107,-110,-112,134,143,145,147,149,-11,163,-109,166,-69,-72,-73,173,174,175,176,184,-26,186,-83,-86,-88,-108,191,-68,-13,-111,-103,-71,-27,-25,-33,]),'LBRACKET':([14,45,67,69,70,92,129,],[28,86,103,105,106,86,106,]),'END':([18,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,54,55,70,72,73,74,75,76,77,80,81,83,84,126,128,129,130,131,134,137,138,143,145,147,149,160,161,162,163,166,168,169,170,173,174,175,176,177,190,191,194,195,196,197,199,209,210,211,212,213,],[-50,83,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-66,-67,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,-50,-109,-36,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-83,-86,-88,-108,-68,-75,-76,-77,-58,-60,-62,-64,197,-111,-103,-50,-50,-50,-51,-53,-82,-74,-78,-79,-52,]),'IF':([18,48,84,137,138,194,195,196,200,201,202,203,],[46,46,46,46,46,46,46,46,46,46,46,46,]),'WHILE':([18,48,84,137,138,194,195,196,200,201,202,203,],[47,47,47,47,47,47,47,47,47,47,47,47,]),'REPEAT':([18,48,84,137,138,194,195,196,200,201,202,203,],[48,48,48,48,48,48,48,48,48,48,48,48,]),'FOR':([18,48,84,137,138,194,195,196,200,201,202,203,],[49,49,49,49,49,49,49,49,49,49,49,49,]),'WRITELN':([18,48,84,137,138,194,195,196,200,201,202,203,],[50,50,50,50,50,50,50,50,50,50,50,50,]),'WRITE':([18,48,84,137,138,194,195,196,200,201,202,203,],[51,51,51,51,51,51,51,51,51,51,51,51,]),'READLN':([18,48,84,137,138,194,195,196,200,201,202,203,],[52,52,52,52,52,52,52,52,52,52,52,52,]),'READ':([18,48,84,137,138,194,195,196,200,201,202,203,],[53,53,53,53,53,53,53,53,53,53,53,53,]),'BREAK':([18,48,84,137,138,194,195,196,200,201,202,203,],[54,54,54,54,54,54,54,54,54,54,54,54,]),'CONTINUE':([18,48,84,137,138,194,195,196,200,201,202,203,],[55,55,55,55,55,55,55,55,55,55,55,55,]),'CASE':([18,48,84,137,138,194,195,196,200,201,202,203,],[56,56,56,56,56,56,56,56,56,56,56,56,]),'REAL':([24,26,101,183,206,207,],[62,62,62,62,62,62,]),'INTEGER':([24,26,101,183,206,207,],[63,63,63,63,63,63,]),'BOOLEAN':([24,26,101,183,206,207,],[64,64,64,64,64,64,]),'STRING':([24,26,101,183,206,207,],[65,65,65,65,65,65,]),'ARRAY':([24,26,101,183,206,207,],[67,67,67,67,67,67,]),'NUMBER':([28,46,47,56,78,79,85,86,87,93,94,103,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,127,139,140,141,150,167,177,188,192,199,213,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-89,-90,75,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,75,-91,-92,75,75,75,75,179,75,179,75,75,-53,-52,]),'BOOL':([28,46,47,56,78,79,85,86,87,93,94,103,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,127,139,140,141,150,167,177,188,192,199,213,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-89,-90,76,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,76,-91,-92,76,76,76,76,180,76,180,76,76,-53,-52,]),'PHRASE':([28,46,47,56,78,79,85,86,87,93,94,103,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,127,139,140,141,150,167,177,188,192,199,213,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-89,-90,77,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,77,-91,-92,77,77,77,77,181,77,181,77,77,-53,-52,]),'LPAREN':([28,45,46,47,50,51,52,53,56,59,61,70,78,79,82,85,86,87,93,94,103,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,127,129,139,140,141,167,188,192,],[78,87,78,78,93,94,95,96,78,100,102,87,78,78,127,78,78,78,78,78,78,78,78,78,-89,-90,78,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,78,-91,-92,78,87,78,78,78,78,78,78,]),'NOT':([28,46,47,56,78,79,85,86,87,93,94,103,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,127,139,140,141,167,188,192,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-89,-90,79,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,79,-91,-92,79,79,79,79,79,79,79,]),'LENGTH':([28,46,47,56,78,79,85,86,87,93,94,103,105,106,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,127,139,140,141,167,188,192,],[82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-89,-90,82,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,82,-91,-92,82,82,82,82,82,82,82,]),'UNTIL':([33,34,35,36,37,38,39,40,41,42,43,44,45,48,54,55,70,72,73,74,75,76,77,80,81,83,90,126,129,130,131,134,137,138,143,145,147,149,160,161,162,163,166,168,169,170,173,174,175,176,190,191,194,195,196,197,209,210,211,212,],[-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-50,-66,-67,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,139,-109,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-83,-86,-88,-108,-68,-75,-76,-77,-58,-60,-62,-64,-111,-103,-50,-50,-50,-51,-82,-74,-78,-79,]),'ELSE':([33,34,35,36,37,38,39,40,41,42,43,44,45,54,55,70,72,73,74,75,76,77,80,81,83,126,129,130,131,134,137,138,143,145,147,149,160,161,162,163,166,168,169,170,173,174,175,176,190,191,194,195,196,197,209,210,211,212,],[-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-70,-66,-67,-70,-84,-85,-87,-105,-106,-107,-110,-112,-35,-109,-70,-80,-81,-69,-50,-50,-59,-61,-63,-65,-83,-86,-88,-108,-68,194,-76,-77,-58,-60,-62,-64,-111,-103,-50,-50,-50,-51,-82,-74,-78,-79,]),'ASSIGN':([45,92,165,],[85,85,192,]),'TIMES':([70,73,74,75,76,77,80,81,126,129,131,134,161,162,163,166,190,191,],[-70,123,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,123,-88,-108,-68,-111,-103,]),'DIVIDE':([70,73,74,75,76,77,80,81,126,129,131,134,161,162,163,166,190,191,],[-70,124,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,124,-88,-108,-68,-111,-103,]),'PLUS':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,112,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,112,-86,-88,-108,-68,-111,-103,]),'MINUS':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,113,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,113,-86,-88,-108,-68,-111,-103,]),'DIV':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,114,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,114,-86,-88,-108,-68,-111,-103,]),'MOD':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,115,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,115,-86,-88,-108,-68,-111,-103,]),'EQUALS':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,116,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,116,-86,-88,-108,-68,-111,-103,]),'DIFFERENT':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,117,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,117,-86,-88,-108,-68,-111,-103,]),'LESSTHAN':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,118,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,118,-86,-88,-108,-68,-111,-103,]),'LESSEQUAL':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,119,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,119,-86,-88,-108,-68,-111,-103,]),'GREATERTHAN':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,120,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,120,-86,-88,-108,-68,-111,-103,]),'GREATEREQUAL':([70,72,73,74,75,76,77,80,81,126,129,131,134,160,161,162,163,166,190,191,],[-70,121,-85,-87,-105,-106,-107,-110,-112,-109,-70,-112,-69,121,-86,-88,-108,-68,-111,-103,]),'RBRACKET':([70,71,72,73,74,75,76,77,80,81,126,132,134,156,158,159,160,161,162,163,166,190,191,208,],[-70,107,-84,-85,-87,-105,-106,-107,-110,-112,-109,165,-69,187,189,190,-83,-86,-88,-108,-68,-111,-103,-34,]),'AND':([70,71,72,73,74,75,76,77,80,81,88,89,97,125,126,129,130,131,132,134,136,157,158,159,160,161,162,163,164,166,170,171,172,190,191,208,209,],[-70,109,-84,-85,-87,-105,-106,-107,-110,-112,109,109,109,109,-109,-70,109,-112,109,-69,109,109,109,109,-83,-86,-88,-108,109,-68,109,109,109,-111,-103,109,109,]),'OR':([70,71,72,73,74,75,76,77,80,81,88,89,97,125,126,129,130,131,132,134,136,157,158,159,160,161,162,163,164,166,170,171,172,190,191,208,209,],[-70,110,-84,-85,-87,-105,-106,-107,-110,-112,110,110,110,110,-109,-70,110,-112,110,-69,110,110,110,110,-83,-86,-88,-108,110,-68,110,110,110,-111,-103,110,110,]),'THEN':([70,72,73,74,75,76,77,80,81,88,126,134,160,161,162,163,166,190,191,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,137,-109,-69,-83,-86,-88,-108,-68,-111,-103,]),'DO':([70,72,73,74,75,76,77,80,81,89,126,134,160,161,162,163,166,171,172,190,191,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,138,-109,-69,-83,-86,-88,-108,-68,195,196,-111,-103,]),'OF':([70,72,73,74,75,76,77,80,81,97,126,134,160,161,162,163,166,187,190,191,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,150,-109,-69,-83,-86,-88,-108,-68,207,-111,-103,]),'TO':([70,72,73,74,75,76,77,80,81,91,126,129,130,131,134,160,161,162,163,166,190,191,209,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,140,-109,-70,-80,-81,-69,-83,-86,-88,-108,-68,-111,-103,-82,]),'DOWNTO':([70,72,73,74,75,76,77,80,81,91,126,129,130,131,134,160,161,162,163,166,190,191,209,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,141,-109,-70,-80,-81,-69,-83,-86,-88,-108,-68,-111,-103,-82,]),'RANGE':([70,72,73,74,75,76,77,80,81,126,134,157,160,161,162,163,166,190,191,],[-70,-84,-85,-87,-105,-106,-107,-110,-112,-109,-69,188,-83,-86,-88,-108,-68,-111,-103,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'header':([0,],[2,]),'block':([4,26,27,],[6,69,70,]),'variable_declaration_part':([4,10,26,27,],[7,22,7,7,]),'procedure_or_function':([7,25,],[10,68,]),'proc_or_func_declaration':([7,25,],[11,11,]),'procedure_declaration':([7,25,],[12,12,]),'function_declaration':([7,25,],[13,13,]),'procedure_heading':([7,25,],[14,14,]),'function_heading':([7,25,],[15,15,]),'variable_declaration_list':([8,],[18,]),'variable_declaration':([8,18,],[19,37,]),'id_list':([8,18,40,102,103,165,],[20,20,89,153,155,195,]),'statement_part':([10,22,24,59,91,144,145,199,200,201,204,205,206,207,],[23,41,45,45,45,45,45,45,45,45,45,45,45,45,]),'type':([17,38,72,158,191,192,],[29,75,108,189,208,209,]),'array_type':([17,38,72,158,191,192,],[35,35,35,35,35,35,]),'statement_sequence':([24,91,],[42,135,]),'statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[43,97,43,174,175,211,212,213,215,216,217,218,]),'assignment_statement':([24,59,60,91,144,145,199,200,201,204,205,206,207,],[44,44,98,44,44,44,44,44,44,44,44,44,44,]),'if_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[46,46,46,46,46,46,46,46,46,46,46,46,]),'while_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[47,47,47,47,47,47,47,47,47,47,47,47,]),'repeat_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[48,48,48,48,48,48,48,48,48,48,48,48,]),'for_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[49,49,49,49,49,49,49,49,49,49,49,49,]),'procedure_or_function_call':([24,39,57,58,59,67,74,84,85,91,92,93,94,100,101,113,115,118,129,134,144,145,146,147,148,163,173,197,199,200,201,204,205,206,207,],[50,87,87,87,50,87,87,87,87,50,138,87,87,87,87,87,87,87,87,87,50,50,87,87,87,87,87,87,50,50,50,50,50,50,50,]),'writeln_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[51,51,51,51,51,51,51,51,51,51,51,51,]),'readln_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[52,52,52,52,52,52,52,52,52,52,52,52,]),'break_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[53,53,53,53,53,53,53,53,53,53,53,53,]),'continue_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[54,54,54,54,54,54,54,54,54,54,54,54,]),'case_statement':([24,59,91,144,145,199,200,201,204,205,206,207,],[55,55,55,55,55,55,55,55,55,55,55,55,]),'expression':([39,57,58,67,74,84,92,93,94,100,101,113,134,146,147,148,163,173,197,],[77,95,96,104,111,132,137,139,143,143,143,164,170,176,177,178,193,143,210,]),'expression_m':([39,57,58,67,74,84,92,93,94,100,101,113,115,134,146,147,148,163,173,197,],[78,78,78,78,78,78,78,78,78,78,78,78,166,78,78,78,78,78,78,78,]),'expression_s':([39,57,58,67,74,84,92,93,94,100,101,113,115,118,134,146,147,148,163,173,197,],[79,79,79,79,79,79,79,79,79,79,79,79,79,167,79,79,79,79,79,79,79,]),'element':([39,57,58,67,74,84,85,92,93,94,100,101,113,115,118,129,134,146,147,148,163,173,197,],[80,80,80,80,80,80,133,80,80,80,80,80,80,80,80,168,80,80,80,80,80,80,80,]),'length_function':([39,57,58,67,74,84,85,92,93,94,100,101,113,115,118,129,134,146,147,148,163,173,197,],[86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,]),'parameter_list':([71,73,160,],[106,109,190,]),'parameter':([71,73,160,],[107,107,107,]),'range':([74,],[110,]),'and_or':([77,95,96,104,111,132,137,139,143,164,170,176,177,178,193,210,],[115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,]),'sign':([78,166,],[118,118,]),'psign':([79,167,],[129,129,]),'param_list':([94,100,101,],[140,149,151,]),'param':([94,100,101,173,],[142,142,142,198,]),'case_list':([157,203,],[183,214,]),'case_option':([157,203,],[184,184,]),}
+_lr_goto_items = {'program':([0,],[1,]),'header':([0,],[2,]),'block':([4,57,58,],[6,98,99,]),'variable_declaration_part':([4,10,57,58,],[7,15,7,7,]),'procedure_or_function':([7,],[10,]),'variable_declaration_list':([8,],[11,]),'variable_declaration':([8,11,],[12,25,]),'id_list':([8,11,95,96,],[13,13,146,148,]),'statement_part':([10,15,18,48,84,137,138,194,195,196,200,201,202,203,],[16,29,34,34,34,34,34,34,34,34,34,34,34,34,]),'proc_or_func_declaration':([10,],[17,]),'procedure_declaration':([10,],[19,]),'function_declaration':([10,],[20,]),'procedure_heading':([10,],[21,]),'function_heading':([10,],[22,]),'statement_sequence':([18,],[31,]),'statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[32,90,128,168,169,210,211,212,214,215,216,217,]),'assignment_statement':([18,48,49,84,137,138,194,195,196,200,201,202,203,],[33,33,91,33,33,33,33,33,33,33,33,33,33,]),'if_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[35,35,35,35,35,35,35,35,35,35,35,35,]),'while_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[36,36,36,36,36,36,36,36,36,36,36,36,]),'repeat_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[37,37,37,37,37,37,37,37,37,37,37,37,]),'for_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[38,38,38,38,38,38,38,38,38,38,38,38,]),'procedure_or_function_call':([18,28,46,47,48,56,78,79,84,85,86,87,93,94,103,105,106,108,111,122,127,137,138,139,140,141,167,188,192,194,195,196,200,201,202,203,],[39,81,81,81,39,81,81,81,39,131,81,81,81,81,81,81,81,81,81,81,81,39,39,81,81,81,81,81,81,39,39,39,39,39,39,39,]),'writeln_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[40,40,40,40,40,40,40,40,40,40,40,40,]),'readln_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[41,41,41,41,41,41,41,41,41,41,41,41,]),'break_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[42,42,42,42,42,42,42,42,42,42,42,42,]),'continue_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[43,43,43,43,43,43,43,43,43,43,43,43,]),'case_statement':([18,48,84,137,138,194,195,196,200,201,202,203,],[44,44,44,44,44,44,44,44,44,44,44,44,]),'type':([24,26,101,183,206,207,],[60,68,154,204,218,219,]),'array_type':([24,26,101,183,206,207,],[66,66,66,66,66,66,]),'expression':([28,46,47,56,78,85,86,87,93,94,103,105,106,127,139,140,141,167,188,192,],[71,88,89,97,125,130,132,136,136,136,157,158,159,164,170,171,172,136,208,209,]),'expression_m':([28,46,47,56,78,85,86,87,93,94,103,105,106,108,127,139,140,141,167,188,192,],[72,72,72,72,72,72,72,72,72,72,72,72,72,160,72,72,72,72,72,72,72,]),'expression_s':([28,46,47,56,78,85,86,87,93,94,103,105,106,108,111,127,139,140,141,167,188,192,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,161,73,73,73,73,73,73,73,]),'element':([28,46,47,56,78,79,85,86,87,93,94,103,105,106,108,111,122,127,139,140,141,167,188,192,],[74,74,74,74,74,126,74,74,74,74,74,74,74,74,74,74,162,74,74,74,74,74,74,74,]),'length_function':([28,46,47,56,78,79,85,86,87,93,94,103,105,106,108,111,122,127,139,140,141,167,188,192,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'and_or':([71,88,89,97,125,130,132,136,157,158,159,164,170,171,172,208,209,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'sign':([72,160,],[111,111,]),'psign':([73,161,],[122,122,]),'param_list':([87,93,94,],[133,142,144,]),'param':([87,93,94,167,],[135,135,135,193,]),'parameter_list':([100,102,],[152,155,]),'parameter':([100,102,185,],[153,153,205,]),'range':([103,],[156,]),'case_list':([150,],[177,]),'case_option':([150,177,],[178,198,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -35,108 +35,108 @@ _lr_productions = [
   ('variable_declaration_part -> <empty>','variable_declaration_part',0,'p_variable_declaration_part','pasSyn.py',34),
   ('variable_declaration_list -> variable_declaration_list variable_declaration','variable_declaration_list',2,'p_variable_declaration_list','pasSyn.py',42),
   ('variable_declaration_list -> variable_declaration','variable_declaration_list',1,'p_variable_declaration_list','pasSyn.py',43),
-  ('variable_declaration -> id_list COLON type SEMICOLON','variable_declaration',4,'p_variable_declaration','pasSyn.py',52),
-  ('id_list -> ID','id_list',1,'p_id_list','pasSyn.py',56),
-  ('id_list -> ID LBRACKET expression RBRACKET','id_list',4,'p_id_list','pasSyn.py',57),
-  ('id_list -> ID COMMA id_list','id_list',3,'p_id_list','pasSyn.py',58),
-  ('id_list -> ID LBRACKET expression RBRACKET COMMA id_list','id_list',6,'p_id_list','pasSyn.py',59),
-  ('procedure_or_function -> proc_or_func_declaration SEMICOLON procedure_or_function','procedure_or_function',3,'p_procedure_or_function','pasSyn.py',76),
-  ('procedure_or_function -> <empty>','procedure_or_function',0,'p_procedure_or_function','pasSyn.py',77),
-  ('proc_or_func_declaration -> procedure_declaration','proc_or_func_declaration',1,'p_proc_or_func_declaration','pasSyn.py',88),
-  ('proc_or_func_declaration -> function_declaration','proc_or_func_declaration',1,'p_proc_or_func_declaration','pasSyn.py',89),
-  ('procedure_declaration -> procedure_heading SEMICOLON block','procedure_declaration',3,'p_procedure_declaration','pasSyn.py',93),
-  ('procedure_heading -> PROCEDURE ID','procedure_heading',2,'p_procedure_heading','pasSyn.py',97),
-  ('procedure_heading -> PROCEDURE ID LPAREN parameter_list RPAREN','procedure_heading',5,'p_procedure_heading','pasSyn.py',98),
-  ('function_declaration -> function_heading SEMICOLON block','function_declaration',3,'p_function_declaration','pasSyn.py',105),
-  ('function_heading -> FUNCTION type','function_heading',2,'p_function_heading','pasSyn.py',109),
-  ('function_heading -> FUNCTION ID COLON type','function_heading',4,'p_function_heading','pasSyn.py',110),
-  ('function_heading -> FUNCTION ID LPAREN parameter_list RPAREN COLON type','function_heading',7,'p_function_heading','pasSyn.py',111),
-  ('parameter_list -> parameter COMMA parameter_list','parameter_list',3,'p_parameter_list','pasSyn.py',120),
-  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','pasSyn.py',121),
-  ('parameter -> ID COLON type','parameter',3,'p_parameter','pasSyn.py',132),
-  ('type -> REAL','type',1,'p_type','pasSyn.py',136),
-  ('type -> INTEGER','type',1,'p_type','pasSyn.py',137),
-  ('type -> BOOLEAN','type',1,'p_type','pasSyn.py',138),
-  ('type -> STRING','type',1,'p_type','pasSyn.py',139),
-  ('type -> array_type','type',1,'p_type','pasSyn.py',140),
-  ('array_type -> ARRAY LBRACKET range RBRACKET OF type','array_type',6,'p_array_type','pasSyn.py',147),
-  ('range -> expression RANGE expression','range',3,'p_range','pasSyn.py',151),
-  ('statement_part -> BEGIN statement_sequence END','statement_part',3,'p_statement_part','pasSyn.py',154),
-  ('statement_sequence -> statement SEMICOLON statement_sequence','statement_sequence',3,'p_statement_sequence','pasSyn.py',158),
-  ('statement_sequence -> statement','statement_sequence',1,'p_statement_sequence','pasSyn.py',159),
-  ('statement -> assignment_statement','statement',1,'p_statement','pasSyn.py',169),
-  ('statement -> statement_part','statement',1,'p_statement','pasSyn.py',170),
-  ('statement -> if_statement','statement',1,'p_statement','pasSyn.py',171),
-  ('statement -> while_statement','statement',1,'p_statement','pasSyn.py',172),
-  ('statement -> repeat_statement','statement',1,'p_statement','pasSyn.py',173),
-  ('statement -> for_statement','statement',1,'p_statement','pasSyn.py',174),
-  ('statement -> procedure_or_function_call','statement',1,'p_statement','pasSyn.py',175),
-  ('statement -> writeln_statement','statement',1,'p_statement','pasSyn.py',176),
-  ('statement -> readln_statement','statement',1,'p_statement','pasSyn.py',177),
-  ('statement -> break_statement','statement',1,'p_statement','pasSyn.py',178),
-  ('statement -> continue_statement','statement',1,'p_statement','pasSyn.py',179),
-  ('statement -> case_statement','statement',1,'p_statement','pasSyn.py',180),
-  ('statement -> <empty>','statement',0,'p_statement','pasSyn.py',181),
-  ('case_statement -> CASE expression OF case_list END','case_statement',5,'p_case_statement','pasSyn.py',188),
-  ('case_list -> case_option SEMICOLON case_list','case_list',3,'p_case_list','pasSyn.py',193),
-  ('case_list -> case_option SEMICOLON','case_list',2,'p_case_list','pasSyn.py',194),
-  ('case_option -> NUMBER COLON statement','case_option',3,'p_case_option','pasSyn.py',205),
-  ('case_option -> BOOL COLON statement','case_option',3,'p_case_option','pasSyn.py',206),
-  ('case_option -> PHRASE COLON statement','case_option',3,'p_case_option','pasSyn.py',207),
-  ('case_option -> ID COLON statement','case_option',3,'p_case_option','pasSyn.py',208),
-  ('writeln_statement -> WRITELN LPAREN param_list RPAREN','writeln_statement',4,'p_writeln_statement','pasSyn.py',221),
-  ('writeln_statement -> WRITELN LPAREN RPAREN','writeln_statement',3,'p_writeln_statement','pasSyn.py',222),
-  ('writeln_statement -> WRITE LPAREN param_list RPAREN','writeln_statement',4,'p_writeln_statement','pasSyn.py',223),
-  ('writeln_statement -> WRITE LPAREN RPAREN','writeln_statement',3,'p_writeln_statement','pasSyn.py',224),
-  ('readln_statement -> READLN LPAREN id_list RPAREN','readln_statement',4,'p_readln_statement','pasSyn.py',231),
-  ('readln_statement -> READLN LPAREN RPAREN','readln_statement',3,'p_readln_statement','pasSyn.py',232),
-  ('readln_statement -> READ LPAREN id_list RPAREN','readln_statement',4,'p_readln_statement','pasSyn.py',233),
-  ('readln_statement -> READ LPAREN RPAREN','readln_statement',3,'p_readln_statement','pasSyn.py',234),
-  ('break_statement -> BREAK','break_statement',1,'p_break_statement','pasSyn.py',242),
-  ('continue_statement -> CONTINUE','continue_statement',1,'p_continue_statement','pasSyn.py',247),
-  ('procedure_or_function_call -> ID LPAREN param_list RPAREN','procedure_or_function_call',4,'p_procedure_or_function_call','pasSyn.py',251),
-  ('procedure_or_function_call -> ID LPAREN RPAREN','procedure_or_function_call',3,'p_procedure_or_function_call','pasSyn.py',252),
-  ('procedure_or_function_call -> ID','procedure_or_function_call',1,'p_procedure_or_function_call','pasSyn.py',253),
-  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','pasSyn.py',264),
-  ('param_list -> param','param_list',1,'p_param_list','pasSyn.py',265),
-  ('param -> expression','param',1,'p_param','pasSyn.py',275),
-  ('if_statement -> IF expression THEN statement ELSE statement','if_statement',6,'p_if_statement','pasSyn.py',279),
-  ('if_statement -> IF expression THEN statement','if_statement',4,'p_if_statement','pasSyn.py',280),
-  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement','pasSyn.py',287),
-  ('repeat_statement -> REPEAT statement UNTIL expression','repeat_statement',4,'p_repeat_statement','pasSyn.py',291),
-  ('for_statement -> FOR assignment_statement TO expression DO statement','for_statement',6,'p_for_statement','pasSyn.py',295),
-  ('for_statement -> FOR assignment_statement DOWNTO expression DO statement','for_statement',6,'p_for_statement','pasSyn.py',296),
-  ('assignment_statement -> ID ASSIGN expression','assignment_statement',3,'p_assignment_statement','pasSyn.py',301),
-  ('assignment_statement -> ID ASSIGN procedure_or_function_call','assignment_statement',3,'p_assignment_statement','pasSyn.py',302),
-  ('assignment_statement -> ID LBRACKET expression RBRACKET ASSIGN expression','assignment_statement',6,'p_assignment_statement','pasSyn.py',303),
-  ('expression -> expression and_or expression_m','expression',3,'p_expression','pasSyn.py',310),
-  ('expression -> expression_m','expression',1,'p_expression','pasSyn.py',311),
-  ('expression_m -> expression_s','expression_m',1,'p_expression_m','pasSyn.py',318),
-  ('expression_m -> expression_m sign expression_s','expression_m',3,'p_expression_m','pasSyn.py',319),
-  ('expression_s -> element','expression_s',1,'p_expression_s','pasSyn.py',326),
-  ('expression_s -> expression_s psign element','expression_s',3,'p_expression_s','pasSyn.py',327),
-  ('and_or -> AND','and_or',1,'p_and_or','pasSyn.py',333),
-  ('and_or -> OR','and_or',1,'p_and_or','pasSyn.py',334),
-  ('psign -> TIMES','psign',1,'p_psign','pasSyn.py',338),
-  ('psign -> DIVIDE','psign',1,'p_psign','pasSyn.py',339),
-  ('sign -> PLUS','sign',1,'p_sign','pasSyn.py',343),
-  ('sign -> MINUS','sign',1,'p_sign','pasSyn.py',344),
-  ('sign -> DIV','sign',1,'p_sign','pasSyn.py',345),
-  ('sign -> MOD','sign',1,'p_sign','pasSyn.py',346),
-  ('sign -> EQUALS','sign',1,'p_sign','pasSyn.py',347),
-  ('sign -> DIFFERENT','sign',1,'p_sign','pasSyn.py',348),
-  ('sign -> LESSTHAN','sign',1,'p_sign','pasSyn.py',349),
-  ('sign -> LESSEQUAL','sign',1,'p_sign','pasSyn.py',350),
-  ('sign -> GREATERTHAN','sign',1,'p_sign','pasSyn.py',351),
-  ('sign -> GREATEREQUAL','sign',1,'p_sign','pasSyn.py',352),
-  ('length_function -> LENGTH LPAREN expression RPAREN','length_function',4,'p_length_function','pasSyn.py',356),
-  ('element -> ID','element',1,'p_element','pasSyn.py',360),
-  ('element -> NUMBER','element',1,'p_element','pasSyn.py',361),
-  ('element -> BOOL','element',1,'p_element','pasSyn.py',362),
-  ('element -> PHRASE','element',1,'p_element','pasSyn.py',363),
-  ('element -> LPAREN expression RPAREN','element',3,'p_element','pasSyn.py',364),
-  ('element -> NOT element','element',2,'p_element','pasSyn.py',365),
-  ('element -> length_function','element',1,'p_element','pasSyn.py',366),
-  ('element -> ID LBRACKET expression RBRACKET','element',4,'p_element','pasSyn.py',367),
-  ('element -> procedure_or_function_call','element',1,'p_element','pasSyn.py',368),
+  ('variable_declaration -> id_list COLON type SEMICOLON','variable_declaration',4,'p_variable_declaration','pasSyn.py',51),
+  ('id_list -> ID','id_list',1,'p_id_list','pasSyn.py',55),
+  ('id_list -> ID LBRACKET expression RBRACKET','id_list',4,'p_id_list','pasSyn.py',56),
+  ('id_list -> id_list COMMA ID','id_list',3,'p_id_list','pasSyn.py',57),
+  ('id_list -> id_list COMMA ID LBRACKET expression RBRACKET','id_list',6,'p_id_list','pasSyn.py',58),
+  ('procedure_or_function -> procedure_or_function proc_or_func_declaration SEMICOLON','procedure_or_function',3,'p_procedure_or_function','pasSyn.py',71),
+  ('procedure_or_function -> <empty>','procedure_or_function',0,'p_procedure_or_function','pasSyn.py',72),
+  ('proc_or_func_declaration -> procedure_declaration','proc_or_func_declaration',1,'p_proc_or_func_declaration','pasSyn.py',81),
+  ('proc_or_func_declaration -> function_declaration','proc_or_func_declaration',1,'p_proc_or_func_declaration','pasSyn.py',82),
+  ('procedure_declaration -> procedure_heading SEMICOLON block','procedure_declaration',3,'p_procedure_declaration','pasSyn.py',86),
+  ('procedure_heading -> PROCEDURE ID','procedure_heading',2,'p_procedure_heading','pasSyn.py',90),
+  ('procedure_heading -> PROCEDURE ID LPAREN parameter_list RPAREN','procedure_heading',5,'p_procedure_heading','pasSyn.py',91),
+  ('function_declaration -> function_heading SEMICOLON block','function_declaration',3,'p_function_declaration','pasSyn.py',98),
+  ('function_heading -> FUNCTION type','function_heading',2,'p_function_heading','pasSyn.py',102),
+  ('function_heading -> FUNCTION ID COLON type','function_heading',4,'p_function_heading','pasSyn.py',103),
+  ('function_heading -> FUNCTION ID LPAREN parameter_list RPAREN COLON type','function_heading',7,'p_function_heading','pasSyn.py',104),
+  ('parameter_list -> parameter_list COMMA parameter','parameter_list',3,'p_parameter_list','pasSyn.py',113),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list','pasSyn.py',114),
+  ('parameter -> ID COLON type','parameter',3,'p_parameter','pasSyn.py',123),
+  ('type -> REAL','type',1,'p_type','pasSyn.py',127),
+  ('type -> INTEGER','type',1,'p_type','pasSyn.py',128),
+  ('type -> BOOLEAN','type',1,'p_type','pasSyn.py',129),
+  ('type -> STRING','type',1,'p_type','pasSyn.py',130),
+  ('type -> array_type','type',1,'p_type','pasSyn.py',131),
+  ('array_type -> ARRAY LBRACKET range RBRACKET OF type','array_type',6,'p_array_type','pasSyn.py',138),
+  ('range -> expression RANGE expression','range',3,'p_range','pasSyn.py',142),
+  ('statement_part -> BEGIN statement_sequence END','statement_part',3,'p_statement_part','pasSyn.py',146),
+  ('statement_sequence -> statement_sequence SEMICOLON statement','statement_sequence',3,'p_statement_sequence','pasSyn.py',150),
+  ('statement_sequence -> statement','statement_sequence',1,'p_statement_sequence','pasSyn.py',151),
+  ('statement -> assignment_statement','statement',1,'p_statement','pasSyn.py',161),
+  ('statement -> statement_part','statement',1,'p_statement','pasSyn.py',162),
+  ('statement -> if_statement','statement',1,'p_statement','pasSyn.py',163),
+  ('statement -> while_statement','statement',1,'p_statement','pasSyn.py',164),
+  ('statement -> repeat_statement','statement',1,'p_statement','pasSyn.py',165),
+  ('statement -> for_statement','statement',1,'p_statement','pasSyn.py',166),
+  ('statement -> procedure_or_function_call','statement',1,'p_statement','pasSyn.py',167),
+  ('statement -> writeln_statement','statement',1,'p_statement','pasSyn.py',168),
+  ('statement -> readln_statement','statement',1,'p_statement','pasSyn.py',169),
+  ('statement -> break_statement','statement',1,'p_statement','pasSyn.py',170),
+  ('statement -> continue_statement','statement',1,'p_statement','pasSyn.py',171),
+  ('statement -> case_statement','statement',1,'p_statement','pasSyn.py',172),
+  ('statement -> <empty>','statement',0,'p_statement','pasSyn.py',173),
+  ('case_statement -> CASE expression OF case_list END','case_statement',5,'p_case_statement','pasSyn.py',180),
+  ('case_list -> case_list case_option SEMICOLON','case_list',3,'p_case_list','pasSyn.py',185),
+  ('case_list -> case_option SEMICOLON','case_list',2,'p_case_list','pasSyn.py',186),
+  ('case_option -> NUMBER COLON statement','case_option',3,'p_case_option','pasSyn.py',195),
+  ('case_option -> BOOL COLON statement','case_option',3,'p_case_option','pasSyn.py',196),
+  ('case_option -> PHRASE COLON statement','case_option',3,'p_case_option','pasSyn.py',197),
+  ('case_option -> ID COLON statement','case_option',3,'p_case_option','pasSyn.py',198),
+  ('writeln_statement -> WRITELN LPAREN param_list RPAREN','writeln_statement',4,'p_writeln_statement','pasSyn.py',211),
+  ('writeln_statement -> WRITELN LPAREN RPAREN','writeln_statement',3,'p_writeln_statement','pasSyn.py',212),
+  ('writeln_statement -> WRITE LPAREN param_list RPAREN','writeln_statement',4,'p_writeln_statement','pasSyn.py',213),
+  ('writeln_statement -> WRITE LPAREN RPAREN','writeln_statement',3,'p_writeln_statement','pasSyn.py',214),
+  ('readln_statement -> READLN LPAREN id_list RPAREN','readln_statement',4,'p_readln_statement','pasSyn.py',221),
+  ('readln_statement -> READLN LPAREN RPAREN','readln_statement',3,'p_readln_statement','pasSyn.py',222),
+  ('readln_statement -> READ LPAREN id_list RPAREN','readln_statement',4,'p_readln_statement','pasSyn.py',223),
+  ('readln_statement -> READ LPAREN RPAREN','readln_statement',3,'p_readln_statement','pasSyn.py',224),
+  ('break_statement -> BREAK','break_statement',1,'p_break_statement','pasSyn.py',232),
+  ('continue_statement -> CONTINUE','continue_statement',1,'p_continue_statement','pasSyn.py',237),
+  ('procedure_or_function_call -> ID LPAREN param_list RPAREN','procedure_or_function_call',4,'p_procedure_or_function_call','pasSyn.py',241),
+  ('procedure_or_function_call -> ID LPAREN RPAREN','procedure_or_function_call',3,'p_procedure_or_function_call','pasSyn.py',242),
+  ('procedure_or_function_call -> ID','procedure_or_function_call',1,'p_procedure_or_function_call','pasSyn.py',243),
+  ('param_list -> param_list COMMA param','param_list',3,'p_param_list','pasSyn.py',254),
+  ('param_list -> param','param_list',1,'p_param_list','pasSyn.py',255),
+  ('param -> expression','param',1,'p_param','pasSyn.py',263),
+  ('if_statement -> IF expression THEN statement ELSE statement','if_statement',6,'p_if_statement','pasSyn.py',267),
+  ('if_statement -> IF expression THEN statement','if_statement',4,'p_if_statement','pasSyn.py',268),
+  ('while_statement -> WHILE expression DO statement','while_statement',4,'p_while_statement','pasSyn.py',275),
+  ('repeat_statement -> REPEAT statement UNTIL expression','repeat_statement',4,'p_repeat_statement','pasSyn.py',279),
+  ('for_statement -> FOR assignment_statement TO expression DO statement','for_statement',6,'p_for_statement','pasSyn.py',283),
+  ('for_statement -> FOR assignment_statement DOWNTO expression DO statement','for_statement',6,'p_for_statement','pasSyn.py',284),
+  ('assignment_statement -> ID ASSIGN expression','assignment_statement',3,'p_assignment_statement','pasSyn.py',289),
+  ('assignment_statement -> ID ASSIGN procedure_or_function_call','assignment_statement',3,'p_assignment_statement','pasSyn.py',290),
+  ('assignment_statement -> ID LBRACKET expression RBRACKET ASSIGN expression','assignment_statement',6,'p_assignment_statement','pasSyn.py',291),
+  ('expression -> expression and_or expression_m','expression',3,'p_expression','pasSyn.py',298),
+  ('expression -> expression_m','expression',1,'p_expression','pasSyn.py',299),
+  ('expression_m -> expression_s','expression_m',1,'p_expression_m','pasSyn.py',306),
+  ('expression_m -> expression_m sign expression_s','expression_m',3,'p_expression_m','pasSyn.py',307),
+  ('expression_s -> element','expression_s',1,'p_expression_s','pasSyn.py',314),
+  ('expression_s -> expression_s psign element','expression_s',3,'p_expression_s','pasSyn.py',315),
+  ('and_or -> AND','and_or',1,'p_and_or','pasSyn.py',321),
+  ('and_or -> OR','and_or',1,'p_and_or','pasSyn.py',322),
+  ('psign -> TIMES','psign',1,'p_psign','pasSyn.py',326),
+  ('psign -> DIVIDE','psign',1,'p_psign','pasSyn.py',327),
+  ('sign -> PLUS','sign',1,'p_sign','pasSyn.py',331),
+  ('sign -> MINUS','sign',1,'p_sign','pasSyn.py',332),
+  ('sign -> DIV','sign',1,'p_sign','pasSyn.py',333),
+  ('sign -> MOD','sign',1,'p_sign','pasSyn.py',334),
+  ('sign -> EQUALS','sign',1,'p_sign','pasSyn.py',335),
+  ('sign -> DIFFERENT','sign',1,'p_sign','pasSyn.py',336),
+  ('sign -> LESSTHAN','sign',1,'p_sign','pasSyn.py',337),
+  ('sign -> LESSEQUAL','sign',1,'p_sign','pasSyn.py',338),
+  ('sign -> GREATERTHAN','sign',1,'p_sign','pasSyn.py',339),
+  ('sign -> GREATEREQUAL','sign',1,'p_sign','pasSyn.py',340),
+  ('length_function -> LENGTH LPAREN expression RPAREN','length_function',4,'p_length_function','pasSyn.py',344),
+  ('element -> ID','element',1,'p_element','pasSyn.py',348),
+  ('element -> NUMBER','element',1,'p_element','pasSyn.py',349),
+  ('element -> BOOL','element',1,'p_element','pasSyn.py',350),
+  ('element -> PHRASE','element',1,'p_element','pasSyn.py',351),
+  ('element -> LPAREN expression RPAREN','element',3,'p_element','pasSyn.py',352),
+  ('element -> NOT element','element',2,'p_element','pasSyn.py',353),
+  ('element -> length_function','element',1,'p_element','pasSyn.py',354),
+  ('element -> ID LBRACKET expression RBRACKET','element',4,'p_element','pasSyn.py',355),
+  ('element -> procedure_or_function_call','element',1,'p_element','pasSyn.py',356),
 ]
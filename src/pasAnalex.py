@@ -1,3 +1,5 @@
+import hashlib
+import sys
 import ply.lex as lex
 
 tokens = [
@@ -39,154 +41,27 @@ t_RPAREN = r'\)'
 t_ASSIGN = r':='
 t_COLON = r':'
 
-# Palavras reservadas (case insensitive)
-def t_PROGRAM(t):
-    r'[pP][rR][oO][gG][rR][aA][mM]'
-    return t
-
-def t_VAR(t):
-    r'[vV][aA][rR]'
-    return t    
-
-def t_BEGIN(t):
-    r'[bB][eE][gG][iI][nN]'
-    return t
-
-def t_END(t):
-    r'[eE][nN][dD]'
-    return t
-
-def t_IF(t):
-    r'[iI][fF]'
-    return t
-
-def t_THEN(t):
-    r'[tT][hH][eE][nN]'
-    return t
-
-def t_ELSE(t):
-    r'[eE][lL][sS][eE]'
-    return t
-
-def t_FOR(t):
-    r'[fF][oO][rR]'
-    return t
-
-def t_WHILE(t):
-    r'[wW][hH][iI][lL][eE]'
-    return t
-
-def t_REPEAT(t):
-    r'[rR][eE][pP][eE][aA][tT]'
-    return t
-
-def t_TO(t):
-    r'[tT][oO]'
-    return t
-
-def t_DOWNTO(t):
-    r'[dD][oO][wW][nN][tT][oO]'
-    return t
-
-def t_DO(t):
-    r'[dD][oO]'
-    return t
-
-def t_UNTIL(t):
-    r'[uU][nN][tT][iI][lL]'
-    return t
-
-def t_AND(t):
-    r'[aA][nN][dD]'
-    return t
-
-def t_OR(t):
-    r'[oO][rR]'
-    return t
-
-def t_NOT(t):
-    r'[nN][oO][tT]'
-    return t
-
-def t_OF(t):
-    r'[oO][fF]'
-    return t
-
-def t_CASE(t):
-    r'[cC][aA][sS][eE]'
-    return t
-
-def t_DIV(t):
-    r'[dD][iI][vV]'
-    return t
-
-def t_MOD(t):
-    r'[mM][oO][dD]'
-    return t
-
-def t_FUNCTION(t):
-    r'[fF][uU][nN][cC][tT][iI][oO][nN]'
-    return t
-
-def t_PROCEDURE(t):
-    r'[pP][rR][oO][cC][eE][dD][uU][rR][eE]'
-    return t
-
-def t_WRITELN(t):
-    r'[wW][rR][iI][tT][eE][lL][nN]'
-    return t
-
-def t_WRITE(t):
-    r'[wW][rR][iI][tT][eE]'
-    return t
-
-def t_READLN(t):
-    r'[rR][eE][aA][dD][lL][nN]'
-    return t
-
-def t_READ(t):
-    r'[rR][eE][aA][dD]'
-    return t
-
-def t_BREAK(t):
-    r'[bB][rR][eE][aA][kK]'
-    return t
-
-def t_CONTINUE(t):
-    r'[cC][oO][nN][tT][iI][nN][uU][eE]'
-    return t
-
-def t_REAL(t):
-    r'[rR][eE][aA][lL]'
-    return t
-
-def t_INTEGER(t):
-    r'[iI][nN][tT][eE][gG][eE][rR]'
-    return t
-
-def t_BOOLEAN(t):
-    r'[bB][oO][oO][lL][eE][aA][nN]'
-    return t
-
-def t_STRING(t):
-    r'[sS][tT][rR][iI][nN][gG]'
-    return t
-
-def t_ARRAY(t):
-    r'[aA][rR][rR][aA][yY]'
-    return t
-
-def t_LENGTH(t):
-    r'[lL][eE][nN][gG][tT][hH]'
-    return t
-
-def t_BOOL(t):
-    r'[tT][rR][uU][eE]|[fF][aA][lL][sS][eE]'
-    t.value = (t.value.lower() == 'true')
-    return t
+# Palavras reservadas (case insensitive): reconhecidas pela regra t_ID através desta tabela
+reserved = {
+    'program': 'PROGRAM', 'var': 'VAR', 'begin': 'BEGIN', 'end': 'END',
+    'if': 'IF', 'then': 'THEN', 'else': 'ELSE', 'for': 'FOR', 'while': 'WHILE',
+    'repeat': 'REPEAT', 'to': 'TO', 'downto': 'DOWNTO', 'do': 'DO', 'until': 'UNTIL',
+    'and': 'AND', 'or': 'OR', 'not': 'NOT', 'of': 'OF', 'case': 'CASE',
+    'div': 'DIV', 'mod': 'MOD', 'function': 'FUNCTION', 'procedure': 'PROCEDURE',
+    'writeln': 'WRITELN', 'write': 'WRITE', 'readln': 'READLN', 'read': 'READ',
+    'break': 'BREAK', 'continue': 'CONTINUE', 'real': 'REAL', 'integer': 'INTEGER',
+    'boolean': 'BOOLEAN', 'string': 'STRING', 'array': 'ARRAY', 'length': 'LENGTH',
+    'true': 'BOOL', 'false': 'BOOL',
+}
 
 def t_ID(t):
     r'[a-zA-Z_][a-zA-Z0-9_]*'
+    key = t.value.lower()
+    t.type = reserved.get(key, 'ID')
+    if t.type == 'BOOL':
+        t.value = (key == 'true')
+    elif t.type == 'ID':
+        t.value = sys.intern(t.value)
     return t
 
 def t_NUMBER(t):
@@ -216,7 +91,28 @@ def t_error(t):
     print(f"Illegal character '{t.value[0]}' at line {t.lexer.lineno}")
     t.lexer.skip(1)
 
-lexer = lex.lex()
+def lexer_signature():
+    # Tokens e regras pela ordem de definição (a ordem das funções define a prioridade)
+    parts = list(tokens)
+    for name, rule in list(globals().items()):
+        if name.startswith('t_'):
+            parts.append(name)
+            parts.append((rule.__doc__ or '') if callable(rule) else rule)
+    return hashlib.md5('\n'.join(parts).encode()).hexdigest()
+
+def build_lexer():
+    # Usa a tabela pré-gerada (lextab.py, ver build_tables.py) se a assinatura coincidir;
+    # caso contrário constrói o lexer em memória, sem escrever ficheiros
+    module = sys.modules[__name__]
+    try:
+        import lextab
+        if getattr(lextab, '_signature', None) == lexer_signature():
+            return lex.lex(module=module, optimize=1, lextab='lextab')
+    except ImportError:
+        pass
+    return lex.lex(module=module)
+
+lexer = build_lexer()
 
 def test_lexer(data):
     lexer.input(data)
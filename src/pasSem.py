@@ -1,4 +1,5 @@
 from ASTNode import *
+from ASTVisitor import ASTVisitor
 
 class Symbol:
     def __init__(self, name, type_name, is_initialized=False, is_constant=False, value=None):
@@ -63,7 +64,7 @@ class SemanticError(Exception):
         super().__init__(self.message)
 
 
-class ASTSemanticAnalyzer:
+class ASTSemanticAnalyzer(ASTVisitor):
     def __init__(self):
         self.current_scope = None
         self.errors = []
@@ -88,7 +89,7 @@ class ASTSemanticAnalyzer:
         }
         
         self.operator_rules = {
-            "+": {
+            Operator.PLUS: {
                 ("INTEGER", "INTEGER"): "INTEGER",
                 ("REAL", "REAL"): "REAL",
                 ("INTEGER", "REAL"): "REAL",
@@ -99,7 +100,7 @@ class ASTSemanticAnalyzer:
                 ("NUMBER", "NUMBER"): "NUMBER",
                 ("PHRASE", "PHRASE"): "STRING"
             },
-            "-": {
+            Operator.MINUS: {
                 ("INTEGER", "INTEGER"): "INTEGER",
                 ("REAL", "REAL"): "REAL",
                 ("INTEGER", "REAL"): "REAL",
@@ -108,7 +109,7 @@ class ASTSemanticAnalyzer:
                 ("NUMBER", "INTEGER"): "INTEGER",
                 ("NUMBER", "NUMBER"): "NUMBER"
             },
-            "*": {
+            Operator.TIMES: {
                 ("INTEGER", "INTEGER"): "INTEGER",
                 ("REAL", "REAL"): "REAL",
                 ("INTEGER", "REAL"): "REAL",
@@ -117,7 +118,7 @@ class ASTSemanticAnalyzer:
                 ("NUMBER", "INTEGER"): "INTEGER",
                 ("NUMBER", "NUMBER"): "NUMBER"
             },
-            "/": {
+            Operator.DIVIDE: {
                 ("INTEGER", "INTEGER"): "REAL",
                 ("REAL", "REAL"): "REAL",
                 ("INTEGER", "REAL"): "REAL",
@@ -126,19 +127,19 @@ class ASTSemanticAnalyzer:
                 ("NUMBER", "INTEGER"): "REAL",
                 ("NUMBER", "NUMBER"): "REAL"
             },
-            "div": {  
+            Operator.DIV: {  
                 ("INTEGER", "INTEGER"): "INTEGER",
                 ("INTEGER", "NUMBER"): "INTEGER",
                 ("NUMBER", "INTEGER"): "INTEGER",
                 ("NUMBER", "NUMBER"): "INTEGER"
             },
-            "mod": {  
+            Operator.MOD: {  
                 ("INTEGER", "INTEGER"): "INTEGER",
                 ("INTEGER", "NUMBER"): "INTEGER",
                 ("NUMBER", "INTEGER"): "INTEGER",
                 ("NUMBER", "NUMBER"): "INTEGER"
             },
-            "=": {
+            Operator.EQ: {
                 ("INTEGER", "INTEGER"): "BOOLEAN",
                 ("REAL", "REAL"): "BOOLEAN",
                 ("INTEGER", "REAL"): "BOOLEAN",
@@ -157,7 +158,7 @@ class ASTSemanticAnalyzer:
                 ("CHAR", "PHRASE"): "BOOLEAN",
                 ("PHRASE", "CHAR"): "BOOLEAN"
                 },
-            "<>": {
+            Operator.NE: {
                 ("INTEGER", "INTEGER"): "BOOLEAN",
                 ("REAL", "REAL"): "BOOLEAN",
                 ("INTEGER", "REAL"): "BOOLEAN",
@@ -171,7 +172,7 @@ class ASTSemanticAnalyzer:
                 ("PHRASE", "STRING"): "BOOLEAN",
                 ("PHRASE", "PHRASE"): "BOOLEAN"
             },
-            "<": {
+            Operator.LT: {
                 ("INTEGER", "INTEGER"): "BOOLEAN",
                 ("REAL", "REAL"): "BOOLEAN",
                 ("INTEGER", "REAL"): "BOOLEAN",
@@ -184,7 +185,7 @@ class ASTSemanticAnalyzer:
                 ("PHRASE", "STRING"): "BOOLEAN",
                 ("PHRASE", "PHRASE"): "BOOLEAN"
             },
-            "<=": {
+            Operator.LE: {
                 ("INTEGER", "INTEGER"): "BOOLEAN",
                 ("REAL", "REAL"): "BOOLEAN",
                 ("INTEGER", "REAL"): "BOOLEAN",
@@ -197,7 +198,7 @@ class ASTSemanticAnalyzer:
                 ("PHRASE", "STRING"): "BOOLEAN",
                 ("PHRASE", "PHRASE"): "BOOLEAN"
             },
-            ">": {
+            Operator.GT: {
                 ("INTEGER", "INTEGER"): "BOOLEAN",
                 ("REAL", "REAL"): "BOOLEAN",
                 ("INTEGER", "REAL"): "BOOLEAN",
@@ -210,7 +211,7 @@ class ASTSemanticAnalyzer:
                 ("PHRASE", "STRING"): "BOOLEAN",
                 ("PHRASE", "PHRASE"): "BOOLEAN"
             },
-            ">=": {
+            Operator.GE: {
                 ("INTEGER", "INTEGER"): "BOOLEAN",
                 ("REAL", "REAL"): "BOOLEAN",
                 ("INTEGER", "REAL"): "BOOLEAN",
@@ -223,20 +224,20 @@ class ASTSemanticAnalyzer:
                 ("PHRASE", "STRING"): "BOOLEAN",
                 ("PHRASE", "PHRASE"): "BOOLEAN"
             },
-            "and": {  
+            Operator.AND: {  
                 ("BOOLEAN", "BOOLEAN"): "BOOLEAN",
             },
-            "or": {  
+            Operator.OR: {  
                 ("BOOLEAN", "BOOLEAN"): "BOOLEAN",
             }
         }
         
         
         self.unary_operator_rules = {
-            "not": {  
+            Operator.NOT: {  
                 "BOOLEAN": "BOOLEAN"
             },
-            "-": {
+            Operator.MINUS: {
                 "INTEGER": "INTEGER",
                 "REAL": "REAL",
                 "NUMBER": "NUMBER"
@@ -270,24 +271,14 @@ class ASTSemanticAnalyzer:
             print("No semantic errors found.")
             return True
 
-    def visit(self, node):
-        """Visit a node in the AST."""
-        if node is None:
-            return None
-        
-        
-        method_name = f'visit_{node.__class__.__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
-
     def generic_visit(self, node):
         """Default visitor method for unknown node types."""
         print(f"Warning: No visitor method defined for {node.__class__.__name__}")
         return None
 
     def visit_Program(self, node):
-        self.visit(node.header)
-        self.visit(node.block)
+        yield node.header
+        yield node.block
         return None
 
     def visit_Header(self, node):
@@ -301,20 +292,20 @@ class ASTSemanticAnalyzer:
         
         
         if node.var_decl_part:
-            self.visit(node.var_decl_part)
+            yield node.var_decl_part
         
         
         if hasattr(node, "proc_func_part") and node.proc_func_part:
             for proc_or_func in node.proc_func_part:
-                self.visit(proc_or_func)
+                yield proc_or_func
         
         
         if hasattr(node, "extra_var_decl") and node.extra_var_decl:
-            self.visit(node.extra_var_decl)
+            yield node.extra_var_decl
         
         
         if node.statement_part:
-            self.visit(node.statement_part)
+            yield node.statement_part
         
         
         self.current_scope = old_scope
@@ -323,12 +314,12 @@ class ASTSemanticAnalyzer:
     def visit_VarDeclarationPart(self, node):
         if hasattr(node, "declarations") and node.declarations:
             for decl in node.declarations:
-                self.visit(decl)
+                yield decl
         return None
 
     def visit_VarDeclaration(self, node):
         
-        type_info = self.visit(node.type_name)
+        type_info = yield node.type_name
         
         for id_node in node.id_list:
             if isinstance(id_node, Identifier):
@@ -360,20 +351,20 @@ class ASTSemanticAnalyzer:
 
     def visit_ArrayType(self, node):
         
-        element_type = self.visit(node.element_type)
+        element_type = yield node.element_type
         
         
         dimensions = []
         if hasattr(node, "range") and node.range:
-            range_info = self.visit(node.range)
+            range_info = yield node.range
             if range_info:
                 dimensions.append(range_info)
         
         return ("ARRAY", element_type, dimensions)
 
     def visit_Range(self, node):
-        start_type = self.visit(node.start)
-        end_type = self.visit(node.end)
+        start_type = yield node.start
+        end_type = yield node.end
         
         
         valid_start = start_type == "INTEGER" or start_type == "NUMBER"
@@ -421,7 +412,7 @@ class ASTSemanticAnalyzer:
         elif symbol.type_name == "STRING":
             
             
-            index_type = self.visit(node.expression)
+            index_type = yield node.expression
             if index_type != "INTEGER" and index_type != "NUMBER":
                 self.error(f"String index must be an integer, got {index_type}")
             
@@ -432,7 +423,7 @@ class ASTSemanticAnalyzer:
             return "UNKNOWN"
         
         
-        index_type = self.visit(node.expression)
+        index_type = yield node.expression
         if index_type != "INTEGER" and index_type != "NUMBER":
             self.error(f"Array index must be an integer, got {index_type}")
         
@@ -441,7 +432,7 @@ class ASTSemanticAnalyzer:
 
     def visit_ProcedureDeclaration(self, node):
         
-        proc_symbol = self.visit(node.heading)
+        proc_symbol = yield node.heading
         
         
         old_scope = self.current_scope
@@ -453,7 +444,7 @@ class ASTSemanticAnalyzer:
             self.current_scope.define(param)
         
         
-        self.visit(node.block)
+        yield node.block
         
         
         self.current_scope = old_scope
@@ -461,7 +452,7 @@ class ASTSemanticAnalyzer:
 
     def visit_FunctionDeclaration(self, node):
         
-        func_symbol = self.visit(node.heading)
+        func_symbol = yield node.heading
         
         
         old_scope = self.current_scope
@@ -477,7 +468,7 @@ class ASTSemanticAnalyzer:
         self.current_scope.define(result_symbol)
         
         
-        self.visit(node.block)
+        yield node.block
         
         
         if not self.current_scope.lookup(func_symbol.name).is_initialized:
@@ -496,7 +487,7 @@ class ASTSemanticAnalyzer:
         params = []
         if hasattr(node, "params") and node.params:
             for param in node.params:
-                param_symbol = self.visit(param)
+                param_symbol = yield param
                 params.append(param_symbol)
         
         
@@ -511,13 +502,13 @@ class ASTSemanticAnalyzer:
             self.error(f"Function {node.name} already declared in this scope")
         
         
-        return_type = self.visit(node.return_type) if node.return_type else None
+        return_type = (yield node.return_type) if node.return_type else None
         
         
         params = []
         if hasattr(node, "params") and node.params:
             for param in node.params:
-                param_symbol = self.visit(param)
+                param_symbol = yield param
                 params.append(param_symbol)
         
         
@@ -528,18 +519,18 @@ class ASTSemanticAnalyzer:
 
     def visit_Parameter(self, node):
         
-        param_type = self.visit(node.type_name)
+        param_type = yield node.type_name
         
         
         param_symbol = Symbol(node.name, param_type, True)  
         return param_symbol
 
     def visit_StatementPart(self, node):
-        return self.visit(node.statement_sequence)
+        return (yield node.statement_sequence)
 
     def visit_StatementSequence(self, node):
         for stmt in node.statements:
-            self.visit(stmt)
+            yield stmt
         return None
 
     def visit_Assignment(self, node):
@@ -555,7 +546,7 @@ class ASTSemanticAnalyzer:
                 self.error(f"Cannot assign to constant: {node.target.name}")
                 return None
             
-            value_type = self.visit(node.value)
+            value_type = yield node.value
             
             if value_type is None and isinstance(node.value, ProcedureCall):
                 
@@ -572,8 +563,8 @@ class ASTSemanticAnalyzer:
             target_symbol.is_initialized = True
         elif isinstance(node.target, ArrayId):
             
-            array_type = self.visit(node.target)
-            value_type = self.visit(node.value)
+            array_type = yield node.target
+            value_type = yield node.value
             
             if not self.check_type_compatibility(array_type, value_type):
                 self.error(f"Type mismatch in array assignment: cannot assign {value_type} to element of type {array_type}")
@@ -585,23 +576,23 @@ class ASTSemanticAnalyzer:
 
     def visit_IfStatement(self, node):
         
-        condition_type = self.visit(node.condition)
+        condition_type = yield node.condition
         
         if condition_type != "BOOLEAN":
             self.error(f"Condition in if statement must be of boolean type, got {condition_type}")
         
         
-        self.visit(node.then_branch)
+        yield node.then_branch
         
         
         if hasattr(node, "else_branch") and node.else_branch:
-            self.visit(node.else_branch)
+            yield node.else_branch
         
         return None
 
     def visit_WhileStatement(self, node):
         
-        condition_type = self.visit(node.condition)
+        condition_type = yield node.condition
         
         if condition_type != "BOOLEAN":
             self.error(f"Condition in while statement must be of boolean type, got {condition_type}")
@@ -610,7 +601,7 @@ class ASTSemanticAnalyzer:
         self.loop_level += 1
         
         
-        self.visit(node.body)
+        yield node.body
         
         
         self.loop_level -= 1
@@ -622,10 +613,10 @@ class ASTSemanticAnalyzer:
         self.loop_level += 1
         
         
-        self.visit(node.body)
+        yield node.body
         
         
-        condition_type = self.visit(node.condition)
+        condition_type = yield node.condition
         
         if condition_type != "BOOLEAN":
             self.error(f"Condition in repeat statement must be of boolean type, got {condition_type}")
@@ -637,7 +628,7 @@ class ASTSemanticAnalyzer:
 
     def visit_ForStatement(self, node):
         
-        self.visit(node.init)
+        yield node.init
         
         
         if isinstance(node.init, Assignment) and isinstance(node.init.target, Identifier):
@@ -647,7 +638,7 @@ class ASTSemanticAnalyzer:
                 self.error(f"For loop control variable must be of integer type, got {control_var.type_name}")
         
         
-        limit_type = self.visit(node.limit)
+        limit_type = yield node.limit
         if limit_type != "INTEGER" and limit_type != "NUMBER":
             self.error(f"For loop limit must be of integer type, got {limit_type}")
         
@@ -655,7 +646,7 @@ class ASTSemanticAnalyzer:
         self.loop_level += 1
         
         
-        self.visit(node.body)
+        yield node.body
         
         
         self.loop_level -= 1
@@ -686,7 +677,7 @@ class ASTSemanticAnalyzer:
         if node.procedure_name.lower() in ["writeln", "write", "readln", "read"]:
             
             for param in node.params:
-                param_type = self.visit(param)
+                param_type = yield param
                 
                 
                 if node.procedure_name.lower() in ["readln", "read"]:
@@ -708,7 +699,7 @@ class ASTSemanticAnalyzer:
             
             
             for i, (param, arg) in enumerate(zip(proc_symbol.params, node.params)):
-                arg_type = self.visit(arg)
+                arg_type = yield arg
                 if not self.check_type_compatibility(param.type_name, arg_type):
                     self.error(f"Type mismatch in parameter {i+1} of procedure {node.procedure_name}: expected {param.type_name}, got {arg_type}")
         
@@ -723,7 +714,7 @@ class ASTSemanticAnalyzer:
         
         if hasattr(node, "params") and node.params:
             for param in node.params:
-                param_type = self.visit(param)
+                param_type = yield param
         return None
 
     def visit_ReadlnStatement(self, node):
@@ -742,7 +733,7 @@ class ASTSemanticAnalyzer:
                         symbol.is_initialized = True
                 elif isinstance(param, ArrayId):
                     
-                    element_type = self.visit(param)
+                    element_type = yield param
                     if element_type not in ["INTEGER", "REAL", "STRING"]:
                         self.error(f"Cannot read into array element of type {element_type}")
                 else:
@@ -762,24 +753,24 @@ class ASTSemanticAnalyzer:
 
     def visit_CaseStatement(self, node):
         
-        expr_type = self.visit(node.expression)
+        expr_type = yield node.expression
         
         
         for option in node.case_list:
-            value_type = self.visit(option.value)
+            value_type = yield option.value
             
             if not self.check_type_compatibility(expr_type, value_type):
                 self.error(f"Type mismatch in case option: expression is {expr_type}, but case value is {value_type}")
             
             
-            self.visit(option.statement)
+            yield option.statement
         
         return None
 
     def visit_BinaryOp(self, node):
         
-        left_type = self.visit(node.left)
-        right_type = self.visit(node.right)
+        left_type = yield node.left
+        right_type = yield node.right
         
         
         if (left_type, right_type) in self.operator_rules.get(node.operator, {}):
@@ -790,7 +781,7 @@ class ASTSemanticAnalyzer:
 
     def visit_UnaryOp(self, node):
         
-        operand_type = self.visit(node.operand)
+        operand_type = yield node.operand
         
         
         if operand_type in self.unary_operator_rules.get(node.operator, {}):
@@ -824,7 +815,7 @@ class ASTSemanticAnalyzer:
                 self.error(f"Function length expects 1 parameter, got {len(node.params)}")
                 return "INTEGER"
             
-            param_type = self.visit(node.params[0])
+            param_type = yield node.params[0]
             if param_type != "STRING":
                 self.error(f"Function length expects a STRING parameter, got {param_type}")
             
@@ -838,7 +829,7 @@ class ASTSemanticAnalyzer:
             
             
             for i, (param, arg) in enumerate(zip(func_symbol.params, node.params)):
-                arg_type = self.visit(arg)
+                arg_type = yield arg
                 if not self.check_type_compatibility(param.type_name, arg_type):
                     self.error(f"Type mismatch in parameter {i+1} of function {node.function_name}: expected {param.type_name}, got {arg_type}")
             
@@ -846,7 +837,7 @@ class ASTSemanticAnalyzer:
 
     def visit_LengthFunction(self, node):
         
-        expr_type = self.visit(node.expression)
+        expr_type = yield node.expression
         
         if expr_type != "STRING":
             self.error(f"Length function expects a STRING parameter, got {expr_type}")
@@ -855,10 +846,10 @@ class ASTSemanticAnalyzer:
 
     def visit_CaseOption(self, node):
         
-        value_type = self.visit(node.value)
+        value_type = yield node.value
         
         
-        self.visit(node.statement)
+        yield node.statement
         
         return value_type
 
@@ -1,6 +1,8 @@
+import io
 import sys
 from pasAnalex import *
 from ASTNode import *
+from ASTDump import dump_ast
 from ply import yacc
 
 start = 'program'
@@ -42,12 +44,11 @@ def p_variable_declaration_list(t):
     """variable_declaration_list : variable_declaration_list variable_declaration
                                 | variable_declaration"""
     if len(t) == 3:
-        if isinstance(t[1], list):
-            t[0] = t[1] + [t[2]]
-        else:
-            t[0] = [t[1], t[2]]
+        t[1].append(t[2])
+        t[0] = t[1]
     else:
         t[0] = [t[1]]
+
 def p_variable_declaration(t):
     """variable_declaration : id_list COLON type SEMICOLON"""
     t[0] = VarDeclaration(t[1], t[3])
@@ -55,31 +56,25 @@ def p_variable_declaration(t):
 def p_id_list(t):
     """id_list : ID
                | ID LBRACKET expression RBRACKET 
-               | ID COMMA id_list
-               | ID LBRACKET expression RBRACKET COMMA id_list"""
+               | id_list COMMA ID
+               | id_list COMMA ID LBRACKET expression RBRACKET"""
     if len(t) == 2:
         t[0] = [Identifier(t[1])]
     elif len(t) == 5:
         t[0] = [ArrayId(t[1], t[3])]
     elif len(t) == 4:
-        if isinstance(t[3], list):
-            t[0] = [Identifier(t[1])] + t[3]
-        else:
-            t[0] = [Identifier(t[1]), t[3]]
+        t[1].append(Identifier(t[3]))
+        t[0] = t[1]
     else:  # len(t) == 7
-        if isinstance(t[6], list):
-            t[0] = [ArrayId(t[1], t[3])] + t[6]
-        else:
-            t[0] = [ArrayId(t[1], t[3]), t[6]]
+        t[1].append(ArrayId(t[3], t[5]))
+        t[0] = t[1]
 
 def p_procedure_or_function(t):
-    """procedure_or_function : proc_or_func_declaration SEMICOLON procedure_or_function
+    """procedure_or_function : procedure_or_function proc_or_func_declaration SEMICOLON
                             | """
     if len(t) > 1:
-        if isinstance(t[3], list):
-            t[0] = [t[1]] + t[3]
-        else:
-            t[0] = [t[1], t[3]] if t[3] else [t[1]]
+        t[1].append(t[2])
+        t[0] = t[1]
     else:
         t[0] = []
 
@@ -117,13 +112,11 @@ def p_function_heading(t):
         t[0] = FunctionHeading(t[2], t[7], t[4])
 
 def p_parameter_list(t):
-    """parameter_list : parameter COMMA parameter_list
+    """parameter_list : parameter_list COMMA parameter
                      | parameter"""
     if len(t) == 4:
-        if isinstance(t[3], list):
-            t[0] = [t[1]] + t[3]
-        else:
-            t[0] = [t[1], t[3]]
+        t[1].append(t[3])
+        t[0] = t[1]
     else:
         t[0] = [t[1]]
 
@@ -156,16 +149,16 @@ def p_statement_part(t):
     t[0] = StatementPart(t[2])
 
 def p_statement_sequence(t):
-    """statement_sequence : statement SEMICOLON statement_sequence
+    """statement_sequence : statement_sequence SEMICOLON statement
                          | statement"""
     if len(t) == 4:
-        if isinstance(t[3], StatementSequence):
-            t[3].statements.insert(0, t[1])
-            t[0] = t[3]
-        else:
-            t[0] = StatementSequence([t[1], t[3]])
+        # Instruções vazias (ex.: ';' antes de 'end') não entram na sequência
+        if t[3] != []:
+            t[1].statements.append(t[3])
+        t[0] = t[1]
     else:
         t[0] = StatementSequence(t[1])
+
 def p_statement(t):
     """statement : assignment_statement
                 | statement_part
@@ -180,43 +173,50 @@ def p_statement(t):
                 | continue_statement
                 | case_statement
                 | """
-    if len(t) > 1:
+    if len(t) > 1 and isinstance(t[1], Identifier):
+        # `Proc;` sem parênteses: chamada sem argumentos
+        t[0] = ProcedureCall(t[1].name)
+    elif len(t) > 1:
         t[0] = t[1]
     else:
         t[0] = []
 
 def p_case_statement(t):
     """case_statement : CASE expression OF case_list END"""
-    print(f"Case statement: CASE {t[2]} OF {t[4]} END")
     t[0] = CaseStatement(t[2], t[4])
 
 def p_case_list(t):
-    """case_list : case_option SEMICOLON case_list
+    """case_list : case_list case_option SEMICOLON
                  | case_option SEMICOLON"""
     if len(t) == 4:
-        if isinstance(t[3], list):
-            t[0] = [t[1]] + t[3]
-        else:
-            t[0] = [t[1], t[3]]
+        t[1].append(t[2])
+        t[0] = t[1]
     else:
         t[0] = [t[1]]
 
 
+# Tipo do token -> tipo do Literal; o valor já vem tipado do lexer (int/float, bool)
+# e as frases perdem as plicas
+LITERAL_TYPES = {'NUMBER': 'NUMBER', 'BOOL': 'BOOLEAN', 'PHRASE': 'PHRASE'}
+
+def literal(token_type, value):
+    if token_type == 'PHRASE':
+        value = value[1:-1]
+    return Literal(value, LITERAL_TYPES[token_type])
+
+
 def p_case_option(t):
     """case_option : NUMBER COLON statement
                   | BOOL COLON statement
                   | PHRASE COLON statement
                   | ID COLON statement"""
 
-    if t[1].type == 'NUMBER':
-        value = Literal(t[1], 'NUMBER')
-    elif t[1].type == 'BOOL':
-        value = Literal(t[1], 'BOOL')
-    elif t[1].type == 'PHRASE':
-        value = Literal(t[1], 'PHRASE')
-    else:  # ID
+    token_type = t.slice[1].type
+    if token_type == 'ID':
         value = Identifier(t[1])
-    
+    else:
+        value = literal(token_type, t[1])
+
     t[0] = CaseOption(value, t[3])
 def p_writeln_statement(t):
     """writeln_statement : WRITELN LPAREN param_list RPAREN
@@ -265,10 +265,8 @@ def p_param_list(t):
     """param_list : param_list COMMA param
                   | param"""
     if len(t) == 4:
-        if isinstance(t[1], list):
-            t[0] = t[1] + [t[3]]
-        else:
-            t[0] = [t[1], t[3]]
+        t[1].append(t[3])
+        t[0] = t[1]
     else:
         t[0] = [t[1]]
 
@@ -333,12 +331,12 @@ def p_expression_s(t):
 def p_and_or(t):
     """and_or : AND
               | OR"""
-    t[0] = t[1]
+    t[0] = Operator.from_source(t[1])
 
 def p_psign(t):
     """psign : TIMES
              | DIVIDE"""
-    t[0] = t[1]
+    t[0] = Operator.from_source(t[1])
 
 def p_sign(t):
     """sign : PLUS
@@ -351,7 +349,7 @@ def p_sign(t):
             | LESSEQUAL
             | GREATERTHAN
             | GREATEREQUAL"""
-    t[0] = t[1]
+    t[0] = Operator.from_source(t[1])
 
 def p_length_function(t):
     """length_function : LENGTH LPAREN expression RPAREN"""
@@ -369,18 +367,15 @@ def p_element(t):
                | procedure_or_function_call"""
 
     if len(t) == 2:
+        token_type = t.slice[1].type
         if isinstance(t[1], ASTNode):
             t[0] = t[1]
-        elif isinstance(t[1], bool):
-            t[0] = Literal(t[1], 'BOOLEAN')
-        elif isinstance(t[1], (int, float)):
-            t[0] = Literal(t[1], 'NUMBER')
-        elif isinstance(t[1], str) and (t[1].startswith('"') or t[1].startswith("'")):
-            t[0] = Literal(t[1], 'PHRASE')
-        else:
+        elif token_type == 'ID':
             t[0] = Identifier(t[1])
+        else:
+            t[0] = literal(token_type, t[1])
     elif len(t) == 3:
-        t[0] = UnaryOp('NOT', t[2])
+        t[0] = UnaryOp(Operator.NOT, t[2])
     elif len(t) == 4:
         t[0] = t[2]  
     elif len(t) == 5:
@@ -397,39 +392,17 @@ def p_error(t):
     else:
         print("Syntax error at EOF")
 
-parser = yacc.yacc(debug=True)
-
-def print_ast(node, indent=0):
-    if node is None:
-        return "None"
-    
-    indent_str = "  " * indent
-    
-    if isinstance(node, list):
-        result = "[\n"
-        for item in node:
-            result += f"{indent_str}  {print_ast(item, indent + 1)},\n"
-        result += f"{indent_str}]"
-        return result
-    
-    if not isinstance(node, ASTNode):
-        return str(node)
-    
-    class_name = node.__class__.__name__
-    
-    attrs = []
-    for attr_name in node.__dict__:
-        if attr_name.startswith('_') or callable(getattr(node, attr_name)):
-            continue
-        
-        attr_value = getattr(node, attr_name)
-        attrs.append(f"{attr_name}={print_ast(attr_value, indent + 1)}")
-    
-    if attrs:
-        attrs_str = ",\n".join(f"{indent_str}  {attr}" for attr in attrs)
-        return f"{class_name}(\n{attrs_str}\n{indent_str})"
-    else:
-        return f"{class_name}()"
+def build_parser():
+    # O PLY só usa parsetab.py se a assinatura da gramática coincidir; em tempo de execução
+    # nunca escreve parsetab.py nem parser.out (ver build_tables.py)
+    return yacc.yacc(module=sys.modules[__name__], debug=False, write_tables=False)
+
+parser = build_parser()
+
+def print_ast(node):
+    out = io.StringIO()
+    dump_ast(node, out)
+    return out.getvalue()
 
 
 def main():
@@ -0,0 +1,24 @@
+program Classifica;
+var
+    i, x, baixos, medios, altos: integer;
+begin
+    baixos := 0;
+    medios := 0;
+    altos := 0;
+    i := 0;
+    while i < 30 do
+    begin
+        i := i + 1;
+        x := (i * 7) mod 11;
+        if x < 3 then
+            baixos := baixos + 1
+        else
+            if x < 7 then
+                medios := medios + 1
+            else
+                altos := altos + 1
+    end;
+    writeln('Baixos: ', baixos);
+    writeln('Medios: ', medios);
+    writeln('Altos: ', altos)
+end.
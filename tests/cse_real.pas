@@ -0,0 +1,11 @@
+program CseReal;
+var
+    a, b, c: integer;
+    r: real;
+begin
+    readln(a);
+    readln(b);
+    r := a * b;
+    c := ((a * b) div b) + ((a * b) mod 7);
+    writeln(c);
+end.
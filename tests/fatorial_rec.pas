@@ -0,0 +1,20 @@
+program FatorialRecursivo;
+
+function Fatorial(n: integer): integer;
+begin
+    if n = 0 then
+        Fatorial := 1
+    else
+        Fatorial := n * Fatorial(n - 1);
+end;
+
+var
+    n, resultado: integer;
+begin
+    writeln('Introduza um número inteiro positivo:');
+    readln(n);
+
+    resultado := Fatorial(n);
+
+    writeln('Fatorial: ', resultado);
+end.
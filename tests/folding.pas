@@ -0,0 +1,21 @@
+program Folding;
+var
+    a, b, c, d: integer;
+begin
+    a := 17 DIV 5;
+    b := 17 mod 5;
+    c := (2 + 3) * 4 div 2;
+    d := a * 1 + 0;
+    if not False then
+        writeln('a = ', a);
+    if TRUE or (b = 0) then
+        writeln('b = ', b);
+    while false do
+        a := a + 1;
+    if (10 mod 3 = 1) and (7 div 2 = 3) then
+        writeln('c = ', c);
+    if (a <> 3) Or false then
+        writeln('nunca')
+    else
+        writeln('d = ', d);
+end.
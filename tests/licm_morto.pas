@@ -0,0 +1,20 @@
+program LicmMorto;
+var
+    i, n, a, b, s: integer;
+    p: boolean;
+begin
+    readln(n);
+    readln(a);
+    readln(b);
+    s := 0;
+    p := a > b;
+    i := 0;
+    while i < n do
+    begin
+        if a > b then
+            s := s + 1;
+        i := i + 1
+    end;
+    writeln(s);
+    writeln(p)
+end.
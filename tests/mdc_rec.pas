@@ -0,0 +1,21 @@
+program MaximoDivisorComum;
+
+function MDC(a: integer, b: integer): integer;
+begin
+    if b = 0 then
+        MDC := a
+    else
+        MDC := MDC(b, a mod b);
+end;
+
+var
+    x, y, resultado: integer;
+begin
+    writeln('Introduza dois números inteiros:');
+    readln(x);
+    readln(y);
+
+    resultado := MDC(x, y);
+
+    writeln('MDC: ', resultado);
+end.
@@ -0,0 +1,9 @@
+program SomaQuadrados;
+var
+    i, soma: integer;
+begin
+    soma := 0;
+    for i := 1 to 50 do
+        soma := soma + i * i;
+    writeln('Soma dos quadrados de 1 a 50: ', soma);
+end.
@@ -0,0 +1,15 @@
+program Reais;
+var
+    a: integer;
+    b: real;
+begin
+    writeln('Introduza um número inteiro:');
+    readln(a);
+    b := a * 2.5;
+    if a * 2.5 > 10 then
+        writeln('a * 2.5 é maior que 10')
+    else
+        writeln('a * 2.5 não é maior que 10');
+    if 0.5 * a < 3 then
+        writeln('a / 2 é menor que 3');
+end.
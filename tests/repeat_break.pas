@@ -0,0 +1,30 @@
+program RepeatBreak;
+var
+    i, j, n: integer;
+begin
+    n := 0;
+    for i := 1 to 3 do
+    begin
+        repeat
+        begin
+            n := n + 1;
+            if n > 100 then
+                continue;
+            break;
+        end
+        until true;
+        j := 0;
+        while j < 2 do
+        begin
+            j := j + 1;
+            repeat
+            begin
+                n := n + 10;
+                break;
+            end
+            until false;
+        end;
+        n := n + 100;
+    end;
+    writeln('n = ', n);
+end.
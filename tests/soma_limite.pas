@@ -0,0 +1,19 @@
+program SomaLimite;
+
+function Soma(n: integer, s: integer): integer;
+begin
+    if (n = 0) or (s > 1000) then
+        Soma := s
+    else
+        Soma := Soma(n - 1, s + n);
+end;
+
+var
+    n, resultado: integer;
+begin
+    readln(n);
+
+    resultado := Soma(n, 0);
+
+    writeln('Soma: ', resultado);
+end.
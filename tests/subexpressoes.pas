@@ -0,0 +1,20 @@
+program Subexpressoes;
+var
+    a, b, c, d, e, i, soma: integer;
+begin
+    writeln('Introduza dois números inteiros:');
+    readln(a);
+    readln(b);
+    c := (a + b) * (a - b);
+    d := (a + b) * 2 + (a - b);
+    e := ((a * b) mod 7) + ((a * b) div 7);
+    if (a + b) > (a * b) then
+        writeln('a + b é maior que a * b');
+    soma := 0;
+    for i := 1 to a do
+        soma := soma + (i * i) + ((i * i) mod 3);
+    writeln('c = ', c);
+    writeln('d = ', d);
+    writeln('e = ', e);
+    writeln('soma = ', soma);
+end.